@@ -0,0 +1,64 @@
+"""Benchmark memory tier hit ratio under scans, with and without admission.
+
+Replays a workload where a skewed hot set is read over and over while scans
+of cold, never repeated keys (such as a history query walking old leagues)
+pass through the same tier. Compare plain LRU with TinyLFU admission.
+
+Usage:
+    python -m benchmarks.bench_cache_admission [--requests 100000] [--no-admission]
+"""
+
+import argparse
+import random
+from unittest.mock import Mock
+
+from src.services.cache import CacheEntry, FrequencySketch, MemoryCache
+
+CAPACITY = 256
+HOT_KEYS = 2000
+SCAN_LENGTH = 500
+SCAN_PROBABILITY = 0.002  # Chance that a request starts a scan
+
+
+def run(requests: int, admission: bool) -> None:
+    rng = random.Random(0)
+    entry = Mock(spec=CacheEntry)
+    sketch = FrequencySketch(CAPACITY) if admission else None
+    memory = MemoryCache(max_entries=CAPACITY, max_size=1 << 30, sketch=sketch)
+
+    hot_hits = hot_requests = 0
+    scanned = 0
+    for _ in range(requests):
+        if rng.random() < SCAN_PROBABILITY:
+            for _ in range(SCAN_LENGTH):
+                key = f"cold-{scanned}"
+                scanned += 1
+                if sketch is not None:
+                    sketch.increment(key)
+                memory.get(key) or memory.set(key, entry, 1)
+
+        key = f"hot-{int(rng.paretovariate(1.2)) % HOT_KEYS}"
+        if sketch is not None:
+            sketch.increment(key)
+        hot_requests += 1
+        if memory.get(key) is not None:
+            hot_hits += 1
+        else:
+            memory.set(key, entry, 1)
+
+    print(f"admission:       {'tinylfu' if admission else 'none (lru)'}")
+    print(f"hot requests:    {hot_requests}, cold scanned: {scanned}")
+    print(f"hot hit ratio:   {hot_hits / hot_requests:.3f}")
+    print(f"rejected:        {memory.rejected}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100000)
+    parser.add_argument("--no-admission", action="store_true")
+    args = parser.parse_args()
+    run(args.requests, not args.no_admission)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark event loop lag caused by disk cache I/O.
+
+Runs a mix of cache writes and disk reads (the memory tier is disabled) while
+a ticker coroutine measures how late it is woken up. Compare inline disk I/O
+with the thread pool used by default.
+
+Usage:
+    python -m benchmarks.bench_cache_loop_lag [--requests 2000] [--io-workers 4]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+from httpx import Request, Response
+
+from src.services.cache import APICache
+
+TICK = 0.001
+BODY = json.dumps({str(i): {"player_id": str(i)} for i in range(500)}).encode()
+
+
+async def ticker(lags: List[float], stop: asyncio.Event) -> None:
+    """Record how late each periodic wake-up is."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def workload(cache: APICache, requests: int) -> None:
+    """Write responses and read them back from disk."""
+    for i in range(requests):
+        request = Request("GET", f"https://api.sleeper.app/v1/league/{i % 200}")
+        if i < 200:
+            response = Response(
+                200,
+                headers={"Cache-Control": "max-age=3600"},
+                content=BODY,
+                request=request,
+            )
+            cache.set(request, response)
+        else:
+            await cache.get(request)
+        await asyncio.sleep(0)
+
+
+async def run(requests: int, io_workers: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        cache = APICache(
+            cache_dir=Path(directory),
+            memory_max_entries=0,
+            io_workers=io_workers,
+        )
+        lags: List[float] = []
+        stop = asyncio.Event()
+        tick = asyncio.create_task(ticker(lags, stop))
+
+        start = time.perf_counter()
+        await workload(cache, requests)
+        await cache.drain()
+        elapsed = time.perf_counter() - start
+
+        stop.set()
+        await tick
+        cache.close()
+
+    lags.sort()
+    print(f"io workers:      {io_workers}")
+    print(f"requests:        {requests} in {elapsed:.2f}s")
+    print(f"loop lag p50:    {statistics.median(lags) * 1000:.2f} ms")
+    print(f"loop lag p99:    {lags[int(len(lags) * 0.99)] * 1000:.2f} ms")
+    print(f"loop lag max:    {lags[-1] * 1000:.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--io-workers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.io_workers))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark the MCP handler serialization pipeline.
+
+Measures the time and peak traced memory of EnhancedMCPHandler.execute_function
+for list results, using an in-process client so that no network I/O is involved.
+
+Usage:
+    python -m benchmarks.bench_mcp_handler [--players 2000] [--rounds 50]
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+from typing import List
+
+from src.mcp import MCPHandler, MCPInvocation, MCPResponseStatus
+from src.models import Player
+
+POSITIONS = ["QB", "RB", "WR", "TE", "K", "DEF"]
+
+
+class StaticClient:
+    """Client stub returning prebuilt models."""
+
+    def __init__(self, players: int):
+        self.players = [
+            Player(
+                player_id=str(i),
+                full_name=f"Player {i}",
+                position=POSITIONS[i % len(POSITIONS)],
+                team="KC",
+                number=i % 100,
+                status="Active",
+            )
+            for i in range(players)
+        ]
+
+    async def search_players(self, **kwargs) -> List[Player]:
+        return self.players
+
+
+async def run(players: int, rounds: int) -> None:
+    handler = MCPHandler(StaticClient(players))
+    invocation = MCPInvocation(function_name="search_players", parameters={"team": "KC"})
+
+    # Warm up fragment caches and code paths
+    response = await handler.execute_function(invocation)
+    assert response.status == MCPResponseStatus.SUCCESS
+
+    tracemalloc.start()
+    peaks = []
+    start = time.perf_counter()
+    for _ in range(rounds):
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        await handler.execute_function(invocation)
+        _, peak = tracemalloc.get_traced_memory()
+        peaks.append(peak - baseline)
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+
+    print(f"players per invocation: {players}")
+    print(f"time per invocation:    {elapsed / rounds * 1000:.2f} ms (traced)")
+    print(f"peak bytes per invoke:  {sum(peaks) // len(peaks):,}")
+    print(f"peak bytes per item:    {sum(peaks) // len(peaks) // players:,}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(run(args.players, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
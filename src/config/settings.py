@@ -6,10 +6,11 @@ This module handles all configuration settings for the application, including:
 - Rate limiting parameters
 - Caching configuration
 """
+import warnings
 from functools import lru_cache
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, model_validator
 
 
 class SleeperAPIConfig(BaseModel):
@@ -23,10 +24,70 @@ class SleeperAPIConfig(BaseModel):
         default=1000,
         description="Maximum number of requests allowed per minute",
     )
+    rate_limit_burst: int = Field(
+        default=50,
+        description="Maximum number of requests that may be sent back to back",
+    )
+    rate_limit_max_wait_seconds: float = Field(
+        default=10.0,
+        description="Maximum time a request waits for rate limit capacity",
+    )
     timeout_seconds: float = Field(
         default=30.0,
         description="Timeout for API requests in seconds",
     )
+    max_connections: int = Field(
+        default=100,
+        description="Maximum number of concurrent connections to the Sleeper API",
+    )
+    max_keepalive_connections: int = Field(
+        default=20,
+        description="Maximum number of idle connections kept open for reuse",
+    )
+    keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        description="Seconds an idle connection is kept open for reuse",
+    )
+    http2: bool = Field(
+        default=False,
+        description=(
+            "Multiplex requests over HTTP/2; requires the h2 package "
+            "(pip install 'httpx[http2]')"
+        ),
+    )
+    prewarm_connections: int = Field(
+        default=2,
+        description=(
+            "Connections to open at startup before serving requests (0 disables)"
+        ),
+    )
+    prewarm_timeout_seconds: float = Field(
+        default=3.0,
+        description="Maximum time startup waits for connections to be prewarmed",
+    )
+
+
+class CachePolicy(BaseModel):
+    """Caching policy for the endpoints matching a route pattern."""
+
+    ttl_seconds: Optional[int] = Field(
+        default=None,
+        description=(
+            "Freshness lifetime in seconds when the response sets none "
+            "(default: the cache-wide TTL)"
+        ),
+    )
+    stale_while_revalidate_seconds: Optional[int] = Field(
+        default=None,
+        description=(
+            "Seconds an expired response may be served while it is refreshed "
+            "(default: the cache-wide window)"
+        ),
+    )
+    cacheable: bool = Field(
+        default=True,
+        description="Whether responses from the endpoint are cached at all",
+    )
 
 
 class CacheConfig(BaseModel):
@@ -36,9 +97,175 @@ class CacheConfig(BaseModel):
         default=300,
         description="Time to live for cached items in seconds",
     )
-    max_size: int = Field(
+    negative_ttl_seconds: int = Field(
+        default=60,
+        description=(
+            "Seconds a not-found result (404 or null body) is cached; "
+            "0 disables negative caching"
+        ),
+    )
+    max_entries: int = Field(
         default=1000,
-        description="Maximum number of items in the cache",
+        description="Maximum number of responses in the disk cache",
+    )
+    max_size_bytes: int = Field(
+        default=512 * 1024 * 1024,
+        description="Maximum size of the disk cache in bytes",
+    )
+    memory_max_entries: int = Field(
+        default=512,
+        description="Maximum number of responses held in the in-memory cache tier",
+    )
+    memory_max_size_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        description="Maximum size of the in-memory cache tier in bytes",
+    )
+    pinned_max_size_bytes: int = Field(
+        default=256 * 1024 * 1024,
+        description=(
+            "Maximum size in bytes of the pinned tier holding responses of "
+            "archived leagues, which never expire"
+        ),
+    )
+    compression: str = Field(
+        default="auto",
+        description=(
+            "Compression of cached bodies on disk: zstd, zlib, auto (zstd if "
+            "the zstandard package is installed, else zlib) or none"
+        ),
+    )
+    compression_level: Optional[int] = Field(
+        default=None,
+        description="Compression level (default: the method's default)",
+    )
+    compression_min_size_bytes: int = Field(
+        default=1024,
+        description="Smallest body size in bytes that is compressed on disk",
+    )
+    io_workers: int = Field(
+        default=4,
+        description=(
+            "Threads performing disk cache I/O off the event loop; 0 performs "
+            "it inline"
+        ),
+    )
+    stale_while_revalidate_seconds: int = Field(
+        default=60,
+        description=(
+            "Seconds an expired response may be served while it is refreshed "
+            "in the background"
+        ),
+    )
+    policies: Dict[str, CachePolicy] = Field(
+        default_factory=lambda: {
+            "/state/nfl": CachePolicy(
+                ttl_seconds=3600, stale_while_revalidate_seconds=3600
+            ),
+            "/players/*/trending/*": CachePolicy(ttl_seconds=600),
+            "/players/*": CachePolicy(
+                ttl_seconds=86400, stale_while_revalidate_seconds=3600
+            ),
+            "/league/*/matchups/*": CachePolicy(ttl_seconds=60),
+            "/league/*/transactions/*": CachePolicy(ttl_seconds=120),
+            "/league/*/rosters": CachePolicy(ttl_seconds=180),
+            "/league/*/users": CachePolicy(ttl_seconds=900),
+            "/league/*": CachePolicy(ttl_seconds=900),
+            "/user/*/leagues/*/*": CachePolicy(ttl_seconds=900),
+            "/user/*": CachePolicy(ttl_seconds=3600),
+        },
+        description=(
+            "Per-endpoint caching policies keyed by route patterns matched "
+            "against the whole path below the API base URL, where a '*' "
+            "segment matches one path segment; the first match applies"
+        ),
+    )
+
+    @model_validator(mode="before")
+    @classmethod
+    def _read_deprecated_max_size(cls, data: Any) -> Any:
+        """Read the deprecated max_size setting, an entry count, as max_entries.
+        
+        Args:
+            data: Raw configuration values
+            
+        Returns:
+            Any: Configuration values with max_size mapped to max_entries
+        """
+        if isinstance(data, dict) and "max_size" in data:
+            warnings.warn(
+                "cache.max_size is deprecated; use cache.max_entries",
+                DeprecationWarning,
+                stacklevel=2,
+            )
+            data = dict(data)
+            max_size = data.pop("max_size")
+            data.setdefault("max_entries", max_size)
+        return data
+
+    @property
+    def max_size(self) -> int:
+        """Deprecated alias of max_entries."""
+        warnings.warn(
+            "cache.max_size is deprecated; use cache.max_entries",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return self.max_entries
+
+
+class PrefetchConfig(BaseModel):
+    """Configuration for background cache prefetching."""
+
+    enabled: Optional[bool] = Field(
+        default=None,
+        description=(
+            "Periodically prefetch NFL state and tracked leagues into the cache "
+            "(default: only when league_ids is set)"
+        ),
+    )
+    league_ids: List[str] = Field(
+        default_factory=list,
+        description="League IDs whose league, rosters and users are prefetched",
+    )
+    offseason_interval_seconds: float = Field(
+        default=6 * 60 * 60,
+        description="Seconds between prefetches in the offseason",
+    )
+    season_interval_seconds: float = Field(
+        default=30 * 60,
+        description="Seconds between prefetches during the preseason and season",
+    )
+    game_day_interval_seconds: float = Field(
+        default=150,
+        description=(
+            "Seconds between prefetches on game days; keep this below the roster "
+            "cache TTL so that entries are refreshed before they expire"
+        ),
+    )
+    game_days: List[int] = Field(
+        default_factory=lambda: [0, 3, 6],
+        description="Game days as weekday numbers (Monday is 0)",
+    )
+    timezone: str = Field(
+        default="America/New_York",
+        description="Timezone game days are evaluated in",
+    )
+
+
+class HealthConfig(BaseModel):
+    """Configuration for upstream health tracking."""
+
+    canary_interval_seconds: float = Field(
+        default=30.0,
+        description="Seconds between canary requests when upstream traffic is quiet",
+    )
+    window_size: int = Field(
+        default=20,
+        description="Number of recent upstream request outcomes to track",
+    )
+    failure_threshold: int = Field(
+        default=3,
+        description="Consecutive upstream failures before reporting unhealthy",
     )
 
 
@@ -61,6 +288,14 @@ class ServerConfig(BaseModel):
         default="development",
         description="Server environment (development/production)",
     )
+    batch_max_size: int = Field(
+        default=50,
+        description="Maximum number of invocations accepted in one batch request",
+    )
+    batch_max_concurrency: int = Field(
+        default=8,
+        description="Maximum number of batch invocations executed at once",
+    )
 
 
 class Config(BaseModel):
@@ -69,6 +304,8 @@ class Config(BaseModel):
     server: ServerConfig = Field(default_factory=ServerConfig)
     sleeper_api: SleeperAPIConfig = Field(default_factory=SleeperAPIConfig)
     cache: CacheConfig = Field(default_factory=CacheConfig)
+    prefetch: PrefetchConfig = Field(default_factory=PrefetchConfig)
+    health: HealthConfig = Field(default_factory=HealthConfig)
 
 
 @lru_cache()
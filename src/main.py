@@ -1,21 +1,32 @@
 """Main FastAPI application for the Sleeper MCP server."""
 
+import asyncio
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Dict
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from structlog import get_logger
 
 from src.config import get_config
 from src.mcp import (
+    MCPBatchInvocation,
+    MCPBatchResponse,
     MCPCapabilities,
     MCPHandler,
     MCPInvocation,
     MCPResponse,
     get_enhanced_functions,
 )
-from src.services import SleeperAPIClient
+from src.services import (
+    HealthCanary,
+    PrefetchScheduler,
+    acquire_shared_client,
+    release_shared_client,
+)
+from src.services.health import UNHEALTHY
+from src.sleeper_mcp.main import app as sleeper_mcp_app
 
 logger = get_logger(__name__)
 
@@ -29,14 +40,47 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """
     # Create API client and MCP handler
     config = get_config()
-    app.state.sleeper_client = SleeperAPIClient(config)
-    app.state.mcp_handler = MCPHandler(app.state.sleeper_client)
+    app.state.sleeper_client = acquire_shared_client(config)
+    app.state.mcp_handler = MCPHandler(
+        app.state.sleeper_client,
+        batch_concurrency=config.server.batch_max_concurrency,
+    )
     logger.info("application_startup", config=config.model_dump())
     
-    yield
+    # Pay connection setup before the first requests arrive, without letting
+    # an unreachable upstream hold up startup
+    try:
+        await asyncio.wait_for(
+            app.state.sleeper_client.prewarm(),
+            timeout=config.sleeper_api.prewarm_timeout_seconds,
+        )
+    except asyncio.TimeoutError:
+        logger.warning(
+            "prewarm_timed_out",
+            timeout=config.sleeper_api.prewarm_timeout_seconds,
+        )
+    
+    # Keep upstream health current while traffic is quiet
+    app.state.health_canary = HealthCanary(
+        app.state.sleeper_client,
+        interval=config.health.canary_interval_seconds,
+    )
+    app.state.health_canary.start()
+    
+    # Keep tracked leagues warm in the cache ahead of requests
+    app.state.prefetcher = PrefetchScheduler(app.state.sleeper_client, config.prefetch)
+    if app.state.prefetcher.enabled:
+        app.state.prefetcher.start()
+    
+    # Mounted apps get no lifespan events of their own; run the sleeper_mcp
+    # lifespan here so that it attaches to the client acquired above
+    async with sleeper_mcp_app.router.lifespan_context(sleeper_mcp_app):
+        yield
     
     # Cleanup
-    await app.state.sleeper_client.close()
+    await app.state.prefetcher.stop()
+    await app.state.health_canary.stop()
+    await release_shared_client()
     logger.info("application_shutdown")
 
 
@@ -50,6 +94,10 @@ app = FastAPI(
     lifespan=lifespan,
 )
 
+# Serve the sleeper_mcp REST API from the same process, sharing one cache,
+# connection pool and rate-limit budget with the MCP endpoints
+app.mount("/sleeper", sleeper_mcp_app)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -61,25 +109,66 @@ app.add_middleware(
 
 
 @app.get("/health")
-async def health_check() -> dict:
+async def health_check() -> Dict[str, Any]:
     """Check application health.
     
+    Answers from the upstream outcomes recorded by the API client, so probes
+    neither wait on nor spend rate limit budget on the Sleeper API.
+    
     Returns:
-        dict: Health check response with API connectivity status
+        Dict[str, Any]: Health check response with API connectivity status
     """
-    try:
-        # Test API connection
-        await app.state.sleeper_client.get_nfl_state()
+    client = getattr(app.state, "sleeper_client", None)
+    if client is None:
         return {
-            "status": "healthy",
-            "message": "Application is running and can connect to Sleeper API",
+            "status": "unhealthy",
+            "message": "Health check failed: Sleeper API client is not started",
         }
-    except Exception as e:
-        logger.error("health_check_failed", error=str(e))
+    health = client.health
+    if health.status == UNHEALTHY:
         return {
             "status": "unhealthy",
-            "message": f"Health check failed: {str(e)}",
+            "message": f"Health check failed: {health.last_error}",
         }
+    return {
+        "status": "healthy",
+        "message": "Application is running and can connect to Sleeper API",
+    }
+
+
+@app.get("/health/live")
+async def liveness_check() -> Dict[str, Any]:
+    """Check that the application is running.
+    
+    Returns:
+        Dict[str, Any]: Liveness response
+    """
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness_check(response: Response) -> Dict[str, Any]:
+    """Check that the application can serve requests.
+    
+    The application is ready unless recent upstream requests have failed
+    repeatedly, in which case the probe answers with 503.
+    
+    Args:
+        response: Outgoing response, used to set the status code
+        
+    Returns:
+        Dict[str, Any]: Readiness response with upstream health statistics
+    """
+    client = getattr(app.state, "sleeper_client", None)
+    if client is None:
+        response.status_code = 503
+        return {"status": "starting"}
+    
+    upstream = client.health.get_stats()
+    ready = upstream["status"] != UNHEALTHY
+    if not ready:
+        response.status_code = 503
+    return {"status": "ready" if ready else "unavailable", "upstream": upstream}
 
 
 @app.get("/capabilities", response_model=MCPCapabilities)
@@ -109,3 +198,43 @@ async def invoke_function(invocation: MCPInvocation) -> MCPResponse:
         football context and insights
     """
     return await app.state.mcp_handler.execute_function(invocation)
+
+
+@app.post("/invoke/stream")
+async def invoke_function_stream(invocation: MCPInvocation) -> StreamingResponse:
+    """Invoke an MCP function and stream its result as JSON lines.
+    
+    Args:
+        invocation: Function invocation request
+        
+    Returns:
+        StreamingResponse: Newline-delimited JSON with one line per result
+        item, followed by a status line
+    """
+    return StreamingResponse(
+        app.state.mcp_handler.stream_function(invocation),
+        media_type="application/x-ndjson",
+    )
+
+
+@app.post("/invoke/batch", response_model=MCPBatchResponse)
+async def invoke_batch(batch: MCPBatchInvocation) -> MCPBatchResponse:
+    """Invoke several MCP functions concurrently in one round trip.
+    
+    Args:
+        batch: Function invocation requests
+        
+    Returns:
+        MCPBatchResponse: Per-invocation results in request order
+        
+    Raises:
+        HTTPException: If the batch exceeds the configured maximum size
+    """
+    max_size = get_config().server.batch_max_size
+    if len(batch.invocations) > max_size:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch exceeds the maximum of {max_size} invocations",
+        )
+    handler: MCPHandler = app.state.mcp_handler
+    return await handler.execute_batch(batch)
@@ -3,6 +3,8 @@
 from .functions import SLEEPER_FUNCTIONS, get_mcp_capabilities
 from .handler import EnhancedMCPHandler as MCPHandler, get_enhanced_functions
 from .models import (
+    MCPBatchInvocation,
+    MCPBatchResponse,
     MCPCapabilities,
     MCPFunction,
     MCPFunctionParameter,
@@ -12,6 +14,8 @@ from .models import (
 )
 
 __all__ = [
+    "MCPBatchInvocation",
+    "MCPBatchResponse",
     "MCPCapabilities",
     "MCPFunction",
     "MCPFunctionParameter",
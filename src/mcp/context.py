@@ -4,13 +4,139 @@ This module provides additional context about fantasy football concepts and data
 to help Goose better understand and interact with the domain.
 """
 
-from typing import Any, Dict, List, Optional
+import json
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    NoReturn,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel, ConfigDict
+
+T = TypeVar("T")
+
+
+class FrozenDict(Dict[str, Any]):
+    """Read-only dict that still serializes like a plain dict."""
+
+    @staticmethod
+    def _readonly() -> NoReturn:
+        raise TypeError("Context fragments are read-only")
+
+    def __setitem__(self, key: str, value: Any) -> NoReturn:
+        self._readonly()
+
+    def __delitem__(self, key: str) -> NoReturn:
+        self._readonly()
+
+    # Overridden together with __ior__, which must match its signature;
+    # like dict's, the union is a new, mutable dict
+    def __or__(self, other: Any) -> Any:
+        return dict(self) | other
+
+    def __ior__(self, other: Any) -> Any:
+        self._readonly()
+
+    def clear(self) -> NoReturn:
+        self._readonly()
+
+    def pop(self, *args: Any) -> NoReturn:
+        self._readonly()
+
+    def popitem(self) -> NoReturn:
+        self._readonly()
+
+    def setdefault(self, *args: Any) -> NoReturn:
+        self._readonly()
+
+    def update(self, *args: Any, **kwargs: Any) -> NoReturn:
+        self._readonly()
+
+    def __reduce__(self) -> Tuple[Type["FrozenDict"], Tuple[Dict[str, Any]]]:
+        return (type(self), (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists into read-only equivalents.
+    
+    Args:
+        value: JSON-compatible value
+        
+    Returns:
+        Any: Value built from FrozenDicts and tuples
+    """
+    if isinstance(value, dict):
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+class ContextFragment(NamedTuple):
+    """Pre-serialized context ready to be spliced into responses."""
+
+    data: FrozenDict
+    json: bytes
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> "ContextFragment":
+        """Serialize a context model once.
+        
+        Args:
+            model: Context model
+            
+        Returns:
+            ContextFragment: Frozen dict and compact JSON forms of the model
+        """
+        data = model.model_dump(mode="json")
+        return cls(
+            data=freeze(data),
+            json=json.dumps(data, separators=(",", ":")).encode(),
+        )
+
+
+class CaseInsensitiveMap(Dict[str, T]):
+    """Mapping from keys to values that ignores the case of lookups.
+    
+    Common spellings of each key (as given, lower, upper and title case) are
+    stored directly, so typical lookups need no string conversion.
+    """
+
+    def __init__(self, mapping: Dict[str, T]):
+        super().__init__()
+        for key, value in mapping.items():
+            for variant in (key, key.lower(), key.upper(), key.title()):
+                self.setdefault(variant, value)
+
+    def lookup(self, key: str) -> Optional[T]:
+        """Look up a key regardless of its case.
+        
+        Args:
+            key: Key in any case
+            
+        Returns:
+            Optional[T]: Value if found
+        """
+        value = self.get(key)
+        if value is None:
+            value = self.get(key.lower())
+            if value is None:
+                value = self.get(key.upper())
+        return value
 
-from pydantic import BaseModel
 
 class FantasyPosition(BaseModel):
     """Information about a fantasy football position."""
     
+    model_config = ConfigDict(frozen=True)
+
     code: str
     name: str
     description: str
@@ -20,6 +146,8 @@ class FantasyPosition(BaseModel):
 class ScoringRule(BaseModel):
     """Definition of a fantasy football scoring rule."""
     
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     points: float
@@ -29,6 +157,8 @@ class ScoringRule(BaseModel):
 class LeagueType(BaseModel):
     """Information about different types of fantasy leagues."""
     
+    model_config = ConfigDict(frozen=True)
+
     name: str
     description: str
     typical_settings: Dict[str, Any]
@@ -43,6 +173,31 @@ class FantasyFootballContext:
         self.scoring_rules = self._init_scoring_rules()
         self.league_types = self._init_league_types()
 
+        # Case-insensitive lookups and pre-serialized fragments, built once
+        self._positions = CaseInsensitiveMap(self.positions)
+        self._scoring_rules = CaseInsensitiveMap(self.scoring_rules)
+        self._league_types = CaseInsensitiveMap(self.league_types)
+        self._position_fragments = self._build_fragments(self.positions)
+        self._scoring_rule_fragments = self._build_fragments(self.scoring_rules)
+        self._league_type_fragments = self._build_fragments(self.league_types)
+
+    @staticmethod
+    def _build_fragments(
+        models: Mapping[str, BaseModel],
+    ) -> CaseInsensitiveMap[ContextFragment]:
+        """Serialize context models into case-insensitive fragment lookups.
+        
+        Args:
+            models: Mapping of codes to context models
+            
+        Returns:
+            CaseInsensitiveMap[ContextFragment]: Fragments keyed by code
+        """
+        return CaseInsensitiveMap({
+            code: ContextFragment.from_model(model)
+            for code, model in models.items()
+        })
+
     def _init_positions(self) -> Dict[str, FantasyPosition]:
         """Initialize fantasy football position information.
         
@@ -208,7 +363,7 @@ class FantasyFootballContext:
         Returns:
             Optional[FantasyPosition]: Position information if found
         """
-        return self.positions.get(position_code.upper())
+        return self._positions.lookup(position_code)
 
     def get_scoring_rule(self, rule_name: str) -> Optional[ScoringRule]:
         """Get detailed information about a scoring rule.
@@ -219,7 +374,7 @@ class FantasyFootballContext:
         Returns:
             Optional[ScoringRule]: Scoring rule information if found
         """
-        return self.scoring_rules.get(rule_name.lower())
+        return self._scoring_rules.lookup(rule_name)
 
     def get_league_type(self, type_name: str) -> Optional[LeagueType]:
         """Get detailed information about a league type.
@@ -230,7 +385,40 @@ class FantasyFootballContext:
         Returns:
             Optional[LeagueType]: League type information if found
         """
-        return self.league_types.get(type_name.lower())
+        return self._league_types.lookup(type_name)
+
+    def get_position_fragment(self, position_code: str) -> Optional[ContextFragment]:
+        """Get pre-serialized information about a fantasy football position.
+        
+        Args:
+            position_code: Position code (e.g., "QB", "RB")
+            
+        Returns:
+            Optional[ContextFragment]: Serialized position information if found
+        """
+        return self._position_fragments.lookup(position_code)
+
+    def get_scoring_rule_fragment(self, rule_name: str) -> Optional[ContextFragment]:
+        """Get pre-serialized information about a scoring rule.
+        
+        Args:
+            rule_name: Name of the scoring rule
+            
+        Returns:
+            Optional[ContextFragment]: Serialized scoring rule if found
+        """
+        return self._scoring_rule_fragments.lookup(rule_name)
+
+    def get_league_type_fragment(self, type_name: str) -> Optional[ContextFragment]:
+        """Get pre-serialized information about a league type.
+        
+        Args:
+            type_name: Name of the league type
+            
+        Returns:
+            Optional[ContextFragment]: Serialized league type if found
+        """
+        return self._league_type_fragments.lookup(type_name)
 
     def explain_scoring(self, stat_line: Dict[str, Any], position: str) -> str:
         """Explain how a stat line translates to fantasy points.
@@ -242,9 +430,10 @@ class FantasyFootballContext:
         Returns:
             str: Human-readable explanation of scoring
         """
-        position = position.upper()
-        if position not in self.positions:
+        info = self.get_position_info(position)
+        if info is None:
             return "Unknown position"
+        position = info.code
 
         explanations = []
         total_points = 0.0
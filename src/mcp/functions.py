@@ -87,6 +87,49 @@ SLEEPER_FUNCTIONS: List[MCPFunction] = [
         description="Get current NFL season state information",
         parameters=[],
     ),
+    MCPFunction(
+        name="get_player",
+        description="Get information about an NFL player by Sleeper player ID",
+        parameters=[
+            MCPFunctionParameter(
+                name="player_id",
+                type="string",
+                description="Sleeper player ID to look up",
+                required=True,
+            ),
+        ],
+    ),
+    MCPFunction(
+        name="search_players",
+        description="Search NFL players by name, team and position",
+        parameters=[
+            MCPFunctionParameter(
+                name="name",
+                type="string",
+                description="Full name or name prefix (case-insensitive)",
+                required=False,
+            ),
+            MCPFunctionParameter(
+                name="team",
+                type="string",
+                description="NFL team abbreviation (e.g., 'KC')",
+                required=False,
+            ),
+            MCPFunctionParameter(
+                name="position",
+                type="string",
+                description="Position code (e.g., 'QB')",
+                required=False,
+            ),
+            MCPFunctionParameter(
+                name="limit",
+                type="integer",
+                description="Maximum number of players to return",
+                required=False,
+                default=25,
+            ),
+        ],
+    ),
 ]
 
 
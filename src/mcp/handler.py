@@ -1,12 +1,17 @@
 """Enhanced MCP handler with fantasy football context."""
 
-from typing import Any, Dict, List, Optional, Union
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 from fastapi import HTTPException
+from pydantic import BaseModel
 from structlog import get_logger
 
 from .context import FantasyFootballContext
 from .models import (
+    MCPBatchInvocation,
+    MCPBatchResponse,
     MCPFunction,
     MCPFunctionParameter,
     MCPInvocation,
@@ -17,18 +22,50 @@ from ..services import SleeperAPIClient
 
 logger = get_logger(__name__)
 
+DEFAULT_BATCH_CONCURRENCY = 8
+
 
 class EnhancedMCPHandler:
     """Enhanced handler for MCP protocol operations with fantasy context."""
 
-    def __init__(self, client: SleeperAPIClient):
+    def __init__(
+        self,
+        client: SleeperAPIClient,
+        batch_concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ):
         """Initialize the MCP handler.
         
         Args:
             client: Sleeper API client instance
+            batch_concurrency: Maximum number of batch invocations executed
+                at once
         """
         self.client = client
         self.context = FantasyFootballContext()
+        self.batch_concurrency = batch_concurrency
+        
+        # Only the advertised MCP functions may be invoked, never other
+        # public client methods such as close() or get_json()
+        self.functions = frozenset(
+            function.name for function in get_enhanced_functions()
+        )
+
+    def _get_method(self, function_name: str) -> Any:
+        """Look up the client method implementing an MCP function.
+        
+        Args:
+            function_name: Name of the invoked function
+            
+        Returns:
+            Any: Bound client method
+            
+        Raises:
+            ValueError: If the function is not an advertised MCP function
+        """
+        method = getattr(self.client, function_name, None)
+        if function_name not in self.functions or not method:
+            raise ValueError(f"Unknown function: {function_name}")
+        return method
 
     async def execute_function(self, invocation: MCPInvocation) -> MCPResponse:
         """Execute an MCP function invocation with enhanced context.
@@ -44,9 +81,7 @@ class EnhancedMCPHandler:
         """
         try:
             # Get the corresponding method from the client
-            method = getattr(self.client, invocation.function_name, None)
-            if not method:
-                raise ValueError(f"Unknown function: {invocation.function_name}")
+            method = self._get_method(invocation.function_name)
 
             # Execute the function
             logger.info(
@@ -56,19 +91,13 @@ class EnhancedMCPHandler:
             )
             result = await method(**invocation.parameters)
 
-            # Enhance the result with additional context
+            # Serialize the result and enhance it with additional context
             enhanced_result = self._enhance_result(
                 invocation.function_name,
                 result,
                 invocation.parameters
             )
 
-            # Convert the result to a serializable format if needed
-            if hasattr(enhanced_result, "model_dump"):
-                enhanced_result = enhanced_result.model_dump()
-            elif isinstance(enhanced_result, list) and enhanced_result and hasattr(enhanced_result[0], "model_dump"):
-                enhanced_result = [item.model_dump() for item in enhanced_result]
-
             return MCPResponse(
                 status=MCPResponseStatus.SUCCESS,
                 result=enhanced_result,
@@ -96,13 +125,164 @@ class EnhancedMCPHandler:
                 error=f"Internal error: {str(e)}",
             )
 
+    async def stream_function(self, invocation: MCPInvocation) -> AsyncIterator[bytes]:
+        """Execute an MCP function invocation as a stream of JSON lines.
+        
+        List results are validated, enhanced and serialized one item at a
+        time, each as an {"item": ...} line. Other results are sent as a
+        single {"result": ...} line. The stream always ends with a status
+        line: {"status": "success", "count": n} or
+        {"status": "error", "error": "..."}.
+        
+        Args:
+            invocation: Function invocation request
+            
+        Yields:
+            bytes: Newline-terminated JSON lines
+        """
+        count = 0
+        try:
+            method = self._get_method(invocation.function_name)
+
+            logger.info(
+                "streaming_function",
+                function=invocation.function_name,
+                parameters=invocation.parameters,
+            )
+            # Prefer the client's lazy variant (get_x -> iter_x), which
+            # validates items as they are consumed
+            iter_name = "iter_" + invocation.function_name.removeprefix("get_")
+            iter_method = getattr(self.client, iter_name, None)
+            if iter_method:
+                items = iter_method(**invocation.parameters)
+            else:
+                result = await method(**invocation.parameters)
+                if not isinstance(result, list):
+                    enhanced = self._enhance_result(
+                        invocation.function_name,
+                        result,
+                        invocation.parameters,
+                    )
+                    yield self._json_line({"result": enhanced})
+                    yield self._json_line(
+                        {"status": MCPResponseStatus.SUCCESS, "count": 1}
+                    )
+                    return
+                items = self._iterate(result)
+
+            async for item in items:
+                yield self._item_line(self._to_data(item))
+                count += 1
+
+            yield self._json_line(
+                {"status": MCPResponseStatus.SUCCESS, "count": count}
+            )
+
+        except HTTPException as e:
+            logger.error(
+                "function_execution_failed",
+                function=invocation.function_name,
+                status_code=e.status_code,
+                detail=e.detail,
+            )
+            yield self._json_line(
+                {"status": MCPResponseStatus.ERROR, "error": str(e.detail)}
+            )
+        except Exception as e:
+            logger.exception(
+                "unexpected_error",
+                function=invocation.function_name,
+                error=str(e),
+            )
+            yield self._json_line({
+                "status": MCPResponseStatus.ERROR,
+                "error": f"Internal error: {str(e)}",
+            })
+
+    @staticmethod
+    async def _iterate(items: List[Any]) -> AsyncIterator[Any]:
+        """Adapt an already materialized list to an async iterator."""
+        for item in items:
+            yield item
+
+    def _item_line(self, item: Any) -> bytes:
+        """Serialize a list item as an {"item": ...} line of a JSON lines stream.
+        
+        Position context is spliced in from its pre-serialized JSON form
+        instead of being encoded again for every item.
+        
+        Args:
+            item: Serialized list item
+            
+        Returns:
+            bytes: Newline-terminated JSON line
+        """
+        pos_info = None
+        if isinstance(item, dict) and item.get("position"):
+            pos_info = self.context.get_position_fragment(item["position"])
+
+        body = json.dumps(item, separators=(",", ":"), default=str).encode()
+        if pos_info:
+            body = body[:-1] + b',"position_info":' + pos_info.json + b"}"
+        return b'{"item":' + body + b"}\n"
+
+    @staticmethod
+    def _json_line(data: Dict[str, Any]) -> bytes:
+        """Serialize one line of a JSON lines stream."""
+        return json.dumps(data, separators=(",", ":"), default=str).encode() + b"\n"
+
+    async def execute_batch(self, batch: MCPBatchInvocation) -> MCPBatchResponse:
+        """Execute a batch of MCP function invocations concurrently.
+        
+        Identical invocations are executed once and share their response.
+        Failures are reported per invocation and do not affect the others.
+        
+        Args:
+            batch: Batch of function invocation requests
+            
+        Returns:
+            MCPBatchResponse: Responses in the same order as the invocations
+        """
+        keys = [self._invocation_key(invocation) for invocation in batch.invocations]
+        unique = dict(zip(keys, batch.invocations))
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+
+        async def run(invocation: MCPInvocation) -> MCPResponse:
+            async with semaphore:
+                return await self.execute_function(invocation)
+
+        logger.info(
+            "executing_batch",
+            invocations=len(keys),
+            unique_invocations=len(unique),
+        )
+        responses = await asyncio.gather(*(run(inv) for inv in unique.values()))
+        by_key = dict(zip(unique, responses))
+        return MCPBatchResponse(results=[by_key[key] for key in keys])
+
+    @staticmethod
+    def _invocation_key(invocation: MCPInvocation) -> str:
+        """Build a key identifying equivalent invocations.
+        
+        Args:
+            invocation: Function invocation request
+            
+        Returns:
+            str: Function name and canonical JSON parameters
+        """
+        parameters = json.dumps(invocation.parameters, sort_keys=True, default=str)
+        return f"{invocation.function_name}:{parameters}"
+
     def _enhance_result(
         self,
         function_name: str,
         result: Any,
         parameters: Dict[str, Any]
     ) -> Any:
-        """Enhance API results with additional context.
+        """Serialize API results and enhance them with additional context.
+        
+        Every model is dumped exactly once and the resulting dicts are
+        enhanced in place.
         
         Args:
             function_name: Name of the executed function
@@ -110,61 +290,83 @@ class EnhancedMCPHandler:
             parameters: Function parameters
             
         Returns:
-            Any: Enhanced result with additional context
+            Any: Serializable result with additional context
         """
-        # Convert result to dict if it's a model
-        result_data = result.model_dump() if hasattr(result, "model_dump") else result
-
-        if isinstance(result_data, dict):
-            context_data = {}
-
-            if function_name == "get_league":
-                # Add league type information and strategies
-                league_type = self.context.get_league_type(
-                    "ppr" if result_data.get("scoring_settings", {}).get("reception", 0) > 0
-                    else "standard"
-                )
-                if league_type:
-                    context_data["league_type_info"] = league_type.model_dump()
-                
-                # Add strategy suggestions
-                context_data["suggested_strategies"] = self.context.suggest_strategies(result_data)
-
-            elif function_name == "get_league_rosters":
-                # Add position information for roster slots
-                if "roster_positions" in result_data:
-                    position_info = {}
-                    for pos in result_data["roster_positions"]:
-                        pos_data = self.context.get_position_info(pos)
-                        if pos_data:
-                            position_info[pos] = pos_data.model_dump()
-                    context_data["position_info"] = position_info
-
-            # Merge context data with original result
-            if context_data:
-                if isinstance(result_data, dict):
-                    result_data["context"] = context_data
-                else:
-                    result_data = {"data": result_data, "context": context_data}
-
-        elif isinstance(result_data, list):
+        if isinstance(result, list):
             # Handle list results (e.g., multiple players or rosters)
-            enhanced_list = []
-            for item in result_data:
-                if isinstance(item, dict):
-                    enhanced_item = item.copy()
-                    # Add relevant context based on item type
-                    if "position" in item:
-                        pos_info = self.context.get_position_info(item["position"])
-                        if pos_info:
-                            enhanced_item["position_info"] = pos_info.model_dump()
-                    enhanced_list.append(enhanced_item)
-                else:
-                    enhanced_list.append(item)
-            result_data = enhanced_list
+            return [self._enhance_item(self._to_data(item)) for item in result]
+
+        result_data = self._to_data(result)
+        if not isinstance(result_data, dict):
+            return result_data
+
+        context_data: Dict[str, Any] = {}
+
+        if function_name == "get_league":
+            # Add league type information and strategies
+            league_type = self.context.get_league_type_fragment(
+                "ppr" if result_data.get("scoring_settings", {}).get("reception", 0) > 0
+                else "standard"
+            )
+            if league_type:
+                context_data["league_type_info"] = league_type.data
+            
+            # Add strategy suggestions
+            context_data["suggested_strategies"] = self.context.suggest_strategies(
+                result_data
+            )
+
+        elif function_name == "get_league_rosters":
+            # Add position information for roster slots
+            if "roster_positions" in result_data:
+                position_info = {}
+                for pos in result_data["roster_positions"]:
+                    pos_data = self.context.get_position_fragment(pos)
+                    if pos_data:
+                        position_info[pos] = pos_data.data
+                context_data["position_info"] = position_info
+
+        # Merge context data with original result
+        if context_data:
+            result_data["context"] = context_data
 
         return result_data
 
+    def _enhance_item(self, item: Any) -> Any:
+        """Enhance a serialized list item in place with additional context.
+        
+        Args:
+            item: Serialized list item, owned by the caller
+            
+        Returns:
+            Any: Enhanced item
+        """
+        if isinstance(item, dict) and item.get("position"):
+            # Add relevant context based on item type
+            pos_info = self.context.get_position_fragment(item["position"])
+            if pos_info:
+                item["position_info"] = pos_info.data
+        return item
+
+    @staticmethod
+    def _to_data(value: Any) -> Any:
+        """Convert a result value into data the handler may modify.
+        
+        Models are dumped once into a fresh dict. Plain dicts may be shared
+        with the client's cache, so they are copied shallowly instead.
+        
+        Args:
+            value: Result value
+            
+        Returns:
+            Any: Serializable value
+        """
+        if isinstance(value, BaseModel):
+            return value.model_dump()
+        if isinstance(value, dict):
+            return dict(value)
+        return value
+
 
 def get_enhanced_functions() -> List[MCPFunction]:
     """Get the enhanced list of available MCP functions.
@@ -257,4 +459,47 @@ def get_enhanced_functions() -> List[MCPFunction]:
             description="Get current NFL season state information",
             parameters=[],
         ),
+        MCPFunction(
+            name="get_player",
+            description="Get information about an NFL player by Sleeper player ID",
+            parameters=[
+                MCPFunctionParameter(
+                    name="player_id",
+                    type="string",
+                    description="Sleeper player ID to look up",
+                    required=True,
+                ),
+            ],
+        ),
+        MCPFunction(
+            name="search_players",
+            description="Search NFL players by name, team and position",
+            parameters=[
+                MCPFunctionParameter(
+                    name="name",
+                    type="string",
+                    description="Full name or name prefix (case-insensitive)",
+                    required=False,
+                ),
+                MCPFunctionParameter(
+                    name="team",
+                    type="string",
+                    description="NFL team abbreviation (e.g., 'KC')",
+                    required=False,
+                ),
+                MCPFunctionParameter(
+                    name="position",
+                    type="string",
+                    description="Position code (e.g., 'QB')",
+                    required=False,
+                ),
+                MCPFunctionParameter(
+                    name="limit",
+                    type="integer",
+                    description="Maximum number of players to return",
+                    required=False,
+                    default=25,
+                ),
+            ],
+        ),
     ]
@@ -56,6 +56,25 @@ class MCPResponse(BaseModel):
     error: Optional[str] = Field(None, description="Error message if status is error")
 
 
+class MCPBatchInvocation(BaseModel):
+    """Request to invoke several functions via MCP in one round trip."""
+
+    invocations: List[MCPInvocation] = Field(
+        ...,
+        min_length=1,
+        description="Function invocations to execute concurrently"
+    )
+
+
+class MCPBatchResponse(BaseModel):
+    """Responses from a batch of MCP function invocations."""
+
+    results: List[MCPResponse] = Field(
+        default_factory=list,
+        description="Responses in the same order as the invocations"
+    )
+
+
 class MCPCapabilities(BaseModel):
     """Capabilities exposed by the MCP server."""
 
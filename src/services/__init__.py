@@ -1,5 +1,14 @@
 """Services for the Sleeper MCP server."""
 
-from .sleeper import SleeperAPIClient
+from .health import HealthCanary, UpstreamHealth
+from .prefetch import PrefetchScheduler
+from .sleeper import SleeperAPIClient, acquire_shared_client, release_shared_client
 
-__all__ = ["SleeperAPIClient"]
+__all__ = [
+    "HealthCanary",
+    "PrefetchScheduler",
+    "SleeperAPIClient",
+    "UpstreamHealth",
+    "acquire_shared_client",
+    "release_shared_client",
+]
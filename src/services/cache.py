@@ -2,34 +2,182 @@
 
 This module provides a comprehensive caching solution using diskcache and HTTP caching
 strategies. It includes:
-- Disk-based cache storage
+- In-memory LRU tier in front of the disk cache
+- Entry-count and byte budgets with TinyLFU frequency-based admission
+- Disk-based cache storage in a compact binary entry format
+- Transparent zstd or zlib compression of large bodies on disk
 - HTTP cache control directive handling
 - Conditional request support (ETags, Last-Modified)
+- Short-lived negative caching of not-found responses
+- Per-endpoint TTL, stale-while-revalidate and cacheability policies
+- Pinned tier for immutable responses, exempt from expiry and eviction
 - Cache invalidation strategies
+- Batched access tracking kept out of the read path
+- Disk I/O offloaded to a bounded thread pool with write-behind batching
 - Cache statistics and monitoring
 """
 
+import asyncio
 import hashlib
+import io
 import json
+import re
+import struct
+import threading
 import time
-from datetime import datetime, timedelta
+import zlib
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from email.utils import formatdate, parsedate_to_datetime
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple, Union
-from urllib.parse import urlparse
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    cast,
+)
+from urllib.parse import urlencode, urlparse
 
 from dateutil.parser import parse as parse_date
 from diskcache import Cache
 from httpx import Request, Response
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from structlog import get_logger
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None
+
+from ..config.settings import CachePolicy
+
 logger = get_logger(__name__)
 
 # Cache configuration
 CACHE_DIR = Path(__file__).parent.parent.parent / "cache"
 DEFAULT_CACHE_TTL = 3600  # 1 hour
 MAX_CACHE_SIZE = 1024 * 1024 * 1024  # 1GB
+PINNED_CACHE_SIZE = 256 * 1024 * 1024  # 256MB
+DEFAULT_NEGATIVE_TTL = 60  # Seconds to remember that a resource was not found
+REVALIDATION_WINDOW = 3600  # Keep revalidatable entries 1 hour past freshness
+DEFAULT_MEMORY_ENTRIES = 512
+DEFAULT_MEMORY_SIZE = 64 * 1024 * 1024  # 64MB
+META_CACHE_SIZE = 64 * 1024 * 1024  # 64MB
+MAX_PARSED_SIZE = 1024 * 1024  # Only keep decoded bodies up to 1MB in memory
+ACCESS_FLUSH_BATCH = 100  # Flush access records after this many hits
+ACCESS_FLUSH_INTERVAL = 30.0  # ... or after this many seconds
+DEFAULT_IO_WORKERS = 4  # Threads performing disk I/O off the event loop
+WRITE_BATCH_SIZE = 256  # Maximum number of writes applied per transaction
+VARY_CACHE_ENTRIES = 4096  # Resources whose Vary header names are kept in memory
+DEFAULT_MAX_ENTRIES = 1000
+SKETCH_DEPTH = 4
+SKETCH_MAX_COUNT = 15  # Counters saturate, as only relative popularity matters
+SKETCH_SAMPLE_FACTOR = 10  # Age counters after this many accesses per entry
+SKETCH_SEEDS = (
+    0x9E3779B97F4A7C15,
+    0xC2B2AE3D27D4EB4F,
+    0x165667B19E3779F9,
+    0xD6E8FEB86659FD93,
+)
+_HALVE = bytes(count >> 1 for count in range(256))
+_MASK64 = (1 << 64) - 1
+
+# Binary entry layout: header | metadata JSON | headers JSON | raw body
+ENTRY_MAGIC = b"SLPC"
+ENTRY_VERSION = 1
+ENTRY_HEADER = struct.Struct("!4sBBHII")  # magic, version, flags, status, lengths
+FLAG_ZLIB = 0x01  # Body is zlib-compressed
+FLAG_ZSTD = 0x02  # Body is zstd-compressed
+COMPRESSION_FLAGS = {"zlib": FLAG_ZLIB, "zstd": FLAG_ZSTD}
+COMPRESSION_MIN_SIZE = 1024  # Bodies smaller than this are stored as is
+
+_UNPARSED = object()
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Headers a 304 Not Modified response may update on the stored entry
+REVALIDATION_HEADERS = ("cache-control", "date", "etag", "expires", "last-modified")
+
+
+def resolve_compression(method: Optional[str]) -> Optional[str]:
+    """Resolve a configured compression method to one that is available.
+    
+    Args:
+        method: "zstd", "zlib", "auto" (zstd if installed, else zlib), or
+            None or "none" to disable compression
+            
+    Returns:
+        Optional[str]: "zstd", "zlib", or None for no compression
+        
+    Raises:
+        ValueError: If the method is unknown
+    """
+    if method is None or method == "none":
+        return None
+    if method == "auto":
+        return "zstd" if zstandard is not None else "zlib"
+    if method not in COMPRESSION_FLAGS:
+        raise ValueError(f"Unknown compression method: {method}")
+    if method == "zstd" and zstandard is None:
+        logger.warning("zstd_unavailable", hint="pip install zstandard")
+        return "zlib"
+    return method
+
+
+def _compile_route(pattern: str) -> "re.Pattern[str]":
+    """Compile a route pattern such as "/league/*/rosters" into a regex.
+    
+    A "*" segment matches exactly one path segment and a "*" inside a
+    segment matches within it, never across "/". The regex is meant to
+    match the whole path.
+    
+    Args:
+        pattern: Route pattern
+        
+    Returns:
+        re.Pattern[str]: Compiled pattern, to be used with fullmatch
+    """
+    segments = [
+        "[^/]+" if segment == "*" else re.escape(segment).replace(r"\*", "[^/]*")
+        for segment in pattern.split("/")
+    ]
+    return re.compile("/".join(segments))
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Make a datetime timezone-aware, reading naive values as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _compress(content: bytes, method: str, level: Optional[int]) -> bytes:
+    """Compress a body with the given method."""
+    if method == "zstd":
+        compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+        return cast(bytes, compressor.compress(content))
+    return zlib.compress(content, -1 if level is None else level)
+
+
+def _decompress(content: bytes, flags: int) -> bytes:
+    """Decompress a body according to its entry flags."""
+    if flags & FLAG_ZSTD:
+        if zstandard is None:
+            raise ValueError("Cache entry requires zstandard to decompress")
+        return cast(bytes, zstandard.ZstdDecompressor().decompress(content))
+    if flags & FLAG_ZLIB:
+        return zlib.decompress(content)
+    return content
 
 
 class CacheMetadata(BaseModel):
@@ -46,6 +194,10 @@ class CacheMetadata(BaseModel):
     created_at: datetime
     accessed_at: datetime
     access_count: int = 0
+    ttl: Optional[int] = None
+    stale_while_revalidate: int = 0
+    pinned: bool = False
+    negative: bool = False
 
 
 class CacheEntry(BaseModel):
@@ -56,6 +208,513 @@ class CacheEntry(BaseModel):
     content: bytes
     metadata: CacheMetadata
 
+    # Parsed body wrapped in a 1-tuple so that a JSON null is distinguishable
+    _data: Optional[Tuple[Any]] = PrivateAttr(default=None)
+    # Validated bodies keyed by (model, many)
+    _models: Dict[Tuple[Type[BaseModel], bool], Any] = PrivateAttr(default_factory=dict)
+    # CPU seconds spent decompressing the body when it was read from disk
+    _decompress_time: Optional[float] = PrivateAttr(default=None)
+
+    def get_json(self) -> Any:
+        """Get the parsed JSON body, decoding it at most once.
+        
+        The returned object is shared by every reader of this entry and
+        must be treated as read-only. Bodies larger than MAX_PARSED_SIZE are
+        decoded on every call, since their decoded form costs many times the
+        memory accounted for the entry.
+        
+        Returns:
+            Any: Parsed JSON body
+        """
+        if self._data is not None:
+            return self._data[0]
+        data = json.loads(self.content)
+        self.set_json(data)
+        return data
+
+    def set_json(self, data: Any) -> None:
+        """Attach an already parsed JSON body to the entry.
+        
+        Args:
+            data: Parsed JSON body matching the entry content
+        """
+        if len(self.content) <= MAX_PARSED_SIZE:
+            self._data = (data,)
+
+    def get_models(self, model: Type[BaseModel], many: bool = False) -> Any:
+        """Get the body validated as a model, validating it at most once.
+        
+        The validated models are shared by every reader of this entry and
+        must be treated as read-only; lists are copied for each caller.
+        Bodies larger than MAX_PARSED_SIZE are validated on every call.
+        
+        Args:
+            model: Model to validate the body with
+            many: Whether the body is a list of model instances
+            
+        Returns:
+            Any: Model instance, or list of instances if many is set
+        """
+        key = (model, many)
+        value = self._models.get(key)
+        if value is None:
+            data = self.get_json()
+            if many:
+                value = [model.model_validate(item) for item in data]
+            else:
+                value = model.model_validate(data)
+            if len(self.content) <= MAX_PARSED_SIZE:
+                self._models[key] = value
+        return list(value) if many else value
+
+    def to_bytes(
+        self,
+        compression: Optional[str] = None,
+        level: Optional[int] = None,
+        min_size: int = COMPRESSION_MIN_SIZE
+    ) -> bytes:
+        """Serialize the entry into the binary on-disk format.
+        
+        Args:
+            compression: Body compression method, "zstd" or "zlib", or None
+                to store the body as is
+            level: Compression level (default: the method's default)
+            min_size: Smallest body size worth compressing
+            
+        Returns:
+            bytes: Encoded entry
+        """
+        metadata = self.metadata.model_dump_json().encode()
+        headers = json.dumps(self.headers).encode()
+        
+        flags = 0
+        content = self.content
+        if compression is not None and len(content) >= min_size:
+            compressed = _compress(content, compression, level)
+            if len(compressed) < len(content):
+                flags = COMPRESSION_FLAGS[compression]
+                content = compressed
+                
+        header = ENTRY_HEADER.pack(
+            ENTRY_MAGIC,
+            ENTRY_VERSION,
+            flags,
+            self.status_code,
+            len(metadata),
+            len(headers)
+        )
+        return b"".join((header, metadata, headers, content))
+
+    @classmethod
+    def from_bytes(cls, value: Union[bytes, BinaryIO]) -> "CacheEntry":
+        """Deserialize an entry from the binary on-disk format.
+        
+        Large values are read straight from the diskcache file handle so the
+        body is loaded with a single copy. Compressed bodies are decompressed
+        according to the entry flags.
+        
+        Args:
+            value: Encoded entry or a binary file positioned at its start
+            
+        Returns:
+            CacheEntry: Decoded entry
+            
+        Raises:
+            ValueError: If the value is not a supported binary entry
+        """
+        stream = io.BytesIO(value) if isinstance(value, bytes) else value
+        magic, version, flags, status_code, metadata_len, headers_len = (
+            ENTRY_HEADER.unpack(stream.read(ENTRY_HEADER.size))
+        )
+        if magic != ENTRY_MAGIC or version != ENTRY_VERSION:
+            raise ValueError("Unsupported cache entry format")
+            
+        metadata = CacheMetadata.model_validate_json(stream.read(metadata_len))
+        headers = json.loads(stream.read(headers_len))
+        content = stream.read()
+        
+        decompress_time = None
+        if flags:
+            started = time.thread_time()
+            content = _decompress(content, flags)
+            decompress_time = time.thread_time() - started
+            
+        entry = cls.model_construct(
+            status_code=status_code,
+            headers=headers,
+            content=content,
+            metadata=metadata
+        )
+        entry._decompress_time = decompress_time
+        return entry
+
+
+class CachedResponse(Response):
+    """Response rebuilt from a cache entry that reuses its parsed body."""
+
+    def __init__(
+        self,
+        entry: CacheEntry,
+        request: Request,
+        headers: Optional[Dict[str, str]] = None,
+        serve_stale: bool = False,
+        conditional_headers: Optional[Dict[str, str]] = None
+    ):
+        """Initialize the cached response.
+        
+        Args:
+            entry: Cache entry backing the response
+            request: Request the response answers
+            headers: Optional headers overriding the entry headers
+            serve_stale: Whether the stale response may be served while it
+                is revalidated in the background
+            conditional_headers: Headers for revalidating the stale response
+                with a conditional request
+        """
+        super().__init__(
+            status_code=entry.status_code,
+            headers=headers if headers is not None else entry.headers,
+            content=entry.content,
+            request=request
+        )
+        self.entry = entry
+        self.serve_stale = serve_stale
+        self.conditional_headers = conditional_headers or {}
+
+    def json(self, **kwargs: Any) -> Any:
+        """Get the parsed JSON body without decoding it again."""
+        if kwargs:
+            return super().json(**kwargs)
+        return self.entry.get_json()
+
+
+class FrequencySketch:
+    """Count-min sketch estimating how often keys were recently accessed.
+
+    Used for TinyLFU admission: a new entry only displaces entries that are
+    not accessed more often than it is. Counters are halved periodically so
+    that estimates follow recent rather than all-time popularity.
+    """
+
+    def __init__(self, capacity: int):
+        """Initialize the sketch.
+        
+        Args:
+            capacity: Number of entries whose frequencies matter, which
+                sizes the counter table and the aging period
+        """
+        bits = max(2 * capacity - 1, 255).bit_length()
+        self._shift = 64 - bits
+        self._rows = [bytearray(1 << bits) for _ in range(SKETCH_DEPTH)]
+        self.sample_size = SKETCH_SAMPLE_FACTOR * max(capacity, 1)
+        self._additions = 0
+
+    def _indexes(self, key: str) -> List[int]:
+        """Get the counter index for a key in each row."""
+        h = hash(key) & _MASK64
+        return [((h * seed) & _MASK64) >> self._shift for seed in SKETCH_SEEDS]
+
+    def increment(self, key: str) -> None:
+        """Record an access to a key.
+        
+        Args:
+            key: Accessed key
+        """
+        for row, index in zip(self._rows, self._indexes(key)):
+            if row[index] < SKETCH_MAX_COUNT:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key: str) -> int:
+        """Estimate how often a key was recently accessed.
+        
+        Args:
+            key: Key to look up
+            
+        Returns:
+            int: Estimated access count
+        """
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+    def _age(self) -> None:
+        """Halve every counter so that old accesses fade out."""
+        self._rows = [row.translate(_HALVE) for row in self._rows]
+        self._additions //= 2
+
+
+class MemoryCache:
+    """Bounded in-process LRU cache used as the first tier of APICache.
+
+    Entries are evicted when either the entry-count or the byte limit is
+    exceeded. Expired entries are dropped on access and are always evicted
+    before live ones. With a frequency sketch, a new entry is only admitted
+    if it is accessed at least as often as every live entry it would evict.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MEMORY_ENTRIES,
+        max_size: int = DEFAULT_MEMORY_SIZE,
+        sketch: Optional[FrequencySketch] = None
+    ):
+        """Initialize the memory cache.
+        
+        Args:
+            max_entries: Maximum number of entries held in memory
+            max_size: Maximum total size of held entries in bytes
+            sketch: Optional access frequency sketch for admission
+        """
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self.sketch = sketch
+        self.size = 0
+        self.rejected = 0
+        self._entries: "OrderedDict[str, Tuple[CacheEntry, Optional[float], int]]" = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get an entry and mark it as most recently used.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Optional[CacheEntry]: Cached entry if present and not expired
+        """
+        item = self._entries.get(key)
+        if item is None:
+            return None
+            
+        entry, expire_at, _ = item
+        if expire_at is not None and expire_at <= time.time():
+            self.delete(key)
+            return None
+            
+        self._entries.move_to_end(key)
+        return entry
+
+    def set(
+        self,
+        key: str,
+        entry: CacheEntry,
+        size: int,
+        expire_at: Optional[float] = None
+    ) -> bool:
+        """Store an entry, evicting others if limits are exceeded.
+        
+        Args:
+            key: Cache key
+            entry: Cache entry to store
+            size: Approximate size of the entry in bytes
+            expire_at: Absolute expiry time as a UNIX timestamp
+            
+        Returns:
+            bool: Whether the entry was admitted
+        """
+        replacing = key in self._entries
+        self.delete(key)
+        if size > self.max_size or self.max_entries <= 0:
+            return False
+        if not replacing and not self._admit(key, size):
+            self.rejected += 1
+            return False
+            
+        self._entries[key] = (entry, expire_at, size)
+        self.size += size
+        self._evict()
+        return True
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present.
+        
+        Args:
+            key: Cache key
+        """
+        item = self._entries.pop(key, None)
+        if item is not None:
+            self.size -= item[2]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self.size = 0
+
+    def _admit(self, key: str, size: int) -> bool:
+        """Check whether a new entry is worth the live entries it would evict.
+        
+        Args:
+            key: Cache key of the new entry
+            size: Size of the new entry in bytes
+            
+        Returns:
+            bool: Whether the entry should be admitted, which it always is
+            without a frequency sketch
+        """
+        sketch = self.sketch
+        if sketch is None:
+            return True
+        excess_entries = len(self._entries) + 1 - self.max_entries
+        excess_size = self.size + size - self.max_size
+        frequency = sketch.estimate(key)
+        now = time.time()
+        for victim, (_, expire_at, victim_size) in self._entries.items():
+            if excess_entries <= 0 and excess_size <= 0:
+                break
+            live = expire_at is None or expire_at > now
+            if live and sketch.estimate(victim) > frequency:
+                return False
+            excess_entries -= 1
+            excess_size -= victim_size
+        return True
+
+    def _is_full(self) -> bool:
+        return len(self._entries) > self.max_entries or self.size > self.max_size
+
+    def _evict(self) -> None:
+        """Evict expired entries first, then least recently used ones."""
+        if not self._is_full():
+            return
+            
+        now = time.time()
+        expired = [
+            key for key, (_, expire_at, _) in self._entries.items()
+            if expire_at is not None and expire_at <= now
+        ]
+        for key in expired:
+            self.delete(key)
+            
+        while self._is_full():
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self.size -= size
+
+
+class AccessTracker:
+    """Tracks cache entry accesses outside of the cached entries themselves.
+
+    Hits are counted in memory and periodically merged into small per-key
+    records in a sidecar store, so reading an entry never rewrites it.
+    """
+
+    def __init__(
+        self,
+        store: Cache,
+        flush_batch: int = ACCESS_FLUSH_BATCH,
+        flush_interval: float = ACCESS_FLUSH_INTERVAL,
+        submit: Optional[Callable[[Callable[[], None]], None]] = None
+    ):
+        """Initialize the access tracker.
+        
+        Args:
+            store: Sidecar store holding the flushed access records
+            flush_batch: Number of recorded hits that triggers a flush
+            flush_interval: Seconds between flushes while hits keep arriving
+            submit: Optional callable scheduling store writes, so that
+                automatic flushes do not block the caller (default: write
+                immediately)
+        """
+        self.store = store
+        self.flush_batch = flush_batch
+        self.flush_interval = flush_interval
+        self.submit = submit
+        self._pending: Dict[str, Tuple[datetime, int]] = {}
+        self._pending_hits = 0
+        self._last_flush = time.monotonic()
+
+    @staticmethod
+    def _record_key(key: str) -> str:
+        return f"access:{key}"
+
+    def record(self, key: str) -> None:
+        """Record an access to a cache entry.
+        
+        Args:
+            key: Cache key of the accessed entry
+        """
+        _, count = self._pending.get(key, (None, 0))
+        self._pending[key] = (datetime.utcnow(), count + 1)
+        self._pending_hits += 1
+        
+        if (
+            self._pending_hits >= self.flush_batch
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            pending = self._take()
+            if self.submit is not None:
+                self.submit(partial(self._write, pending))
+            else:
+                self._write(pending)
+
+    def flush(self) -> None:
+        """Merge pending access counts into the sidecar store."""
+        self._write(self._take())
+
+    def _take(self) -> Dict[str, Tuple[datetime, int]]:
+        """Take the pending access counts, resetting the flush triggers."""
+        pending, self._pending = self._pending, {}
+        self._pending_hits = 0
+        self._last_flush = time.monotonic()
+        return pending
+
+    def _write(self, pending: Dict[str, Tuple[datetime, int]]) -> None:
+        """Merge access counts into the sidecar store.
+        
+        Args:
+            pending: Access counts keyed by cache key
+        """
+        if not pending:
+            return
+            
+        with self.store.transact():
+            for key, (accessed_at, count) in pending.items():
+                record_key = self._record_key(key)
+                _, stored_count = self.store.get(record_key, (None, 0))
+                self.store.set(record_key, (accessed_at, stored_count + count))
+                
+        logger.debug("cache_access_flushed", entries=len(pending))
+
+    def get(self, key: str) -> Optional[Tuple[datetime, int]]:
+        """Get the last access time and access count for an entry.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Optional[Tuple[datetime, int]]: (accessed_at, access_count) if the
+            entry has been accessed
+        """
+        accessed_at, count = self.store.get(self._record_key(key), (None, 0))
+        if key in self._pending:
+            accessed_at, pending_count = self._pending[key]
+            count += pending_count
+        return (accessed_at, count) if accessed_at else None
+
+    def discard(self, key: str) -> None:
+        """Forget access information for an entry.
+        
+        Args:
+            key: Cache key
+        """
+        self._pending.pop(key, None)
+        delete = partial(self.store.delete, self._record_key(key))
+        if self.submit is not None:
+            self.submit(delete)
+        else:
+            delete()
+
+    def clear(self) -> None:
+        """Forget pending access information.
+        
+        Flushed records are removed together with the sidecar store.
+        """
+        self._pending.clear()
+        self._pending_hits = 0
+
 
 class APICache:
     """Comprehensive caching implementation for API responses."""
@@ -64,18 +723,82 @@ class APICache:
         self,
         cache_dir: Optional[Path] = None,
         ttl: int = DEFAULT_CACHE_TTL,
-        max_size: int = MAX_CACHE_SIZE
+        max_size: int = MAX_CACHE_SIZE,
+        max_entries: Optional[int] = None,
+        memory_max_entries: int = DEFAULT_MEMORY_ENTRIES,
+        memory_max_size: int = DEFAULT_MEMORY_SIZE,
+        stale_while_revalidate: int = 0,
+        policies: Optional[Dict[str, CachePolicy]] = None,
+        base_path: str = "",
+        io_workers: int = DEFAULT_IO_WORKERS,
+        pinned_max_size: int = PINNED_CACHE_SIZE,
+        compression: Optional[str] = "auto",
+        compression_level: Optional[int] = None,
+        compression_min_size: int = COMPRESSION_MIN_SIZE,
+        negative_ttl: int = DEFAULT_NEGATIVE_TTL
     ):
         """Initialize the cache.
         
         Args:
             cache_dir: Directory to store cache files
             ttl: Default time-to-live for cache entries in seconds
-            max_size: Maximum cache size in bytes
+            max_size: Maximum disk cache size in bytes
+            max_entries: Maximum number of responses in the disk cache, or
+                None for no limit besides max_size
+            memory_max_entries: Maximum number of entries in the memory tier
+            memory_max_size: Maximum size of the memory tier in bytes
+            stale_while_revalidate: Default number of seconds a stale entry
+                may be served while it is revalidated in the background
+            policies: Per-endpoint caching policies keyed by route patterns
+                matched against the whole URL path below base_path, where a
+                "*" segment matches one path segment; the first match
+                overrides the default TTL and stale window
+            base_path: URL path prefix of the API (e.g. "/v1"), stripped
+                before matching policies
+            io_workers: Number of threads performing disk I/O; 0 performs it
+                inline on the calling thread
+            pinned_max_size: Maximum size of the pinned tier in bytes
+            compression: Compression of bodies on disk: "zstd", "zlib",
+                "auto" (zstd if installed, else zlib) or None
+            compression_level: Compression level (default: the method's
+                default)
+            compression_min_size: Smallest body size in bytes to compress
+            negative_ttl: Time-to-live in seconds for not-found responses
+                (404s and null bodies); 0 disables negative caching
         """
         self.cache_dir = cache_dir or CACHE_DIR
         self.ttl = ttl
         self.max_size = max_size
+        self.max_entries = max_entries
+        self.stale_while_revalidate = stale_while_revalidate
+        self.policies = policies or {}
+        self.base_path = base_path.rstrip("/")
+        self._routes = [
+            (_compile_route(pattern), policy)
+            for pattern, policy in self.policies.items()
+        ]
+        self.compression = resolve_compression(compression)
+        self.compression_level = compression_level
+        self.compression_min_size = compression_min_size
+        self.negative_ttl = negative_ttl
+        
+        # Access frequencies shared by the admission policies of both tiers
+        self.sketch = FrequencySketch(max(memory_max_entries, max_entries or 0))
+        
+        # Memory tier (L1) in front of the disk cache (L2)
+        self.memory = MemoryCache(
+            max_entries=memory_max_entries,
+            max_size=memory_max_size,
+            sketch=self.sketch
+        )
+        self._l1_hits = 0
+        self._l1_misses = 0
+        self._l2_hits = 0
+        self._l2_misses = 0
+        self._stale_hits = 0
+        self._refreshes = 0
+        self._negative_stores = 0
+        self._negative_hits = 0
         
         # Create cache directory if it doesn't exist
         self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -86,37 +809,222 @@ class APICache:
             size_limit=max_size,
             eviction_policy='least-recently-used'
         )
+        self.cache.stats(enable=True)
+        
+        # Disk keys in least recently used order with their expiry, None
+        # until known, enforcing max_entries (diskcache only limits bytes)
+        self._disk_keys: "OrderedDict[str, Optional[float]]" = OrderedDict.fromkeys(
+            self.cache.iterkeys()
+        )
+        self._disk_rejected = 0
+        self._disk_evictions = 0
+        
+        # Pinned tier for responses that never change, which are neither
+        # expired nor evicted; its budget is enforced when pinning
+        self.pinned_max_size = pinned_max_size
+        self.pinned = Cache(
+            directory=str(self.cache_dir / "pinned"),
+            eviction_policy='none'
+        )
+        self._pinned_rejected = 0
+        
+        # Sidecar store for small bookkeeping records
+        self.meta = Cache(
+            directory=str(self.cache_dir / "meta"),
+            size_limit=META_CACHE_SIZE,
+            eviction_policy='least-recently-stored'
+        )
+        
+        # Disk reads run on a bounded thread pool; writes are queued and
+        # applied in batches by a single drain at a time (write-behind)
+        self._executor = (
+            ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="cache-io")
+            if io_workers > 0 else None
+        )
+        self._writes: Deque[Tuple[Callable[[], None], Optional[str], Any]] = deque()
+        self._write_lock = threading.Lock()
+        self._drain_future: Optional["asyncio.Future[Any]"] = None
+        # Entries with queued writes, wrapped in a 1-tuple marker: the entry
+        # and its expiry, or None for a queued delete
+        self._pending: Dict[str, Tuple[Optional[Tuple[CacheEntry, float]]]] = {}
+        self._write_batches = 0
+        self._rejected = 0
+        
+        # Compression statistics, updated from the I/O threads
+        self._codec_lock = threading.Lock()
+        self._compressed_count = 0
+        self._uncompressed_bytes = 0
+        self._compressed_bytes = 0
+        self._decompressed_count = 0
+        self._decompress_time = 0.0
+        
+        # Sizes of pinned entries as counted against the pinned budget,
+        # measured like the memory tier measures entries
+        self._pinned_sizes = self._read_pinned_sizes()
+        self._pinned_bytes = sum(self._pinned_sizes.values())
+        
+        self.access = AccessTracker(self.meta, submit=self._queue_write)
+        
+        # Vary header names of recently used resources, in least recently
+        # used order and backed by the sidecar store
+        self._vary: "OrderedDict[str, Tuple[str, ...]]" = OrderedDict()
         
         logger.info(
             "cache_initialized",
             directory=str(self.cache_dir),
             ttl=ttl,
-            max_size=max_size
+            max_size=max_size,
+            memory_max_entries=self.memory.max_entries,
+            memory_max_size=self.memory.max_size
         )
 
+    @staticmethod
+    def _normalize_url(request: Request) -> str:
+        """Normalize a request URL for use in cache keys.
+        
+        Scheme and host are lowercased, default ports and fragments are
+        dropped and query parameters are sorted.
+        
+        Args:
+            request: HTTP request
+            
+        Returns:
+            str: Normalized URL
+        """
+        url = request.url
+        netloc = url.host
+        if url.port is not None and DEFAULT_PORTS.get(url.scheme) != url.port:
+            netloc = f"{netloc}:{url.port}"
+        normalized = f"{url.scheme}://{netloc}{url.path}"
+        if url.query:
+            normalized += "?" + urlencode(sorted(url.params.multi_items()))
+        return normalized
+
+    @staticmethod
+    def _parse_vary(response: Response) -> Tuple[str, ...]:
+        """Parse the Vary header of a response into header names.
+        
+        Args:
+            response: HTTP response
+            
+        Returns:
+            Tuple[str, ...]: Sorted, lowercased header names
+        """
+        names = response.headers.get("Vary", "").split(",")
+        return tuple(sorted({name.strip().lower() for name in names if name.strip()}))
+
+    @staticmethod
+    def _resource(request: Request) -> str:
+        """Get the method and normalized URL identifying a request's resource."""
+        return f"{request.method} {APICache._normalize_url(request)}"
+
+    def _remember_vary(self, resource: str, vary: Tuple[str, ...]) -> None:
+        """Keep a resource's Vary header names in memory, evicting the oldest.
+        
+        Args:
+            resource: Method and normalized URL of the resource
+            vary: Header names the resource varies on
+        """
+        self._vary[resource] = vary
+        self._vary.move_to_end(resource)
+        while len(self._vary) > VARY_CACHE_ENTRIES:
+            self._vary.popitem(last=False)
+
+    def _read_vary(self, resource: str) -> Tuple[str, ...]:
+        """Read a resource's Vary header names from the sidecar store.
+        
+        Args:
+            resource: Method and normalized URL of the resource
+            
+        Returns:
+            Tuple[str, ...]: Header names the resource varies on
+        """
+        return tuple(self.meta.get(f"vary:{resource}", ()))
+
+    def _get_vary(self, resource: str) -> Tuple[str, ...]:
+        """Get the Vary header names learned for a resource.
+        
+        Async callers resolve them off the event loop with _load_vary first,
+        so this only reads the sidecar store for resources that have not
+        been looked up recently.
+        
+        Args:
+            resource: Method and normalized URL of the resource
+            
+        Returns:
+            Tuple[str, ...]: Header names the resource varies on
+        """
+        vary = self._vary.get(resource)
+        if vary is None:
+            vary = self._read_vary(resource)
+            self._remember_vary(resource, vary)
+        else:
+            self._vary.move_to_end(resource)
+        return vary
+
+    async def _load_vary(self, request: Request) -> None:
+        """Resolve the Vary header names of a request's resource off the loop.
+        
+        Args:
+            request: HTTP request
+        """
+        resource = self._resource(request)
+        if resource not in self._vary:
+            self._remember_vary(resource, await self._run_io(self._read_vary, resource))
+
+    def _learn_vary(self, request: Request, response: Response) -> None:
+        """Remember which request headers a resource varies on.
+        
+        Args:
+            request: HTTP request
+            response: HTTP response carrying the Vary header
+        """
+        resource = self._resource(request)
+        vary = self._parse_vary(response)
+        if self._get_vary(resource) != vary:
+            self._remember_vary(resource, vary)
+            self._queue_write(partial(self.meta.set, f"vary:{resource}", vary))
+
     def _generate_cache_key(self, request: Request) -> str:
         """Generate a unique cache key for a request.
         
+        The key covers the method, the normalized URL, the request body and
+        only those request headers named in the resource's Vary header, so
+        incidental headers such as User-Agent do not split the cache.
+        
         Args:
             request: HTTP request
             
         Returns:
             str: Cache key
         """
-        # Include relevant request information in key
-        key_parts = [
-            request.method,
-            str(request.url),
-            request.content.decode() if request.content else "",
-            str(sorted(request.headers.items()))
-        ]
+        resource = self._resource(request)
+        key_parts = [resource.encode()]
+        if request.content:
+            key_parts.append(request.content)
+        for name in self._get_vary(resource):
+            key_parts.append(f"{name}:{request.headers.get(name, '')}".encode())
         
-        # Create stable hash
-        key = hashlib.sha256("".join(key_parts).encode()).hexdigest()
+        # Keys are persisted, so they must be stable across processes, unlike
+        # hash(), and wide enough that collisions never serve the wrong body.
+        # The stdlib has no such non-cryptographic hash (crc32 is 32 bits),
+        # and a 128-bit blake2b costs well under a microsecond on keys this short
+        key = hashlib.blake2b(b"\n".join(key_parts), digest_size=16).hexdigest()
         logger.debug("cache_key_generated", key=key, url=str(request.url))
         return key
 
-    def _parse_cache_control(self, headers: Dict[str, str]) -> Dict[str, Any]:
+    def generate_key(self, request: Request) -> str:
+        """Get the cache key a request is stored under.
+        
+        Args:
+            request: HTTP request
+            
+        Returns:
+            str: Cache key
+        """
+        return self._generate_cache_key(request)
+
+    def _parse_cache_control(self, headers: Mapping[str, str]) -> Dict[str, Any]:
         """Parse Cache-Control header into a dictionary.
         
         Args:
@@ -125,7 +1033,7 @@ class APICache:
         Returns:
             Dict[str, Any]: Parsed cache control directives
         """
-        cache_control = {}
+        cache_control: Dict[str, Any] = {}
         
         if "Cache-Control" not in headers:
             return cache_control
@@ -158,19 +1066,64 @@ class APICache:
         Returns:
             bool: Whether the response should be cached
         """
-        # Never cache errors
-        if response.status_code >= 400:
+        # Never cache errors, except not-found results as negative entries
+        if response.status_code >= 400 and not self._is_negative(response):
             return False
             
         # Check cache control directives
         if cache_control.get("no-store", False):
             return False
             
-        if cache_control.get("private", False):
+        if cache_control.get("private", False):
+            return False
+            
+        # A response varying on everything can never be reused
+        if "*" in self._parse_vary(response):
+            return False
+            
+        # Honor endpoints configured as uncacheable
+        policy = self._get_policy(response.request)
+        if policy is not None and not policy.cacheable:
+            return False
+            
+        # Cache successful GET and HEAD requests by default
+        return response.request.method in ("GET", "HEAD")
+
+    def _is_negative(self, response: Response) -> bool:
+        """Check whether a response says the requested resource does not exist.
+        
+        Sleeper answers unknown identifiers either with a 404 or with a
+        null body.
+        
+        Args:
+            response: HTTP response
+            
+        Returns:
+            bool: Whether the response should be cached as a negative entry
+        """
+        if self.negative_ttl <= 0:
             return False
+        return response.status_code == 404 or (
+            response.status_code == 200 and response.content.strip() == b"null"
+        )
+
+    def _get_policy(self, request: Request) -> Optional[CachePolicy]:
+        """Find the caching policy for a request.
+        
+        Args:
+            request: HTTP request
             
-        # Cache successful GET and HEAD requests by default
-        return response.request.method in ("GET", "HEAD")
+        Returns:
+            Optional[CachePolicy]: First policy whose pattern matches the
+            whole request path below base_path, if any
+        """
+        path = request.url.path
+        if self.base_path and path.startswith(self.base_path + "/"):
+            path = path[len(self.base_path):]
+        for route, policy in self._routes:
+            if route.fullmatch(path):
+                return policy
+        return None
 
     def _get_ttl(
         self,
@@ -179,6 +1132,9 @@ class APICache:
     ) -> int:
         """Calculate time-to-live for a response.
         
+        Response directives take precedence over the endpoint policy, which
+        takes precedence over the default TTL.
+        
         Args:
             response: HTTP response
             cache_control: Parsed cache control directives
@@ -193,27 +1149,54 @@ class APICache:
         # Check for Expires header
         if "Expires" in response.headers:
             try:
-                expires = parse_date(response.headers["Expires"])
-                if expires > datetime.utcnow():
-                    return int((expires - datetime.utcnow()).total_seconds())
-            except (ValueError, TypeError):
-                pass
+                expires = _as_utc(parse_date(response.headers["Expires"]))
+            except (ValueError, OverflowError):
+                expires = None
+            if expires is not None:
+                remaining = (expires - datetime.now(timezone.utc)).total_seconds()
+                return max(int(remaining), 0)
                 
+        policy = self._get_policy(response.request)
+        if policy is not None and policy.ttl_seconds is not None:
+            return policy.ttl_seconds
         return self.ttl
 
-    def _create_cache_entry(
+    def _get_stale_window(
+        self,
+        request: Request,
+        cache_control: Dict[str, Any]
+    ) -> int:
+        """Calculate how long a stale response may be served while revalidating.
+        
+        Args:
+            request: HTTP request
+            cache_control: Parsed cache control directives
+            
+        Returns:
+            int: Stale-while-revalidate window in seconds
+        """
+        window = cache_control.get("stale-while-revalidate")
+        if isinstance(window, int):
+            return window
+            
+        policy = self._get_policy(request)
+        if policy is not None and policy.stale_while_revalidate_seconds is not None:
+            return policy.stale_while_revalidate_seconds
+        return self.stale_while_revalidate
+
+    def _create_cache_metadata(
         self,
         request: Request,
         response: Response
-    ) -> CacheEntry:
-        """Create a cache entry from a response.
+    ) -> CacheMetadata:
+        """Create cache metadata from response headers.
         
         Args:
             request: HTTP request
             response: HTTP response
             
         Returns:
-            CacheEntry: Cache entry
+            CacheMetadata: Cache metadata
         """
         cache_control = self._parse_cache_control(response.headers)
         
@@ -239,8 +1222,7 @@ class APICache:
             except ValueError:
                 pass
         
-        # Create metadata
-        metadata = CacheMetadata(
+        return CacheMetadata(
             url=str(request.url),
             method=request.method,
             etag=response.headers.get("ETag"),
@@ -249,13 +1231,30 @@ class APICache:
             expires=expires,
             date=date,
             vary_headers={
-                k: v for k, v in request.headers.items()
-                if k in response.headers.get("Vary", "").split(",")
+                name: request.headers[name]
+                for name in self._parse_vary(response)
+                if name in request.headers
             },
             created_at=datetime.utcnow(),
             accessed_at=datetime.utcnow(),
             access_count=1
         )
+
+    def _create_cache_entry(
+        self,
+        request: Request,
+        response: Response
+    ) -> CacheEntry:
+        """Create a cache entry from a response.
+        
+        Args:
+            request: HTTP request
+            response: HTTP response
+            
+        Returns:
+            CacheEntry: Cache entry
+        """
+        metadata = self._create_cache_metadata(request, response)
         
         return CacheEntry(
             status_code=response.status_code,
@@ -264,18 +1263,37 @@ class APICache:
             metadata=metadata
         )
 
-    def _update_cache_entry(self, entry: CacheEntry) -> CacheEntry:
-        """Update cache entry metadata on access.
+    def _entry_size(self, entry: CacheEntry) -> int:
+        """Approximate the in-memory footprint of a cache entry.
         
         Args:
-            entry: Cache entry to update
+            entry: Cache entry
             
         Returns:
-            CacheEntry: Updated cache entry
+            int: Size in bytes
         """
-        entry.metadata.accessed_at = datetime.utcnow()
-        entry.metadata.access_count += 1
-        return entry
+        header_size = sum(len(k) + len(v) for k, v in entry.headers.items())
+        return len(entry.content) + header_size
+
+    def _get_staleness(self, entry: CacheEntry) -> Optional[float]:
+        """Get how many seconds an entry is past its freshness lifetime.
+        
+        Args:
+            entry: Cache entry to check
+            
+        Returns:
+            Optional[float]: Seconds past the freshness lifetime (negative
+            while fresh), or None if the entry has no explicit lifetime
+        """
+        metadata = entry.metadata
+        if metadata.negative:
+            lifetime = metadata.ttl
+        else:
+            lifetime = metadata.cache_control.get("max-age", metadata.ttl)
+        if lifetime is None:
+            return None
+        age = (datetime.utcnow() - metadata.created_at).total_seconds()
+        return age - lifetime
 
     def _is_entry_fresh(
         self,
@@ -291,26 +1309,17 @@ class APICache:
         Returns:
             Tuple[bool, Optional[Dict[str, str]]]: (is_fresh, conditional_headers)
         """
-        now = datetime.utcnow()
         metadata = entry.metadata
+        if metadata.pinned:
+            return True, None
         
-        # Check cache control max-age
-        if "max-age" in metadata.cache_control:
-            age = (now - metadata.created_at).total_seconds()
-            if age > metadata.cache_control["max-age"]:
-                # Prepare conditional request headers
-                headers = {}
-                if metadata.etag:
-                    headers["If-None-Match"] = metadata.etag
-                if metadata.last_modified:
-                    headers["If-Modified-Since"] = formatdate(
-                        metadata.last_modified.timestamp(),
-                        usegmt=True
-                    )
-                return False, headers
+        # Check freshness lifetime
+        age = self._get_staleness(entry)
+        if age is not None and age > 0:
+            return False, self.get_conditional_headers(entry)
                 
         # Check expires header
-        if metadata.expires and now > metadata.expires:
+        if metadata.expires and datetime.now(timezone.utc) > _as_utc(metadata.expires):
             return False, None
             
         # Check vary headers
@@ -320,105 +1329,701 @@ class APICache:
                 
         return True, None
 
+    @staticmethod
+    def get_conditional_headers(entry: CacheEntry) -> Dict[str, str]:
+        """Build headers revalidating an entry with a conditional request.
+        
+        Args:
+            entry: Cache entry to revalidate
+            
+        Returns:
+            Dict[str, str]: If-None-Match and If-Modified-Since headers for
+            the entry's validators, empty if it has none
+        """
+        metadata = entry.metadata
+        headers = {}
+        if metadata.etag:
+            headers["If-None-Match"] = metadata.etag
+        if metadata.last_modified:
+            headers["If-Modified-Since"] = formatdate(
+                metadata.last_modified.timestamp(),
+                usegmt=True
+            )
+        return headers
+
+    async def _run_io(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking disk operation off the event loop.
+        
+        Args:
+            func: Blocking callable
+            *args: Arguments for the callable
+            
+        Returns:
+            Any: Result of the callable
+        """
+        if self._executor is None:
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def _read_pinned_sizes(self) -> Dict[str, int]:
+        """Read the size of every pinned entry, as counted against its budget.
+        
+        Sizes are stored as tags alongside the entries; entries written
+        without one are decoded to measure them.
+        
+        Returns:
+            Dict[str, int]: Approximate entry size in bytes by cache key
+        """
+        sizes = {}
+        for key in self.pinned.iterkeys():
+            value, size = self.pinned.get(key, read=True, tag=True)
+            if value is None:
+                continue
+            if size is None:
+                size = self._entry_size(self._decode(value))
+            elif not isinstance(value, (str, bytes)):
+                value.close()
+            sizes[key] = size
+        return sizes
+
+    def _read(self, key: str) -> Optional[Tuple[CacheEntry, Optional[float]]]:
+        """Read and decode an entry from disk.
+        
+        Runs on the I/O thread pool, so it must not touch the memory tier.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Optional[Tuple[CacheEntry, Optional[float]]]: (entry, expire_at)
+            if present on disk
+        """
+        if key in self._pinned_sizes:
+            value = self.pinned.get(key, read=True)
+            if value is not None:
+                return self._decode(value), None
+        
+        value, expire_at = self.cache.get(key, expire_time=True, read=True)
+        if value is None:
+            return None
+        entry = self._decode(value)
+                
+        # A revalidated entry keeps its body on disk; its refreshed
+        # metadata lives in the sidecar store
+        if (self._get_staleness(entry) or 0) > 0:
+            refreshed = self.meta.get(f"fresh:{key}")
+            if refreshed is not None:
+                metadata_json, entry.headers = refreshed
+                entry.metadata = CacheMetadata.model_validate_json(metadata_json)
+                
+        return entry, expire_at
+
+    def _encode(self, entry: CacheEntry) -> bytes:
+        """Encode an entry for disk, compressing its body if configured.
+        
+        Runs on the I/O thread pool.
+        
+        Args:
+            entry: Cache entry
+            
+        Returns:
+            bytes: Encoded entry
+        """
+        value = entry.to_bytes(
+            self.compression,
+            self.compression_level,
+            self.compression_min_size
+        )
+        _, _, flags, _, metadata_len, headers_len = ENTRY_HEADER.unpack_from(value)
+        if flags & (FLAG_ZLIB | FLAG_ZSTD):
+            # Bodies that did not shrink are stored as is and not counted
+            stored = len(value) - ENTRY_HEADER.size - metadata_len - headers_len
+            with self._codec_lock:
+                self._compressed_count += 1
+                self._uncompressed_bytes += len(entry.content)
+                self._compressed_bytes += stored
+        return value
+
+    def _decode(self, value: Union[str, bytes, BinaryIO]) -> CacheEntry:
+        """Decode an entry read from disk.
+        
+        Args:
+            value: Stored value, or a file handle for large values
+            
+        Returns:
+            CacheEntry: Decoded entry
+        """
+        if isinstance(value, str):
+            # Entries written before the binary format
+            return CacheEntry.model_validate_json(value)
+        if isinstance(value, bytes):
+            entry = CacheEntry.from_bytes(value)
+        else:
+            with value:
+                entry = CacheEntry.from_bytes(value)
+                
+        if entry._decompress_time is not None:
+            with self._codec_lock:
+                self._decompressed_count += 1
+                self._decompress_time += entry._decompress_time
+        return entry
+
+    async def _load(self, key: str) -> Optional[CacheEntry]:
+        """Load an entry from disk and promote it into the memory tier.
+        
+        Entries with queued writes are served from the write queue, so
+        reads never observe the disk state behind them.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Optional[CacheEntry]: Cached entry if present on disk
+        """
+        marker = self._pending.get(key)
+        superseded = False
+        loaded: Optional[Tuple[CacheEntry, Optional[float]]]
+        if marker is None:
+            loaded = await self._run_io(self._read, key)
+            
+            # A response stored while the read was in flight is newer than
+            # the disk copy, which must not replace it in memory
+            current = self.memory.get(key)
+            if current is not None:
+                return current
+            marker = self._pending.get(key)
+            superseded = marker is not None
+        if marker is not None:
+            loaded = marker[0]
+            if loaded is not None and loaded[1] <= time.time():
+                loaded = None
+            
+        if loaded is None:
+            # The entry expired or diskcache culled it, unless the key was
+            # written or deleted during the read, which keeps its own books
+            if not superseded:
+                self._disk_keys.pop(key, None)
+            self._l2_misses += 1
+            return None
+        self._l2_hits += 1
+        
+        entry, expire_at = loaded
+        if key in self._disk_keys:
+            self._disk_keys[key] = expire_at
+        self.memory.set(key, entry, self._entry_size(entry), expire_at)
+        return entry
+
+    def _discard(self, key: str) -> None:
+        """Remove an entry and its bookkeeping from every tier.
+        
+        Args:
+            key: Cache key
+        """
+        self.memory.delete(key)
+        self.access.discard(key)
+        self._disk_keys.pop(key, None)
+        self._pinned_bytes -= self._pinned_sizes.pop(key, 0)
+        self._queue_write(partial(self._delete_entry, key), key, None)
+
+    def _write_entry(self, key: str, entry: CacheEntry, expire: int) -> None:
+        """Write an entry to disk, replacing any refreshed metadata."""
+        self.cache.set(key, self._encode(entry), expire=expire)
+        self.meta.delete(f"fresh:{key}")
+
+    def _write_refresh(
+        self,
+        key: str,
+        expire: int,
+        metadata_json: str,
+        headers: Dict[str, str]
+    ) -> None:
+        """Extend an entry on disk and store its refreshed metadata."""
+        self.cache.touch(key, expire=expire)
+        self.meta.set(f"fresh:{key}", (metadata_json, headers), expire=expire)
+
+    def _write_pinned(self, key: str, entry: CacheEntry, size: int) -> None:
+        """Move an entry into the pinned tier, tagged with its size."""
+        self.pinned.set(key, self._encode(entry), tag=size)
+        self.cache.delete(key)
+        self.meta.delete(f"fresh:{key}")
+
+    def _delete_entry(self, key: str) -> None:
+        """Delete an entry and its refreshed metadata from disk."""
+        self.cache.delete(key)
+        self.pinned.delete(key)
+        self.meta.delete(f"fresh:{key}")
+
+    def _queue_write(
+        self,
+        write: Callable[[], None],
+        key: Optional[str] = None,
+        pending: Optional[Tuple[CacheEntry, float]] = None
+    ) -> None:
+        """Queue a disk write to be applied off the response path.
+        
+        Without a running event loop or I/O threads the write is applied
+        immediately.
+        
+        Args:
+            write: Blocking callable performing the write
+            key: Cache key of the entry the write affects, if any
+            pending: Entry and expiry readers should see until the write is
+                applied, or None if the write deletes the entry
+        """
+        marker = None
+        if key is not None:
+            marker = (pending,)
+            self._pending[key] = marker
+        self._writes.append((write, key, marker))
+        self._schedule_writes()
+
+    def _schedule_writes(self) -> None:
+        """Start draining the write queue unless a drain is already running."""
+        future = self._drain_future
+        if future is not None and not future.get_loop().is_closed():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None or self._executor is None:
+            self._complete_writes(self._drain_writes())
+            return
+            
+        self._drain_future = loop.run_in_executor(self._executor, self._drain_writes)
+        self._drain_future.add_done_callback(self._on_writes_drained)
+
+    def _drain_writes(self) -> List[Tuple[str, Any]]:
+        """Apply queued writes in batched transactions.
+        
+        Returns:
+            List[Tuple[str, Any]]: Keys and markers of the applied writes
+        """
+        done = []
+        with self._write_lock:
+            while self._writes:
+                with self.cache.transact():
+                    for _ in range(min(len(self._writes), WRITE_BATCH_SIZE)):
+                        write, key, marker = self._writes.popleft()
+                        try:
+                            write()
+                        except Exception as e:
+                            logger.warning("cache_write_failed", key=key, error=str(e))
+                        if key is not None:
+                            done.append((key, marker))
+                self._write_batches += 1
+        return done
+
+    def _complete_writes(self, done: List[Tuple[str, Any]]) -> None:
+        """Stop serving entries from the write queue once they are on disk.
+        
+        Args:
+            done: Keys and markers of the applied writes
+        """
+        for key, marker in done:
+            if self._pending.get(key) is marker:
+                del self._pending[key]
+
+    def _on_writes_drained(self, future: "asyncio.Future[Any]") -> None:
+        """Finish a background drain and start another if writes arrived."""
+        self._drain_future = None
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            logger.error("cache_drain_failed", error=str(future.exception()))
+        else:
+            self._complete_writes(future.result())
+        if self._writes:
+            self._schedule_writes()
+
+    def _apply_lifetime(
+        self,
+        request: Request,
+        response: Response,
+        cache_control: Dict[str, Any],
+        metadata: CacheMetadata
+    ) -> int:
+        """Record freshness lifetime and stale window on entry metadata.
+        
+        Args:
+            request: HTTP request
+            response: HTTP response the lifetime is derived from
+            cache_control: Parsed cache control directives
+            metadata: Metadata to update
+            
+        Returns:
+            int: Number of seconds the entry should be retained
+        """
+        if metadata.negative:
+            # Not-found results are neither served stale nor revalidated
+            metadata.ttl = self.negative_ttl
+            metadata.stale_while_revalidate = 0
+            return metadata.ttl
+            
+        metadata.ttl = self._get_ttl(response, cache_control)
+        metadata.stale_while_revalidate = self._get_stale_window(request, cache_control)
+        
+        # Entries outlive their freshness so that they can be served while
+        # revalidating, or revalidated with a conditional request when they
+        # carry validators, instead of being refetched
+        retention = metadata.stale_while_revalidate
+        if metadata.etag or metadata.last_modified:
+            retention = max(retention, REVALIDATION_WINDOW)
+        return metadata.ttl + retention
+
     async def get(
         self,
         request: Request
-    ) -> Optional[Tuple[Response, bool]]:
+    ) -> Optional[Tuple[CachedResponse, bool]]:
         """Get a cached response for a request.
         
         Args:
             request: HTTP request
             
         Returns:
-            Optional[Tuple[Response, bool]]: (response, is_fresh) if cached,
-            None if not cached
+            Optional[Tuple[CachedResponse, bool]]: (response, is_fresh) if
+            cached, None if not cached
         """
+        await self._load_vary(request)
         key = self._generate_cache_key(request)
-        entry = self.cache.get(key)
+        self.sketch.increment(key)
         
-        if not entry:
-            return None
-            
-        # Convert from JSON if needed
-        if isinstance(entry, str):
-            entry = CacheEntry.model_validate_json(entry)
+        # Serve from memory when possible, falling back to disk
+        entry = self.memory.get(key)
+        if entry is not None:
+            self._l1_hits += 1
+        else:
+            self._l1_misses += 1
+            entry = await self._load(key)
+            if entry is None:
+                return None
+        if key in self._disk_keys:
+            self._disk_keys.move_to_end(key)
             
         # Check freshness and get conditional headers
         is_fresh, conditional_headers = self._is_entry_fresh(entry, request)
         
-        if not is_fresh and conditional_headers:
-            # Return cached response with conditional headers
-            response = Response(
-                status_code=entry.status_code,
-                headers=entry.headers | conditional_headers,
-                content=entry.content,
-                request=request
+        if not is_fresh and conditional_headers is not None:
+            # Past its lifetime: serve it while revalidating when inside the
+            # stale window, otherwise hand back validators for a
+            # conditional request. Without an explicit lifetime, how stale
+            # the entry is cannot be told, so it is never served stale
+            staleness = self._get_staleness(entry)
+            serve_stale = (
+                staleness is not None
+                and staleness <= entry.metadata.stale_while_revalidate
             )
-            return response, False
+            if serve_stale or conditional_headers:
+                if serve_stale:
+                    self._stale_hits += 1
+                    self.access.record(key)
+                response = CachedResponse(
+                    entry,
+                    request,
+                    headers=entry.headers | conditional_headers,
+                    serve_stale=serve_stale,
+                    conditional_headers=conditional_headers
+                )
+                return response, False
             
         if not is_fresh:
             # Remove stale entry
-            self.cache.delete(key)
+            self._discard(key)
             return None
             
-        # Update access metadata
-        entry = self._update_cache_entry(entry)
-        self.cache.set(key, entry.model_dump_json())
+        # Track the access without rewriting the entry or its expiry
+        self.access.record(key)
+        if entry.metadata.negative:
+            self._negative_hits += 1
         
         # Return fresh cached response
-        response = Response(
-            status_code=entry.status_code,
-            headers=entry.headers,
-            content=entry.content,
-            request=request
-        )
-        return response, True
+        return CachedResponse(entry, request), True
 
     def set(
         self,
         request: Request,
-        response: Response
+        response: Response,
+        data: Any = _UNPARSED,
+        pin: bool = False
     ) -> None:
         """Cache a response.
         
         Args:
             request: HTTP request
             response: HTTP response to cache
+            data: Optional already parsed JSON body, kept in memory so that
+                cache hits skip decoding
+            pin: Whether the response never changes and belongs in the
+                pinned tier; it is cached normally if the tier is full
         """
         cache_control = self._parse_cache_control(response.headers)
         
         if not self._should_cache_response(response, cache_control):
             return
             
-        # Create and store cache entry
+        # Create and store cache entry under a key covering its Vary headers
+        self._learn_vary(request, response)
         key = self._generate_cache_key(request)
         entry = self._create_cache_entry(request, response)
-        ttl = self._get_ttl(response, cache_control)
+        size = self._entry_size(entry)
+        if size > self.max_size:
+            # Storing it would evict the rest of the disk cache
+            self._rejected += 1
+            logger.warning("cache_entry_too_large", url=str(request.url), size=size)
+            return
+        if data is not _UNPARSED:
+            entry.set_json(data)
+        entry.metadata.negative = self._is_negative(response)
+        if entry.metadata.negative:
+            self._negative_stores += 1
+        elif pin and self._pin_entry(key, entry, size):
+            return
+        expire = self._apply_lifetime(request, response, cache_control, entry.metadata)
+        expire_at = time.time() + expire
         
-        self.cache.set(key, entry.model_dump_json(), expire=ttl)
+        self.memory.set(key, entry, size, expire_at)
+        if not self._admit_to_disk(key, expire_at):
+            logger.debug("cache_admission_rejected", url=str(request.url))
+            return
+        self._queue_write(
+            partial(self._write_entry, key, entry, expire),
+            key,
+            (entry, expire_at)
+        )
         
         logger.debug(
             "response_cached",
             url=str(request.url),
-            ttl=ttl,
+            ttl=entry.metadata.ttl,
             size=len(response.content)
         )
 
+    async def refresh(
+        self,
+        request: Request,
+        response: Response
+    ) -> Optional[CacheEntry]:
+        """Renew a cached entry after a 304 Not Modified response.
+        
+        The entry's freshness and validators are updated from the 304
+        headers. Its body is left untouched on disk; only the disk expiry is
+        extended and the new metadata is written to the sidecar store.
+        
+        Args:
+            request: HTTP request that was revalidated
+            response: 304 Not Modified response
+            
+        Returns:
+            Optional[CacheEntry]: Refreshed entry, or None if it is no longer
+            cached
+        """
+        await self._load_vary(request)
+        key = self._generate_cache_key(request)
+        entry = self.memory.get(key) or await self._load(key)
+        if entry is None:
+            return None
+            
+        headers = dict(entry.headers)
+        for name in REVALIDATION_HEADERS:
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        merged = Response(
+            status_code=entry.status_code,
+            headers=headers,
+            request=request
+        )
+        cache_control = self._parse_cache_control(merged.headers)
+        
+        metadata = self._create_cache_metadata(request, merged)
+        metadata.access_count = entry.metadata.access_count
+        expire = self._apply_lifetime(request, merged, cache_control, metadata)
+        entry.headers = headers
+        entry.metadata = metadata
+        
+        expire_at = time.time() + expire
+        if key in self._disk_keys:
+            self._disk_keys[key] = expire_at
+        self.memory.set(key, entry, self._entry_size(entry), expire_at)
+        self._queue_write(
+            partial(
+                self._write_refresh, key, expire, metadata.model_dump_json(), headers
+            ),
+            key,
+            (entry, expire_at)
+        )
+        self._refreshes += 1
+        
+        logger.debug("cache_entry_refreshed", url=str(request.url), ttl=metadata.ttl)
+        return entry
+
+    def _admit_to_disk(self, key: str, expire_at: float) -> bool:
+        """Make room for an entry in the disk tier if it is worth it.
+        
+        When the disk tier holds max_entries responses, a new entry evicts
+        the least recently used one if it has expired, or otherwise only if
+        the new entry is accessed at least as often.
+        
+        Args:
+            key: Cache key of the entry to store
+            expire_at: Time at which the entry expires
+            
+        Returns:
+            bool: Whether the entry should be written to disk
+        """
+        if key in self._disk_keys:
+            self._disk_keys.move_to_end(key)
+            self._disk_keys[key] = expire_at
+            return True
+            
+        if self.max_entries is not None and len(self._disk_keys) >= self.max_entries:
+            victim, victim_expire_at = next(iter(self._disk_keys.items()), (None, None))
+            if victim is not None:
+                live = victim_expire_at is None or victim_expire_at > time.time()
+                if live and self.sketch.estimate(victim) > self.sketch.estimate(key):
+                    self._disk_rejected += 1
+                    return False
+                self._discard(victim)
+                self._disk_evictions += 1
+                
+        self._disk_keys[key] = expire_at
+        return True
+
+    def _pin_entry(self, key: str, entry: CacheEntry, size: int) -> bool:
+        """Move an entry into the pinned tier if its budget allows.
+        
+        Args:
+            key: Cache key
+            entry: Cache entry to pin
+            size: Approximate size of the entry in bytes
+            
+        Returns:
+            bool: Whether the entry was pinned
+        """
+        previous = self._pinned_sizes.get(key, 0)
+        if self._pinned_bytes - previous + size > self.pinned_max_size:
+            self._pinned_rejected += 1
+            logger.warning("cache_pinned_tier_full", url=entry.metadata.url, size=size)
+            return False
+        self._pinned_sizes[key] = size
+        self._pinned_bytes += size - previous
+        self._disk_keys.pop(key, None)
+            
+        entry.metadata.pinned = True
+        self.memory.set(key, entry, size)
+        self._queue_write(
+            partial(self._write_pinned, key, entry, size),
+            key,
+            (entry, float("inf"))
+        )
+        logger.debug("response_pinned", url=entry.metadata.url, size=size)
+        return True
+
+    async def pin(
+        self,
+        request: Request,
+        created_after: Optional[datetime] = None
+    ) -> bool:
+        """Move a cached response into the pinned tier.
+        
+        Pinned responses are always fresh and are never expired, evicted or
+        cleared along with the rest of the cache. Not-found and stale
+        responses are never pinned, since they may not be final.
+        
+        Args:
+            request: HTTP request whose cached response never changes
+            created_after: Only pin a response cached at or after this time
+                (naive UTC), such as when it became known to be final
+            
+        Returns:
+            bool: Whether the response is pinned
+        """
+        await self._load_vary(request)
+        key = self._generate_cache_key(request)
+        entry = self.memory.get(key) or await self._load(key)
+        if entry is None:
+            return False
+        metadata = entry.metadata
+        if metadata.pinned:
+            return True
+        staleness = self._get_staleness(entry)
+        if (
+            metadata.negative
+            or (staleness is not None and staleness > 0)
+            or (created_after is not None and metadata.created_at < created_after)
+        ):
+            logger.debug("cache_pin_refused", url=metadata.url)
+            return False
+        return self._pin_entry(key, entry, self._entry_size(entry))
+
     def delete(self, request: Request) -> None:
         """Remove a cached response.
         
         Args:
             request: HTTP request whose response should be removed
         """
-        key = self._generate_cache_key(request)
-        self.cache.delete(key)
+        self._discard(self._generate_cache_key(request))
         
         logger.debug("cache_entry_deleted", url=str(request.url))
 
-    def clear(self) -> None:
-        """Clear all cached responses."""
-        self.cache.clear()
-        logger.info("cache_cleared")
+    def clear(self, include_pinned: bool = False) -> None:
+        """Clear cached responses.
+        
+        Queued writes are discarded, unless pinned entries are kept, in
+        which case they are applied first so that no pinned entry is lost.
+        
+        Args:
+            include_pinned: Whether to clear the pinned tier as well
+        """
+        if not include_pinned:
+            self._complete_writes(self._drain_writes())
+        with self._write_lock:
+            self._writes.clear()
+            self._pending.clear()
+            self.memory.clear()
+            self.cache.clear()
+            self.access.clear()
+            self.meta.clear()
+            self._vary.clear()
+            self._disk_keys.clear()
+            if include_pinned:
+                self.pinned.clear()
+                self._pinned_sizes.clear()
+                self._pinned_bytes = 0
+        logger.info("cache_cleared", include_pinned=include_pinned)
+
+    def get_access_info(self, request: Request) -> Optional[Tuple[datetime, int]]:
+        """Get access information for a cached response.
+        
+        Args:
+            request: HTTP request whose cached response to look up
+            
+        Returns:
+            Optional[Tuple[datetime, int]]: (accessed_at, access_count) if the
+            cached response has been read
+        """
+        return self.access.get(self._generate_cache_key(request))
+
+    def flush(self) -> None:
+        """Persist pending access records and queued writes.
+        
+        Blocks until every write queued so far is on disk.
+        """
+        self.access.flush()
+        self._complete_writes(self._drain_writes())
+
+    async def drain(self) -> None:
+        """Wait until every write queued so far is on disk."""
+        self._complete_writes(await self._run_io(self._drain_writes))
+
+    def close(self) -> None:
+        """Persist queued writes and release threads and disk handles."""
+        self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self.cache.close()
+        self.meta.close()
+        self.pinned.close()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
@@ -426,21 +2031,55 @@ class APICache:
         Returns:
             Dict[str, Any]: Cache statistics
         """
+        hits, misses = self.cache.stats()
         stats = {
-            "size": self.cache.size,
+            "size": self.cache.volume(),
             "max_size": self.max_size,
+            "max_entries": self.max_entries,
             "directory": str(self.cache_dir),
             "entry_count": len(self.cache),
-            "hit_count": self.cache.stats(enable=True)["hits"],
-            "miss_count": self.cache.stats(enable=True)["misses"]
+            "hit_count": hits,
+            "miss_count": misses,
+            "hit_ratio": self._ratio(hits, misses),
+            "l1_entry_count": len(self.memory),
+            "l1_size": self.memory.size,
+            "l1_max_entries": self.memory.max_entries,
+            "l1_max_size": self.memory.max_size,
+            "l1_hit_count": self._l1_hits,
+            "l1_miss_count": self._l1_misses,
+            "l1_hit_ratio": self._ratio(self._l1_hits, self._l1_misses),
+            "l1_rejected_count": self.memory.rejected,
+            "l2_hit_count": self._l2_hits,
+            "l2_miss_count": self._l2_misses,
+            "l2_hit_ratio": self._ratio(self._l2_hits, self._l2_misses),
+            "l2_rejected_count": self._disk_rejected,
+            "l2_eviction_count": self._disk_evictions,
+            "stale_hit_count": self._stale_hits,
+            "refresh_count": self._refreshes,
+            "negative_ttl": self.negative_ttl,
+            "negative_store_count": self._negative_stores,
+            "negative_hit_count": self._negative_hits,
+            "pending_writes": len(self._writes),
+            "write_batches": self._write_batches,
+            "rejected_count": self._rejected,
+            "pinned_entry_count": len(self._pinned_sizes),
+            "pinned_size": self._pinned_bytes,
+            "pinned_max_size": self.pinned_max_size,
+            "pinned_rejected_count": self._pinned_rejected,
+            "compression": self.compression,
+            "compressed_count": self._compressed_count,
+            "compression_ratio": (
+                self._uncompressed_bytes / self._compressed_bytes
+                if self._compressed_bytes else 0.0
+            ),
+            "decompressed_count": self._decompressed_count,
+            "decompress_cpu_seconds": self._decompress_time,
         }
-        
-        if stats["hit_count"] + stats["miss_count"] > 0:
-            stats["hit_ratio"] = (
-                stats["hit_count"] /
-                (stats["hit_count"] + stats["miss_count"])
-            )
-        else:
-            stats["hit_ratio"] = 0.0
             
         return stats
+
+    @staticmethod
+    def _ratio(hits: int, misses: int) -> float:
+        """Compute a hit ratio, guarding against division by zero."""
+        total = hits + misses
+        return hits / total if total else 0.0
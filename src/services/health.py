@@ -0,0 +1,202 @@
+"""Upstream health tracking for the Sleeper API.
+
+Health probes must not spend rate limit budget or wait on the network, so
+upstream status is tracked passively: the API client records the outcome of
+every upstream request it sends, and probes answer from that in-memory
+record. When traffic is quiet, or served entirely from the cache, a
+background canary sends a request at a fixed interval to keep the record
+current.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Optional
+
+from fastapi import HTTPException
+from structlog import get_logger
+
+if TYPE_CHECKING:
+    from .sleeper import SleeperAPIClient
+
+logger = get_logger(__name__)
+
+HEALTHY = "healthy"
+DEGRADED = "degraded"
+UNHEALTHY = "unhealthy"
+UNKNOWN = "unknown"
+
+CANARY_PATH = "/state/nfl"
+
+
+class UpstreamHealth:
+    """Rolling record of recent upstream request outcomes."""
+
+    def __init__(self, window_size: int = 20, failure_threshold: int = 3):
+        """Initialize the health record.
+
+        Args:
+            window_size: Number of recent outcomes to keep
+            failure_threshold: Consecutive failures after which the upstream
+                is considered unhealthy
+        """
+        self.failure_threshold = max(failure_threshold, 1)
+        self._outcomes: Deque[bool] = deque(maxlen=max(window_size, 1))
+        self._consecutive_failures = 0
+        self._last_success: Optional[float] = None
+        self._last_failure: Optional[float] = None
+        self._last_error: Optional[str] = None
+        self._last_latency: Optional[float] = None
+
+    @property
+    def last_outcome(self) -> Optional[float]:
+        """Time of the most recent recorded outcome, if any."""
+        times = [t for t in (self._last_success, self._last_failure) if t is not None]
+        return max(times) if times else None
+
+    @property
+    def last_error(self) -> Optional[str]:
+        """Error of the most recent failure, if any."""
+        return self._last_error
+
+    def record_success(self, latency: Optional[float] = None) -> None:
+        """Record a request that the upstream answered.
+
+        Args:
+            latency: Seconds the request took, if measured
+        """
+        self._outcomes.append(True)
+        self._consecutive_failures = 0
+        self._last_success = time.time()
+        self._last_latency = latency
+
+    def record_failure(self, error: str) -> None:
+        """Record a request that the upstream failed to answer.
+
+        Args:
+            error: Description of the failure
+        """
+        self._outcomes.append(False)
+        self._consecutive_failures += 1
+        self._last_failure = time.time()
+        self._last_error = error
+
+    @property
+    def status(self) -> str:
+        """Current upstream status.
+
+        The upstream is unhealthy after failure_threshold consecutive
+        failures, degraded while any recent request failed, and unknown
+        until a first outcome is recorded.
+        """
+        if not self._outcomes:
+            return UNKNOWN
+        if self._consecutive_failures >= self.failure_threshold:
+            return UNHEALTHY
+        if not all(self._outcomes):
+            return DEGRADED
+        return HEALTHY
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get health statistics.
+
+        Returns:
+            Dict[str, Any]: Health statistics
+        """
+        failures = self._outcomes.count(False)
+        return {
+            "status": self.status,
+            "recent_requests": len(self._outcomes),
+            "recent_failures": failures,
+            "consecutive_failures": self._consecutive_failures,
+            "last_success": self._last_success,
+            "last_failure": self._last_failure,
+            "last_error": self._last_error,
+            "last_latency_seconds": self._last_latency,
+        }
+
+
+class HealthCanary:
+    """Background task that probes the upstream when traffic is quiet."""
+
+    def __init__(self, client: "SleeperAPIClient", interval: float = 30.0):
+        """Initialize the canary.
+
+        Args:
+            client: Sleeper API client whose health record to keep current
+            interval: Seconds between canary checks
+        """
+        self.client = client
+        self.interval = interval
+
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._checks = 0
+        self._skipped = 0
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start checking in the background."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop checking and wait for the background task to finish."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    async def _run(self) -> None:
+        """Check repeatedly at the configured interval."""
+        while True:
+            try:
+                await self.check_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("health_canary_error", error=str(e))
+            await asyncio.sleep(self.interval)
+
+    async def check_once(self) -> bool:
+        """Probe the upstream unless a request was recorded recently.
+
+        The probe refreshes the cached NFL state through the client, so it
+        is paced by the rate limiter and recorded like any other request.
+
+        Returns:
+            bool: Whether a probe was sent
+        """
+        health = self.client.health
+        last_outcome = health.last_outcome
+        if last_outcome is not None and time.time() - last_outcome < self.interval:
+            self._skipped += 1
+            return False
+
+        self._checks += 1
+        try:
+            await self.client.refresh(CANARY_PATH)
+        except HTTPException as e:
+            logger.warning("health_canary_failed", status_code=e.status_code)
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get canary statistics.
+
+        Returns:
+            Dict[str, Any]: Canary statistics
+        """
+        return {
+            "running": self.running,
+            "interval_seconds": self.interval,
+            "checks": self._checks,
+            "skipped": self._skipped,
+        }
@@ -0,0 +1,265 @@
+"""In-memory NFL player database.
+
+Sleeper's /players/nfl endpoint returns a map of roughly ten thousand players
+that is several megabytes large and changes about once a day. This module
+keeps that map in a compact columnar layout instead of as ten thousand
+pydantic objects:
+- One list or array per field, with repeated strings interned
+- Hash indexes for lookups by id, name, team and position
+- A sorted name index for prefix searches
+- Lightweight __slots__ records built only for returned results
+"""
+
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+from ..models import Player
+
+PLAYER_REFRESH_INTERVAL = 24 * 60 * 60  # Refresh the player map once a day
+NO_NUMBER = -1
+MAX_NUMBER = 2**15 - 1  # Largest number the "h" number column can hold
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern a repeated string value, passing None through."""
+    return sys.intern(value) if value else None
+
+
+def _parse_number(value: Any) -> int:
+    """Coerce a jersey number as the Player model would.
+    
+    Numeric strings and integral floats are accepted. Missing, invalid and
+    out-of-range numbers are stored as NO_NUMBER.
+    """
+    if isinstance(value, float) and not value.is_integer():
+        return NO_NUMBER
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        return NO_NUMBER
+    return number if 0 <= number <= MAX_NUMBER else NO_NUMBER
+
+
+class PlayerRecord:
+    """Lightweight view of a single player row."""
+
+    __slots__ = ("player_id", "full_name", "position", "team", "number", "status")
+
+    def __init__(
+        self,
+        player_id: str,
+        full_name: str,
+        position: Optional[str],
+        team: Optional[str],
+        number: Optional[int],
+        status: Optional[str],
+    ):
+        self.player_id = player_id
+        self.full_name = full_name
+        self.position = position
+        self.team = team
+        self.number = number
+        self.status = status
+
+    def to_model(self) -> Player:
+        """Convert the record into a Player model.
+
+        Returns:
+            Player: Player model
+        """
+        return Player.model_construct(
+            player_id=self.player_id,
+            full_name=self.full_name,
+            position=self.position or "",
+            team=self.team,
+            number=self.number,
+            status=self.status,
+        )
+
+
+class PlayerStore:
+    """Columnar, indexed store of NFL players."""
+
+    def __init__(self) -> None:
+        """Initialize an empty player store."""
+        self.loaded_at: Optional[float] = None
+
+        # Columns, one entry per row
+        self._ids: List[str] = []
+        self._names: List[str] = []
+        self._positions: List[Optional[str]] = []
+        self._teams: List[Optional[str]] = []
+        self._statuses: List[Optional[str]] = []
+        self._numbers = array("h")
+
+        # Indexes mapping keys to row numbers
+        self._by_id: Dict[str, int] = {}
+        self._by_name: Dict[str, "array[int]"] = {}
+        self._by_team: Dict[str, "array[int]"] = {}
+        self._by_position: Dict[str, "array[int]"] = {}
+        self._sorted_names: List[str] = []
+        self._sorted_rows = array("I")
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @classmethod
+    def from_players(cls, players: Dict[str, Dict[str, Any]]) -> "PlayerStore":
+        """Build a store from the /players/nfl response.
+
+        Args:
+            players: Map of player IDs to raw player objects
+
+        Returns:
+            PlayerStore: Populated player store
+        """
+        store = cls()
+        for player_id, player in players.items():
+            store._append(player_id, player)
+
+        names = store._names
+        order = sorted(range(len(names)), key=lambda row: names[row].lower())
+        store._sorted_names = [store._names[row].lower() for row in order]
+        store._sorted_rows = array("I", order)
+        store.loaded_at = time.time()
+        return store
+
+    def _append(self, player_id: str, player: Dict[str, Any]) -> None:
+        """Add a raw player object as a new row."""
+        full_name = player.get("full_name") or " ".join(
+            part for part in (player.get("first_name"), player.get("last_name")) if part
+        )
+        row = len(self._ids)
+
+        self._ids.append(player_id)
+        self._names.append(full_name)
+        self._positions.append(_intern(player.get("position")))
+        self._teams.append(_intern(player.get("team")))
+        self._statuses.append(_intern(player.get("status")))
+        self._numbers.append(_parse_number(player.get("number")))
+
+        self._by_id[player_id] = row
+        self._index(self._by_name, full_name.lower(), row)
+        self._index(self._by_team, self._teams[row], row)
+        self._index(self._by_position, self._positions[row], row)
+
+    @staticmethod
+    def _index(index: Dict[str, "array[int]"], key: Optional[str], row: int) -> None:
+        """Add a row to a secondary index."""
+        if not key:
+            return
+        rows = index.get(key)
+        if rows is None:
+            index[sys.intern(key)] = array("I", (row,))
+        else:
+            rows.append(row)
+
+    def _record(self, row: int) -> PlayerRecord:
+        """Build a record for a row."""
+        number = self._numbers[row]
+        return PlayerRecord(
+            player_id=self._ids[row],
+            full_name=self._names[row],
+            position=self._positions[row],
+            team=self._teams[row],
+            number=None if number == NO_NUMBER else number,
+            status=self._statuses[row],
+        )
+
+    def is_stale(self, max_age: float = PLAYER_REFRESH_INTERVAL) -> bool:
+        """Check whether the store should be reloaded.
+
+        Args:
+            max_age: Maximum age of the loaded data in seconds
+
+        Returns:
+            bool: Whether the store is empty or older than max_age
+        """
+        return self.loaded_at is None or time.time() - self.loaded_at > max_age
+
+    def get(self, player_id: str) -> Optional[PlayerRecord]:
+        """Look up a player by ID.
+
+        Args:
+            player_id: Sleeper player ID
+
+        Returns:
+            Optional[PlayerRecord]: Player if found
+        """
+        row = self._by_id.get(player_id)
+        return None if row is None else self._record(row)
+
+    def _rows_with_name(self, name: str) -> Sequence[int]:
+        """Get rows whose name equals, or otherwise starts with, a name."""
+        name = name.lower()
+        rows = self._by_name.get(name)
+        if rows is not None:
+            return rows
+
+        start = bisect_left(self._sorted_names, name)
+        end = start
+        sorted_names = self._sorted_names
+        while end < len(sorted_names) and sorted_names[end].startswith(name):
+            end += 1
+        return self._sorted_rows[start:end]
+
+    def iter_search(
+        self,
+        name: Optional[str] = None,
+        team: Optional[str] = None,
+        position: Optional[str] = None,
+    ) -> Iterator[PlayerRecord]:
+        """Lazily find players matching all of the given criteria.
+
+        Names match case-insensitively, exactly if possible and by prefix
+        otherwise. Teams and positions match exactly on their upper-case code.
+
+        Args:
+            name: Full name or name prefix
+            team: NFL team abbreviation (e.g., "KC")
+            position: Position code (e.g., "QB")
+
+        Yields:
+            PlayerRecord: Matching players
+        """
+        candidates: List[Sequence[int]] = []
+        if name:
+            candidates.append(self._rows_with_name(name))
+        if team:
+            candidates.append(self._by_team.get(team.upper(), ()))
+        if position:
+            candidates.append(self._by_position.get(position.upper(), ()))
+        if not candidates:
+            return
+
+        # Scan the smallest candidate set and filter by the others
+        candidates.sort(key=len)
+        filters = [set(other) for other in candidates[1:]]
+        for row in candidates[0]:
+            if all(row in allowed for allowed in filters):
+                yield self._record(row)
+
+    def search(
+        self,
+        name: Optional[str] = None,
+        team: Optional[str] = None,
+        position: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[PlayerRecord]:
+        """Find players matching all of the given criteria.
+
+        Args:
+            name: Full name or name prefix
+            team: NFL team abbreviation (e.g., "KC")
+            position: Position code (e.g., "QB")
+            limit: Maximum number of players to return
+
+        Returns:
+            List[PlayerRecord]: Matching players
+        """
+        records = self.iter_search(name=name, team=team, position=position)
+        return list(islice(records, limit))
@@ -0,0 +1,203 @@
+"""Background prefetching of Sleeper data into the API cache.
+
+The scheduler periodically refreshes the NFL state and a configured set of
+leagues so that the first request for them is answered from the cache. How
+often it runs follows the NFL calendar: rarely in the offseason, more often
+during the season and most often on game days, when league data changes
+while games are played. Every fetch goes through the API client, so it is
+paced by the client's rate limiter and coalesced with identical requests.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from zoneinfo import ZoneInfo
+
+from fastapi import HTTPException
+from structlog import get_logger
+
+from ..config.settings import PrefetchConfig
+from ..models import NFLState
+from .sleeper import SleeperAPIClient
+
+logger = get_logger(__name__)
+
+OFFSEASON = "off"
+RETRY_INTERVAL = 60.0  # Seconds to wait before retrying a failed run
+
+
+class PrefetchScheduler:
+    """Periodically prefetches NFL state and tracked leagues."""
+
+    def __init__(
+        self,
+        client: SleeperAPIClient,
+        config: Optional[PrefetchConfig] = None
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            client: Sleeper API client to prefetch through
+            config: Prefetch configuration (default: client.config.prefetch)
+        """
+        self.client = client
+        self.config = config or client.config.prefetch
+        self.league_ids: List[str] = list(dict.fromkeys(self.config.league_ids))
+        self.timezone = ZoneInfo(self.config.timezone)
+
+        self._task: Optional["asyncio.Task[None]"] = None
+        self._runs = 0
+        self._prefetched = 0
+        self._failures = 0
+        self._last_run: Optional[float] = None
+        self._next_interval: Optional[float] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether prefetching is configured to run.
+        
+        Unless set explicitly, it runs only when leagues are tracked: the
+        NFL state alone is kept current by the health canary.
+        """
+        if self.config.enabled is None:
+            return bool(self.league_ids)
+        return self.config.enabled
+
+    @property
+    def running(self) -> bool:
+        """Whether the background task is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start prefetching in the background."""
+        if self.running:
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.info("prefetch_started", leagues=len(self.league_ids))
+
+    async def stop(self) -> None:
+        """Stop prefetching and wait for the background task to finish."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        logger.info("prefetch_stopped")
+
+    async def _run(self) -> None:
+        """Prefetch repeatedly, sleeping for an interval after each run."""
+        while True:
+            try:
+                state = await self.run_once()
+                interval = self.next_interval(state)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("prefetch_failed", error=str(e))
+                interval = RETRY_INTERVAL
+            self._next_interval = interval
+            await asyncio.sleep(interval)
+
+    async def _refresh(self, path: str) -> bool:
+        """Refresh a single path, logging rather than raising failures.
+
+        Args:
+            path: API path to refresh
+
+        Returns:
+            bool: Whether the path was refreshed
+        """
+        try:
+            await self.client.refresh(path)
+        except HTTPException as e:
+            self._failures += 1
+            logger.warning(
+                "prefetch_request_failed", path=path, status_code=e.status_code
+            )
+            return False
+        self._prefetched += 1
+        return True
+
+    async def run_once(self) -> Optional[NFLState]:
+        """Prefetch the NFL state and every tracked league once.
+
+        Leagues are prefetched one at a time, with their league, rosters and
+        users requests in parallel, so a run takes at most three rate limit
+        tokens at once and leaves capacity for user requests.
+
+        Returns:
+            Optional[NFLState]: Current NFL state, or None if it could not be
+            fetched
+        """
+        state = None
+        if await self._refresh("/state/nfl"):
+            state = await self.client.get_nfl_state()
+
+        for league_id in self.league_ids:
+            await asyncio.gather(
+                self._refresh(f"/league/{league_id}"),
+                self._refresh(f"/league/{league_id}/rosters"),
+                self._refresh(f"/league/{league_id}/users"),
+            )
+
+        self._runs += 1
+        self._last_run = time.time()
+        logger.debug("prefetch_completed", leagues=len(self.league_ids))
+        return state
+
+    def is_game_day(self, now: Optional[datetime] = None) -> bool:
+        """Check whether a moment falls on a configured game day.
+
+        Args:
+            now: Moment to check (default: now)
+
+        Returns:
+            bool: Whether it is a game day in the configured timezone
+        """
+        if now is None:
+            now = datetime.now(self.timezone)
+        else:
+            now = now.astimezone(self.timezone)
+        return now.weekday() in self.config.game_days
+
+    def next_interval(
+        self,
+        state: Optional[NFLState],
+        now: Optional[datetime] = None
+    ) -> float:
+        """Get the delay until the next run for the current point in the season.
+
+        Args:
+            state: Current NFL state, or None if it is unknown
+            now: Current time (default: now)
+
+        Returns:
+            float: Seconds until the next run
+        """
+        if state is None:
+            return RETRY_INTERVAL
+        if state.season_type == OFFSEASON:
+            return self.config.offseason_interval_seconds
+        if state.season_type != "pre" and self.is_game_day(now):
+            return self.config.game_day_interval_seconds
+        return self.config.season_interval_seconds
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get prefetch statistics.
+
+        Returns:
+            Dict[str, Any]: Prefetch statistics
+        """
+        return {
+            "running": self.running,
+            "leagues": len(self.league_ids),
+            "runs": self._runs,
+            "prefetched": self._prefetched,
+            "failures": self._failures,
+            "last_run": self._last_run,
+            "next_interval_seconds": self._next_interval,
+        }
@@ -0,0 +1,139 @@
+"""Rate limiting for upstream Sleeper API requests.
+
+This module provides an asynchronous token bucket that paces callers instead
+of rejecting them outright. Each acquisition reserves a token in O(1) time;
+callers that arrive while the bucket is empty are told how long to wait for
+their reserved slot, which keeps waiting coroutines in arrival order.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+
+from structlog import get_logger
+
+logger = get_logger(__name__)
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request cannot be admitted within its deadline."""
+
+    def __init__(self, retry_after: float):
+        """Initialize the exception.
+
+        Args:
+            retry_after: Seconds until a token would have been available
+        """
+        super().__init__(f"Rate limit exceeded, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """Asynchronous token bucket rate limiter."""
+
+    def __init__(
+        self,
+        rate_per_minute: int,
+        burst: Optional[int] = None,
+        max_wait: float = 0.0
+    ):
+        """Initialize the token bucket.
+
+        Args:
+            rate_per_minute: Sustained number of requests allowed per minute
+            burst: Maximum number of requests that may be made back to back,
+                capped at rate_per_minute (default: rate_per_minute)
+            max_wait: Default number of seconds a caller may wait for a token
+        """
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(min(burst or rate_per_minute, rate_per_minute))
+        self.max_wait = max_wait
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+        self._acquired = 0
+        self._throttled = 0
+        self._rejected = 0
+        self._total_wait = 0.0
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity,
+            self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def reserve(self, max_wait: Optional[float] = None) -> float:
+        """Reserve a token without waiting for it.
+
+        Args:
+            max_wait: Maximum acceptable delay in seconds (default: max_wait
+                given at construction)
+
+        Returns:
+            float: Seconds to wait before the reserved token may be used
+
+        Raises:
+            RateLimitExceeded: If the token would not be available in time
+        """
+        if max_wait is None:
+            max_wait = self.max_wait
+
+        self._refill()
+        self._tokens -= 1
+        if self._tokens >= 0:
+            self._acquired += 1
+            return 0.0
+
+        delay = -self._tokens / self.rate
+        if delay > max_wait:
+            self._tokens += 1
+            self._rejected += 1
+            raise RateLimitExceeded(delay)
+
+        self._acquired += 1
+        self._throttled += 1
+        self._total_wait += delay
+        return delay
+
+    async def acquire(self, max_wait: Optional[float] = None) -> None:
+        """Wait until a token is available.
+
+        Args:
+            max_wait: Maximum number of seconds to wait (default: max_wait
+                given at construction)
+
+        Raises:
+            RateLimitExceeded: If the token would not be available in time
+        """
+        delay = self.reserve(max_wait)
+        if not delay:
+            return
+
+        logger.debug("rate_limit_wait", delay=delay)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            # Hand the unused reservation back to later callers
+            self._tokens += 1
+            raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get rate limiter statistics.
+
+        Returns:
+            Dict[str, Any]: Rate limiter statistics
+        """
+        self._refill()
+        return {
+            "rate_per_second": self.rate,
+            "capacity": self.capacity,
+            "available_tokens": max(self._tokens, 0.0),
+            "acquired": self._acquired,
+            "throttled": self._throttled,
+            "rejected": self._rejected,
+            "total_wait_seconds": self._total_wait,
+        }
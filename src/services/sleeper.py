@@ -5,83 +5,175 @@ handling rate limiting, caching, and error handling.
 """
 
 import asyncio
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Union
+import importlib.util
+import re
+import time
+from datetime import datetime
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 import httpx
 from fastapi import HTTPException
+from pydantic import BaseModel
 from structlog import get_logger
 
 from ..config import Config, get_config
 from ..models import League, NFLState, Player, Roster, User
-from .cache import APICache
+from .cache import APICache, CachedResponse
+from .health import UpstreamHealth
+from .players import PLAYER_REFRESH_INTERVAL, PlayerStore
+from .rate_limit import RateLimitExceeded, TokenBucket
 
 logger = get_logger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Paths under a league whose responses stop changing once it is archived
+LEAGUE_PATH = re.compile(r"/league/([^/]+)(?:/|$)")
+ARCHIVED_LEAGUE_STATUS = "complete"
+# League paths pinned once the league is archived, starting with the league
+PIN_SUFFIXES = ("", "/rosters", "/users")
+
+
+def _http2_available() -> bool:
+    """Check whether httpx can negotiate HTTP/2 (requires the h2 package)."""
+    return importlib.util.find_spec("h2") is not None
+
 
 class SleeperAPIClient:
     """Client for interacting with the Sleeper API with comprehensive caching."""
 
-    def __init__(self, config: Optional[Config] = None):
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        cache: Optional[APICache] = None,
+    ):
         """Initialize the Sleeper API client.
         
         Args:
             config: Optional configuration override
+            cache: Optional cache to use instead of one built from the
+                configuration; it is closed together with the client
         """
         self.config = config or get_config()
         self.base_url = str(self.config.sleeper_api.base_url)
         
-        # Initialize HTTP client with custom transport for caching
+        # Initialize HTTP client with a tuned connection pool
+        api_config = self.config.sleeper_api
+        self.http2 = api_config.http2 and _http2_available()
+        if api_config.http2 and not self.http2:
+            logger.warning("http2_unavailable", hint="pip install 'httpx[http2]'")
         self._client = httpx.AsyncClient(
-            timeout=self.config.sleeper_api.timeout_seconds,
+            timeout=api_config.timeout_seconds,
             base_url=self.base_url,
+            limits=httpx.Limits(
+                max_connections=api_config.max_connections,
+                max_keepalive_connections=api_config.max_keepalive_connections,
+                keepalive_expiry=api_config.keepalive_expiry_seconds,
+            ),
+            http2=self.http2,
         )
         
         # Setup caching
-        self.cache = APICache(
+        self.cache = cache or APICache(
             ttl=self.config.cache.ttl_seconds,
-            max_size=self.config.cache.max_size
+            max_size=self.config.cache.max_size_bytes,
+            max_entries=self.config.cache.max_entries,
+            memory_max_entries=self.config.cache.memory_max_entries,
+            memory_max_size=self.config.cache.memory_max_size_bytes,
+            stale_while_revalidate=self.config.cache.stale_while_revalidate_seconds,
+            policies=self.config.cache.policies,
+            base_path=httpx.URL(self.base_url).path,
+            io_workers=self.config.cache.io_workers,
+            pinned_max_size=self.config.cache.pinned_max_size_bytes,
+            compression=self.config.cache.compression,
+            compression_level=self.config.cache.compression_level,
+            compression_min_size=self.config.cache.compression_min_size_bytes,
+            negative_ttl=self.config.cache.negative_ttl_seconds,
         )
+        self._archived_leagues: Set[str] = set()
+        # Background revalidations pinning entries of archived leagues
+        self._pin_tasks: Set["asyncio.Future[None]"] = set()
         
         # Setup rate limiting
-        self._request_times: List[datetime] = []
-        self._rate_limit = self.config.sleeper_api.rate_limit_per_minute
+        self.rate_limiter = TokenBucket(
+            rate_per_minute=self.config.sleeper_api.rate_limit_per_minute,
+            burst=self.config.sleeper_api.rate_limit_burst,
+            max_wait=self.config.sleeper_api.rate_limit_max_wait_seconds,
+        )
+        
+        # Player database, loaded on first use and refreshed daily
+        self.players = PlayerStore()
+        self._players_lock = asyncio.Lock()
+        
+        # Upstream requests in flight, keyed by cache key
+        self._inflight: Dict[str, "asyncio.Future[Any]"] = {}
+        self.health = UpstreamHealth(
+            window_size=self.config.health.window_size,
+            failure_threshold=self.config.health.failure_threshold,
+        )
+        
+        self._stats = {
+            "upstream_requests": 0,
+            "coalesced_requests": 0,
+            "stale_responses": 0,
+            "background_revalidations": 0,
+            "full_fetches": 0,
+            "revalidated_responses": 0,
+            "revalidated_bytes": 0,
+        }
 
     async def _check_rate_limit(self) -> None:
-        """Check and enforce rate limiting.
+        """Wait for rate limit capacity.
         
         Raises:
-            HTTPException: If rate limit would be exceeded
+            HTTPException: If capacity will not be available within the
+                configured maximum wait
         """
-        now = datetime.now()
-        minute_ago = now - timedelta(minutes=1)
-        
-        # Remove old requests from tracking
-        self._request_times = [t for t in self._request_times if t > minute_ago]
-        
-        if len(self._request_times) >= self._rate_limit:
+        try:
+            await self.rate_limiter.acquire()
+        except RateLimitExceeded as e:
+            logger.warning("rate_limit_exceeded", retry_after=e.retry_after)
             raise HTTPException(
                 status_code=429,
-                detail="Rate limit exceeded. Please try again later."
-            )
-        
-        self._request_times.append(now)
+                detail="Rate limit exceeded. Please try again later.",
+                headers={"Retry-After": str(int(e.retry_after) + 1)},
+            ) from e
 
     async def _make_request(
         self,
         method: str,
         path: str,
+        model: Optional[Type[BaseModel]] = None,
+        many: bool = False,
         **kwargs: Any,
     ) -> Any:
         """Make a cached, rate-limited request to the Sleeper API.
         
+        Concurrent identical GET requests that miss the cache are coalesced
+        into a single upstream call whose result is shared by all callers.
+        When a model is given, cache hits reuse the models validated for the
+        cache entry instead of validating the body again.
+        
         Args:
             method: HTTP method to use
             path: API path to request
+            model: Optional model to validate the response body with
+            many: Whether the body is a list of model instances
             **kwargs: Additional arguments to pass to httpx
             
         Returns:
-            Any: Parsed JSON response
+            Any: Parsed JSON response, or validated model(s) if model is set
             
         Raises:
             HTTPException: If the request fails
@@ -95,32 +187,196 @@ class SleeperAPIClient:
             response, is_fresh = cache_result
             if is_fresh:
                 logger.debug("cache_hit", path=path)
-                return response.json()
-            elif "If-None-Match" in response.headers or "If-Modified-Since" in response.headers:
-                # Use cached response for conditional request
-                kwargs["headers"] = kwargs.get("headers", {}) | {
-                    k: v for k, v in response.headers.items()
-                    if k in ("If-None-Match", "If-Modified-Since")
-                }
+                return self._cached_body(response, model, many)
+            elif response.serve_stale and request.method == "GET":
+                # Answer immediately and refresh the entry in the background
+                logger.debug("cache_stale_hit", path=path)
+                self._stats["stale_responses"] += 1
+                self._start_fetch(request, path, cache_result, background=True)
+                return self._cached_body(response, model, many)
 
+        if request.method != "GET":
+            data = await self._fetch(request, path, cache_result)
+        else:
+            data = await asyncio.shield(self._start_fetch(request, path, cache_result))
+        return self._validate(data, model, many)
+
+    @classmethod
+    def _cached_body(
+        cls,
+        response: CachedResponse,
+        model: Optional[Type[BaseModel]],
+        many: bool,
+    ) -> Any:
+        """Get the body of a cached response, reusing validated models.
+        
+        Args:
+            response: Cached response
+            model: Optional model to validate the body with
+            many: Whether the body is a list of model instances
+            
+        Returns:
+            Any: Parsed JSON body, or validated model(s) if model is set
+            
+        Raises:
+            HTTPException: If the cached response is a not-found result
+        """
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            raise HTTPException(
+                status_code=e.response.status_code, detail=str(e)
+            ) from e
+            
+        entry = response.entry
+        if model is not None and not entry.metadata.negative:
+            return entry.get_models(model, many)
+        return cls._validate(response.json(), model, many)
+
+    @staticmethod
+    def _validate(
+        data: Any,
+        model: Optional[Type[BaseModel]],
+        many: bool,
+    ) -> Any:
+        """Validate a parsed JSON body.
+        
+        Args:
+            data: Parsed JSON body
+            model: Optional model to validate the body with
+            many: Whether the body is a list of model instances
+            
+        Returns:
+            Any: The body itself, or validated model(s) if model is set
+            
+        Raises:
+            HTTPException: If a model is expected but the body is null
+        """
+        if model is None:
+            return data
+        if data is None:
+            # Sleeper answers unknown identifiers with a null body
+            raise HTTPException(status_code=404, detail=f"{model.__name__} not found")
+        if many:
+            return [model.model_validate(item) for item in data]
+        return model.model_validate(data)
+
+    def _start_fetch(
+        self,
+        request: httpx.Request,
+        path: str,
+        cache_result: Optional[Tuple[CachedResponse, bool]],
+        background: bool = False,
+    ) -> "asyncio.Future[Any]":
+        """Start an upstream fetch or join an identical one in flight.
+        
+        The fetch runs as its own task so that a cancelled caller does not
+        cancel it for the callers waiting on the same result.
+        
+        Args:
+            request: Prepared HTTP request
+            path: API path being requested, used for logging
+            cache_result: Stale cache lookup result for the request, if any
+            background: Whether nobody waits on the result, as for
+                stale-while-revalidate refreshes
+            
+        Returns:
+            asyncio.Future[Any]: Task resolving to the parsed JSON response
+        """
+        key = self.cache.generate_key(request)
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            if not background:
+                self._stats["coalesced_requests"] += 1
+                logger.debug("request_coalesced", path=path)
+            return inflight
+            
+        task = asyncio.ensure_future(self._fetch(request, path, cache_result))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        if background:
+            self._stats["background_revalidations"] += 1
+            task.add_done_callback(self._log_background_failure)
+        return task
+
+    @staticmethod
+    def _log_background_failure(task: "asyncio.Future[Any]") -> None:
+        """Log the failure of a background refresh nobody is waiting on.
+        
+        Args:
+            task: Completed background fetch
+        """
+        if task.cancelled():
+            return
+        error = task.exception()
+        if error is not None:
+            logger.warning("background_revalidation_failed", error=str(error))
+
+    async def _fetch(
+        self,
+        request: httpx.Request,
+        path: str,
+        cache_result: Optional[Tuple[CachedResponse, bool]],
+    ) -> Any:
+        """Send a request upstream and cache the response.
+        
+        Args:
+            request: Prepared HTTP request
+            path: API path being requested, used for logging and to pin
+                responses of archived leagues
+            cache_result: Stale cache lookup result for the request, if any
+            
+        Returns:
+            Any: Parsed JSON response
+            
+        Raises:
+            HTTPException: If the request fails
+        """
+        # Revalidate a stale cached response rather than refetching it
+        cached_response = cache_result[0] if cache_result else None
+        if cached_response is not None:
+            request.headers.update(cached_response.conditional_headers)
+        
         # Check rate limit before making request
         await self._check_rate_limit()
+        self._stats["upstream_requests"] += 1
         
+        started = time.monotonic()
         try:
             response = await self._client.send(request)
-            response.raise_for_status()
+            latency = time.monotonic() - started
             
-            # Handle 304 Not Modified
-            if response.status_code == 304 and cache_result:
+            # Record whether the upstream answered, before client errors
+            # such as 404s are raised; successful responses are recorded
+            # once their body has been parsed
+            if response.status_code >= 500 or response.status_code == 429:
+                self.health.record_failure(f"HTTP {response.status_code}")
+            elif response.is_error or response.status_code == 304:
+                self.health.record_success(latency)
+            
+            # Handle 304 Not Modified before treating it as an error
+            if response.status_code == 304 and cached_response is not None:
                 logger.debug("cache_revalidated", path=path)
-                cached_response, _ = cache_result
+                await self.cache.refresh(request, response)
+                self._stats["revalidated_responses"] += 1
+                self._stats["revalidated_bytes"] += len(cached_response.content)
                 return cached_response.json()
             
-            # Cache successful responses
-            if response.status_code < 400:
+            # Remember not-found results so repeated lookups stay local
+            if response.status_code == 404:
                 self.cache.set(request, response)
             
-            return response.json()
+            response.raise_for_status()
+            self._stats["full_fetches"] += 1
+            
+            # Cache successful responses along with their parsed body
+            data = response.json()
+            self.health.record_success(latency)
+            if response.status_code < 400:
+                pin = self._is_archived_path(path)
+                self.cache.set(request, response, data=data, pin=pin)
+            
+            return data
             
         except httpx.HTTPStatusError as e:
             logger.error("request_failed", path=path, status_code=e.response.status_code)
@@ -130,10 +386,66 @@ class SleeperAPIClient:
             )
         except httpx.RequestError as e:
             logger.error("request_error", path=path, error=str(e))
+            self.health.record_failure(str(e) or type(e).__name__)
             raise HTTPException(
                 status_code=500,
                 detail="Failed to communicate with Sleeper API",
             )
+        except ValueError as e:
+            # The upstream answered with a body that is not valid JSON
+            logger.error("invalid_response", path=path, error=str(e))
+            self.health.record_failure(f"Invalid JSON: {e}")
+            raise HTTPException(
+                status_code=502,
+                detail="Invalid response from Sleeper API",
+            ) from e
+
+    async def get_json(self, path: str) -> Any:
+        """Make a cached, rate-limited GET request for raw JSON.
+        
+        Args:
+            path: API path to request (e.g., "/league/123")
+            
+        Returns:
+            Any: Parsed JSON response
+        """
+        return await self._make_request("GET", path)
+
+    async def refresh(self, path: str) -> Any:
+        """Fetch a GET path upstream and cache it, even if it is cached.
+        
+        Used to keep entries warm ahead of demand. Cached entries with
+        validators, fresh or stale, are revalidated with a conditional
+        request, so unchanged responses cost a 304 rather than a full
+        download. An identical request already in flight is joined rather
+        than repeated.
+        
+        Args:
+            path: API path to refresh (e.g., "/league/123")
+            
+        Returns:
+            Any: Parsed JSON response
+            
+        Raises:
+            HTTPException: If the request fails
+        """
+        request = self._client.build_request("GET", path)
+        cache_result = await self.cache.get(request)
+        if cache_result and cache_result[1]:
+            response = cache_result[0]
+            if response.entry.metadata.pinned:
+                # Pinned responses never change
+                return response.json()
+            conditional_headers = self.cache.get_conditional_headers(response.entry)
+            cache_result = None
+            if conditional_headers:
+                revalidated = CachedResponse(
+                    response.entry,
+                    request,
+                    conditional_headers=conditional_headers,
+                )
+                cache_result = (revalidated, False)
+        return await asyncio.shield(self._start_fetch(request, path, cache_result))
 
     async def get_user(self, identifier: str) -> User:
         """Get a user by username or user_id.
@@ -144,8 +456,10 @@ class SleeperAPIClient:
         Returns:
             User: User information
         """
-        data = await self._make_request("GET", f"/user/{identifier}")
-        return User.model_validate(data)
+        user: User = await self._make_request(
+            "GET", f"/user/{identifier}", model=User
+        )
+        return user
 
     async def get_user_leagues(
         self,
@@ -163,11 +477,14 @@ class SleeperAPIClient:
         Returns:
             List[League]: List of leagues
         """
-        data = await self._make_request(
+        leagues: List[League] = await self._make_request(
             "GET",
             f"/user/{user_id}/leagues/{sport}/{season}",
+            model=League,
+            many=True,
         )
-        return [League.model_validate(league) for league in data]
+        await self._track_archived(leagues)
+        return leagues
 
     async def get_league(self, league_id: str) -> League:
         """Get information about a specific league.
@@ -178,8 +495,108 @@ class SleeperAPIClient:
         Returns:
             League: League information
         """
-        data = await self._make_request("GET", f"/league/{league_id}")
-        return League.model_validate(data)
+        fetched_at = datetime.utcnow()
+        league: League = await self._make_request(
+            "GET", f"/league/{league_id}", model=League
+        )
+        await self._track_archived([league], fetched_at=fetched_at)
+        return league
+
+    def _is_archived_path(self, path: str) -> bool:
+        """Check whether a path belongs to a league known to be archived.
+        
+        Args:
+            path: API path (e.g., "/league/123/matchups/1")
+            
+        Returns:
+            bool: Whether the response can no longer change
+        """
+        match = LEAGUE_PATH.match(path)
+        return match is not None and match.group(1) in self._archived_leagues
+
+    async def _current_season(self) -> Optional[int]:
+        """Get the current NFL season, or None if it is unavailable."""
+        try:
+            state = await self.get_nfl_state()
+        except HTTPException:
+            return None
+        return int(state.season) if state.season.isdigit() else None
+
+    async def _track_archived(
+        self,
+        leagues: List[League],
+        fetched_at: Optional[datetime] = None,
+    ) -> List[str]:
+        """Remember leagues that are complete or from a past season.
+        
+        A league response cached since fetched_at is the one that showed
+        the league archived, so it is pinned as it is. Other responses of
+        newly archived leagues that are already cached are revalidated and
+        pinned in the background, however the leagues were found.
+        
+        Args:
+            leagues: Leagues to check
+            fetched_at: When the league responses were requested (naive
+                UTC), if they were requested from /league/{id}
+            
+        Returns:
+            List[str]: IDs of the leagues newly found to be archived
+        """
+        leagues = [
+            league
+            for league in leagues
+            if league.league_id not in self._archived_leagues
+        ]
+        season = None
+        if any(league.status != ARCHIVED_LEAGUE_STATUS for league in leagues):
+            season = await self._current_season()
+            
+        archived = []
+        for league in leagues:
+            past = (
+                season is not None
+                and league.season.isdigit()
+                and int(league.season) < season
+            )
+            if league.status == ARCHIVED_LEAGUE_STATUS or past:
+                self._archived_leagues.add(league.league_id)
+                archived.append(league.league_id)
+        if archived:
+            logger.debug("leagues_archived", league_ids=archived)
+        for league_id in archived:
+            paths = [f"/league/{league_id}{suffix}" for suffix in PIN_SUFFIXES]
+            if fetched_at is not None:
+                request = self._client.build_request("GET", paths[0])
+                if await self.cache.pin(request, created_after=fetched_at):
+                    paths = paths[1:]
+            task = asyncio.ensure_future(self._pin_paths(paths))
+            self._pin_tasks.add(task)
+            task.add_done_callback(self._pin_tasks.discard)
+            task.add_done_callback(self._log_background_failure)
+        return archived
+
+    async def _pin_paths(self, paths: List[str]) -> None:
+        """Pin the cached responses of an archived league.
+        
+        Entries cached before the league was archived may predate its final
+        state, so each one is revalidated upstream before it is pinned.
+        
+        Args:
+            paths: API paths of the archived league (e.g., "/league/123")
+        """
+        archived_at = datetime.utcnow()
+        for path in paths:
+            request = self._client.build_request("GET", path)
+            if await self.cache.get(request) is None:
+                continue
+            try:
+                await self.refresh(path)
+            except HTTPException as e:
+                logger.warning(
+                    "league_pin_failed", path=path, status_code=e.status_code
+                )
+                continue
+            await self.cache.pin(request, created_after=archived_at)
 
     async def get_league_rosters(self, league_id: str) -> List[Roster]:
         """Get all rosters in a league.
@@ -190,8 +607,13 @@ class SleeperAPIClient:
         Returns:
             List[Roster]: List of rosters
         """
-        data = await self._make_request("GET", f"/league/{league_id}/rosters")
-        return [Roster.model_validate(roster) for roster in data]
+        rosters: List[Roster] = await self._make_request(
+            "GET",
+            f"/league/{league_id}/rosters",
+            model=Roster,
+            many=True,
+        )
+        return rosters
 
     async def get_league_users(self, league_id: str) -> List[User]:
         """Get all users in a league.
@@ -202,8 +624,13 @@ class SleeperAPIClient:
         Returns:
             List[User]: List of users
         """
-        data = await self._make_request("GET", f"/league/{league_id}/users")
-        return [User.model_validate(user) for user in data]
+        users: List[User] = await self._make_request(
+            "GET",
+            f"/league/{league_id}/users",
+            model=User,
+            many=True,
+        )
+        return users
 
     async def get_nfl_state(self) -> NFLState:
         """Get current NFL season state.
@@ -211,13 +638,215 @@ class SleeperAPIClient:
         Returns:
             NFLState: Current NFL state information
         """
-        data = await self._make_request("GET", "/state/nfl")
-        return NFLState.model_validate(data)
+        state: NFLState = await self._make_request("GET", "/state/nfl", model=NFLState)
+        return state
+
+    async def get_player_store(self) -> PlayerStore:
+        """Get the player database, downloading it at most once a day.
+        
+        Returns:
+            PlayerStore: Indexed store of all NFL players
+        """
+        if self.players.is_stale(PLAYER_REFRESH_INTERVAL):
+            async with self._players_lock:
+                if self.players.is_stale(PLAYER_REFRESH_INTERVAL):
+                    data = await self._make_request("GET", "/players/nfl")
+                    self.players = PlayerStore.from_players(data)
+                    logger.info("players_loaded", count=len(self.players))
+        return self.players
+
+    async def get_player(self, player_id: str) -> Player:
+        """Get an NFL player by player_id.
+        
+        Args:
+            player_id: Sleeper player ID to look up
+            
+        Returns:
+            Player: Player information
+            
+        Raises:
+            HTTPException: If the player does not exist
+        """
+        store = await self.get_player_store()
+        record = store.get(player_id)
+        if record is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Player {player_id} not found",
+            )
+        return record.to_model()
+
+    async def search_players(
+        self,
+        name: Optional[str] = None,
+        team: Optional[str] = None,
+        position: Optional[str] = None,
+        limit: int = 25,
+    ) -> List[Player]:
+        """Search NFL players by name, team and position.
+        
+        Args:
+            name: Full name or name prefix (case-insensitive)
+            team: NFL team abbreviation (e.g., "KC")
+            position: Position code (e.g., "QB")
+            limit: Maximum number of players to return (default: 25)
+            
+        Returns:
+            List[Player]: Players matching all given criteria
+        """
+        store = await self.get_player_store()
+        records = store.search(name=name, team=team, position=position, limit=limit)
+        return [record.to_model() for record in records]
+
+    async def _iter_models(
+        self,
+        path: str,
+        model: Type[ModelT],
+    ) -> AsyncIterator[ModelT]:
+        """Fetch a list endpoint and validate its items one at a time.
+        
+        Args:
+            path: API endpoint path
+            model: Model to validate each item with
+            
+        Yields:
+            ModelT: Validated items
+        """
+        data = await self._make_request("GET", path)
+        for item in data:
+            yield model.model_validate(item)
+
+    async def iter_user_leagues(
+        self,
+        user_id: str,
+        season: str,
+        sport: str = "nfl",
+    ) -> AsyncIterator[League]:
+        """Lazily validate all leagues for a user.
+        
+        Like get_user_leagues, archived leagues are tracked as they are
+        validated.
+        
+        Args:
+            user_id: User ID to look up leagues for
+            season: Season year (e.g., "2023")
+            sport: Sport type (default: "nfl")
+            
+        Yields:
+            League: Leagues, validated as they are consumed
+        """
+        path = f"/user/{user_id}/leagues/{sport}/{season}"
+        async for league in self._iter_models(path, League):
+            await self._track_archived([league])
+            yield league
+
+    def iter_league_rosters(self, league_id: str) -> AsyncIterator[Roster]:
+        """Lazily validate all rosters in a league.
+        
+        Args:
+            league_id: League ID to look up rosters for
+            
+        Returns:
+            AsyncIterator[Roster]: Rosters, validated as they are consumed
+        """
+        return self._iter_models(f"/league/{league_id}/rosters", Roster)
+
+    def iter_league_users(self, league_id: str) -> AsyncIterator[User]:
+        """Lazily validate all users in a league.
+        
+        Args:
+            league_id: League ID to look up users for
+            
+        Returns:
+            AsyncIterator[User]: Users, validated as they are consumed
+        """
+        return self._iter_models(f"/league/{league_id}/users", User)
+
+    async def iter_search_players(
+        self,
+        name: Optional[str] = None,
+        team: Optional[str] = None,
+        position: Optional[str] = None,
+        limit: Optional[int] = 25,
+    ) -> AsyncIterator[Player]:
+        """Lazily search NFL players by name, team and position.
+        
+        Args:
+            name: Full name or name prefix (case-insensitive)
+            team: NFL team abbreviation (e.g., "KC")
+            position: Position code (e.g., "QB")
+            limit: Maximum number of players to return, or None for no
+                limit (default: 25, as for search_players)
+            
+        Yields:
+            Player: Players matching all given criteria
+        """
+        store = await self.get_player_store()
+        records = store.iter_search(name=name, team=team, position=position)
+        for record in islice(records, limit):
+            yield record.to_model()
+
+    async def prewarm(self, connections: Optional[int] = None) -> int:
+        """Open upstream connections ahead of the first requests.
+        
+        Sends concurrent HEAD requests so that DNS resolution and TCP/TLS
+        handshakes are paid at startup rather than by the first burst of
+        callers. Over HTTP/2 a single connection is multiplexed, so only
+        one request is sent. Failures are logged and otherwise ignored.
+        
+        Args:
+            connections: Number of connections to open (default: the
+                prewarm_connections setting)
+            
+        Returns:
+            int: Number of connections opened successfully
+        """
+        if connections is None:
+            connections = self.config.sleeper_api.prewarm_connections
+        if self.http2:
+            connections = min(connections, 1)
+        if connections <= 0:
+            return 0
+
+        async def open_connection() -> bool:
+            try:
+                await self._check_rate_limit()
+                self._stats["upstream_requests"] += 1
+                await self._client.head("/state/nfl")
+                return True
+            except (httpx.HTTPError, HTTPException) as e:
+                logger.warning("prewarm_failed", error=str(e))
+                return False
+
+        results = await asyncio.gather(*(open_connection() for _ in range(connections)))
+        opened = sum(results)
+        logger.info("connections_prewarmed", connections=opened, http2=self.http2)
+        return opened
 
     async def close(self) -> None:
-        """Close the HTTP client session and cache."""
+        """Close the HTTP client session and cache.
+        
+        Cached responses are kept on disk, so they survive restarts and
+        stay available to other processes sharing the cache directory.
+        """
+        for task in [*self._inflight.values(), *self._pin_tasks]:
+            task.cancel()
         await self._client.aclose()
-        self.cache.clear()
+        self.cache.close()
+
+    def get_request_stats(self) -> Dict[str, Any]:
+        """Get upstream request statistics.
+        
+        Returns:
+            Dict[str, Any]: Request statistics
+        """
+        return {
+            **self._stats,
+            "inflight_requests": len(self._inflight),
+            "http2": self.http2,
+            "rate_limit": self.rate_limiter.get_stats(),
+            "health": self.health.get_stats(),
+        }
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
@@ -226,3 +855,36 @@ class SleeperAPIClient:
             Dict[str, Any]: Cache statistics
         """
         return self.cache.get_stats()
+
+
+# Process-wide client shared by every app in the process, so that they use
+# one cache, one connection pool and one rate-limit budget
+_shared_client: Optional[SleeperAPIClient] = None
+_shared_users = 0
+
+
+def acquire_shared_client(config: Optional[Config] = None) -> SleeperAPIClient:
+    """Get the process-wide Sleeper API client, creating it on first use.
+    
+    Every call must be paired with a call to release_shared_client.
+    
+    Args:
+        config: Optional configuration, used only when the client is created
+        
+    Returns:
+        SleeperAPIClient: Shared client
+    """
+    global _shared_client, _shared_users
+    if _shared_client is None:
+        _shared_client = SleeperAPIClient(config)
+    _shared_users += 1
+    return _shared_client
+
+
+async def release_shared_client() -> None:
+    """Release the process-wide client, closing it after its last user."""
+    global _shared_client, _shared_users
+    _shared_users = max(_shared_users - 1, 0)
+    if _shared_users == 0 and _shared_client is not None:
+        client, _shared_client = _shared_client, None
+        await client.close()
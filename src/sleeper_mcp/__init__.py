@@ -1,9 +1,22 @@
 """Sleeper MCP package."""
 
+from typing import TYPE_CHECKING, Any
+
 from .main import app
 from .sleeper_api import SleeperClient
 from .sleeper_api.models.base import User, League, Roster, LeagueSettings, RosterSettings
-from .sleeper_docs import SleeperDocsFetcher
+
+if TYPE_CHECKING:
+    from .sleeper_docs import SleeperDocsFetcher
+
+
+def __getattr__(name: str) -> Any:
+    """Import the docs fetcher, and its aiohttp and bs4 dependencies, on first use."""
+    if name == "SleeperDocsFetcher":
+        from .sleeper_docs import SleeperDocsFetcher
+        return SleeperDocsFetcher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "app",
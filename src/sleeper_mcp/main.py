@@ -1,67 +1,92 @@
 """Sleeper MCP FastAPI server implementation."""
 
-from fastapi import FastAPI, HTTPException
-from typing import List
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, HTTPException, Request
+from typing import AsyncGenerator, List
 
 from .sleeper_api import SleeperClient
 from .sleeper_api.models.base import User, League, Roster
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Share one pooled Sleeper client for the lifetime of the app."""
+    app.state.sleeper_client = await SleeperClient().start()
+    yield
+    await app.state.sleeper_client.close()
+
+
+def get_client(request: Request) -> SleeperClient:
+    """Get the shared Sleeper client."""
+    client: SleeperClient = request.app.state.sleeper_client
+    return client
+
+
 app = FastAPI(
     title="Sleeper MCP",
     description="MCP implementation for Sleeper Fantasy Sports API",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 @app.get("/users/{username_or_id}", response_model=User)
-async def get_user(username_or_id: str) -> User:
+async def get_user(
+    username_or_id: str,
+    client: SleeperClient = Depends(get_client)
+) -> User:
     """Get user information."""
-    async with SleeperClient() as client:
-        try:
-            data = await client.get_user(username_or_id)
-            return User(**data)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+    try:
+        data = await client.get_user(username_or_id)
+        return User(**data)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/users/{user_id}/leagues", response_model=List[League])
 async def get_user_leagues(
     user_id: str,
     sport: str = "nfl",
-    season: str | None = None
+    season: str | None = None,
+    client: SleeperClient = Depends(get_client)
 ) -> List[League]:
     """Get user's leagues for a sport and season."""
-    async with SleeperClient() as client:
-        try:
-            data = await client.get_user_leagues(user_id, sport, season)
-            return [League(**league_data) for league_data in data]
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+    try:
+        data = await client.get_user_leagues(user_id, sport, season)
+        return [League(**league_data) for league_data in data]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/leagues/{league_id}", response_model=League)
-async def get_league(league_id: str) -> League:
+async def get_league(
+    league_id: str,
+    client: SleeperClient = Depends(get_client)
+) -> League:
     """Get league information."""
-    async with SleeperClient() as client:
-        try:
-            data = await client.get_league(league_id)
-            return League(**data)
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+    try:
+        data = await client.get_league(league_id)
+        return League(**data)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/leagues/{league_id}/users", response_model=List[User])
-async def get_league_users(league_id: str) -> List[User]:
+async def get_league_users(
+    league_id: str,
+    client: SleeperClient = Depends(get_client)
+) -> List[User]:
     """Get all users in a league."""
-    async with SleeperClient() as client:
-        try:
-            data = await client.get_league_users(league_id)
-            return [User(**user_data) for user_data in data]
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+    try:
+        data = await client.get_league_users(league_id)
+        return [User(**user_data) for user_data in data]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/leagues/{league_id}/rosters", response_model=List[Roster])
-async def get_league_rosters(league_id: str) -> List[Roster]:
+async def get_league_rosters(
+    league_id: str,
+    client: SleeperClient = Depends(get_client)
+) -> List[Roster]:
     """Get all rosters in a league."""
-    async with SleeperClient() as client:
-        try:
-            data = await client.get_league_rosters(league_id)
-            return [Roster(**roster_data) for roster_data in data]
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+    try:
+        data = await client.get_league_rosters(league_id)
+        return [Roster(**roster_data) for roster_data in data]
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
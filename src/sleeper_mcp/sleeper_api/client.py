@@ -1,27 +1,52 @@
 """Sleeper API client implementation."""
 
-import aiohttp
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, cast
 from datetime import datetime
 
+from src.services import SleeperAPIClient, acquire_shared_client, release_shared_client
+
 class SleeperClient:
-    """Async client for interacting with the Sleeper API."""
+    """Async client for interacting with the Sleeper API.
     
-    BASE_URL = "https://api.sleeper.app/v1"
+    Requests go through the process-wide SleeperAPIClient transport, so this
+    client shares its cache, connection pool and rate-limit budget with
+    every other user of the Sleeper API in the process.
+    """
     
-    def __init__(self):
-        """Initialize the client."""
-        self._session: Optional[aiohttp.ClientSession] = None
+    def __init__(self, transport: Optional[SleeperAPIClient] = None):
+        """Initialize the client.
+        
+        Args:
+            transport: Optional transport to use instead of the shared one
+        """
+        self._transport = transport
+        self._shared = False
+    
+    async def start(self) -> "SleeperClient":
+        """Attach to the shared transport if no transport was given.
+        
+        Returns:
+            SleeperClient: The client itself
+        """
+        if self._transport is None:
+            self._transport = acquire_shared_client()
+            self._shared = True
+        return self
+    
+    async def close(self) -> None:
+        """Release the shared transport."""
+        if self._shared:
+            self._transport = None
+            self._shared = False
+            await release_shared_client()
     
     async def __aenter__(self):
         """Set up async context manager."""
-        self._session = aiohttp.ClientSession()
-        return self
+        return await self.start()
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Clean up async context manager."""
-        if self._session:
-            await self._session.close()
+        await self.close()
             
     async def _get(self, endpoint: str) -> Dict[str, Any]:
         """Make a GET request to the Sleeper API.
@@ -33,15 +58,16 @@ class SleeperClient:
             Dict[str, Any]: JSON response data
             
         Raises:
-            RuntimeError: If client is not used as context manager
-            aiohttp.ClientError: On API request failure
+            RuntimeError: If the client has not been started
+            HTTPException: On API request failure
         """
-        if not self._session:
-            raise RuntimeError("Client must be used as async context manager")
+        if not self._transport:
+            raise RuntimeError(
+                "Client must be started or used as async context manager"
+            )
         
-        async with self._session.get(f"{self.BASE_URL}/{endpoint}") as response:
-            response.raise_for_status()
-            return await response.json()
+        data = await self._transport.get_json(f"/{endpoint}")
+        return cast(Dict[str, Any], data)
     
     # User endpoints
     async def get_user(self, username_or_id: str) -> Dict[str, Any]:
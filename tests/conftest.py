@@ -0,0 +1,74 @@
+"""Shared fixtures and test data for the Sleeper API client tests."""
+
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pytest
+
+from src.config import Config
+from src.services import sleeper
+from src.services.cache import APICache
+from src.services.sleeper import SleeperAPIClient
+
+BASE_URL = "https://api.sleeper.app/v1"
+TEST_NFL_STATE = {
+    "week": 10,
+    "season_type": "regular",
+    "season": "2023",
+    "previous_season": "2022",
+    "league_season": "2023",
+    "league_create_season": "2023",
+    "display_week": 10,
+}
+
+
+@pytest.fixture
+def base_url() -> str:
+    """Return the Sleeper API base URL mocked by the tests."""
+    return BASE_URL
+
+
+@pytest.fixture
+def nfl_state() -> Dict[str, Any]:
+    """Return a fresh copy of the NFL state payload."""
+    return dict(TEST_NFL_STATE)
+
+
+@pytest.fixture(autouse=True)
+def isolated_default_cache(tmp_path, monkeypatch) -> Iterator[None]:
+    """Keep default caches, such as the shared client's, out of the repo.
+    
+    The process-wide client is reset for every test, and its cache is
+    closed when the test ends.
+    """
+    monkeypatch.setattr("src.services.cache.CACHE_DIR", tmp_path / "default-cache")
+    monkeypatch.setattr(sleeper, "_shared_client", None)
+    monkeypatch.setattr(sleeper, "_shared_users", 0)
+    yield
+    if sleeper._shared_client is not None:
+        sleeper._shared_client.cache.close()
+
+
+@pytest.fixture
+def make_sleeper_client(tmp_path) -> Callable[[Optional[Config]], SleeperAPIClient]:
+    """Create clients backed by an isolated cache directory.
+    
+    Disk I/O runs inline: freezegun does not reliably freeze time inside
+    the I/O threads. Every cache is closed when the test ends.
+    """
+    clients: List[SleeperAPIClient] = []
+    
+    def make(config: Optional[Config] = None) -> SleeperAPIClient:
+        cache = APICache(cache_dir=tmp_path / "cache", io_workers=0)
+        client = SleeperAPIClient(config or Config(), cache=cache)
+        clients.append(client)
+        return client
+    
+    yield make
+    for client in clients:
+        client.cache.close()
+
+
+@pytest.fixture
+def sleeper_client(make_sleeper_client) -> SleeperAPIClient:
+    """Create a client backed by an isolated cache directory."""
+    return make_sleeper_client()
@@ -3,13 +3,18 @@
 from fastapi.testclient import TestClient
 import pytest
 from sleeper_mcp import app
+from sleeper_mcp.sleeper_api import SleeperClient
 
-client = TestClient(app)
+@pytest.fixture
+def client():
+    """Create a test client that runs the app lifespan."""
+    with TestClient(app) as test_client:
+        yield test_client
 
 TEST_BOT_USERNAME = "sleeperbot"  # Known bot user
 TEST_BOT_USER_ID = "160004000000400000"
 
-def test_get_user():
+def test_get_user(client):
     """Test GET /users/{username} endpoint."""
     response = client.get(f"/users/{TEST_BOT_USERNAME}")
     assert response.status_code == 200
@@ -18,13 +23,29 @@ def test_get_user():
     assert data["user_id"] == TEST_BOT_USER_ID
     assert data["is_bot"] is True
 
-def test_get_user_leagues():
+def test_get_user_leagues(client):
     """Test GET /users/{user_id}/leagues endpoint."""
     response = client.get(f"/users/{TEST_BOT_USER_ID}/leagues")
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list)
 
+def test_routes_share_one_client(monkeypatch):
+    """Test that every request uses the client started with the app."""
+    clients = []
+    
+    async def get_user(self, username_or_id):
+        clients.append(self)
+        return {"user_id": "123", "username": username_or_id}
+    
+    monkeypatch.setattr(SleeperClient, "get_user", get_user)
+    with TestClient(app) as test_client:
+        assert test_client.get("/users/first").status_code == 200
+        assert test_client.get("/users/second").status_code == 200
+        started = app.state.sleeper_client
+    
+    assert clients == [started, started]
+
 def test_get_league():
     """Test GET /leagues/{league_id} endpoint."""
     pytest.skip("Test requires a valid league ID from a user with leagues")
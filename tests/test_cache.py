@@ -1,16 +1,28 @@
 """Tests for API caching implementation."""
 
+import asyncio
 import json
+import os
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any
+from unittest.mock import Mock
 
 import pytest
 from freezegun import freeze_time
 from httpx import Request, Response
 import respx
 
-from src.services.cache import APICache, CacheEntry, CacheMetadata
+from src.config.settings import CacheConfig, CachePolicy
+from src.services.cache import (
+    APICache,
+    CacheEntry,
+    CacheMetadata,
+    FrequencySketch,
+    MemoryCache,
+    resolve_compression,
+)
 
 # Test data
 TEST_URL = "https://api.sleeper.app/v1/user/testuser"
@@ -33,8 +45,22 @@ def temp_cache_dir(tmp_path):
 
 @pytest.fixture
 def api_cache(temp_cache_dir):
-    """Create an API cache instance."""
-    return APICache(cache_dir=temp_cache_dir)
+    """Create an API cache instance.
+    
+    Disk I/O runs inline: freezegun does not reliably freeze time inside
+    the I/O threads, which would skew diskcache expiry under freeze_time.
+    """
+    cache = APICache(cache_dir=temp_cache_dir, io_workers=0)
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def threaded_cache(tmp_path):
+    """Create an API cache instance performing disk I/O on threads."""
+    cache = APICache(cache_dir=tmp_path / "threaded", io_workers=2)
+    yield cache
+    cache.close()
 
 
 def create_test_request():
@@ -71,9 +97,74 @@ def test_cache_key_generation(api_cache):
     # Same requests should generate same keys
     assert api_cache._generate_cache_key(request1) == api_cache._generate_cache_key(request1)
     
+    key = api_cache._generate_cache_key
+    
+    # Headers the resource does not vary on are ignored
+    assert key(request1) == key(request2)
+    
     # Different requests should generate different keys
-    assert api_cache._generate_cache_key(request1) != api_cache._generate_cache_key(request2)
-    assert api_cache._generate_cache_key(request1) != api_cache._generate_cache_key(request3)
+    assert key(request1) != key(request3)
+
+
+def test_cache_key_normalization(api_cache):
+    """Test that equivalent URLs and incidental headers share a key."""
+    request1 = Request("GET", "https://api.sleeper.app/v1/players?b=2&a=1")
+    request2 = Request(
+        "GET",
+        "HTTPS://API.SLEEPER.APP:443/v1/players?a=1&b=2#top",
+        headers={"User-Agent": "agent/1.0", "traceparent": "00-abc-def-01"},
+    )
+    request3 = Request("GET", "https://api.sleeper.app/v1/players?a=1&b=3")
+    key = api_cache._generate_cache_key
+    
+    assert key(request1) == key(request2)
+    assert key(request1) != key(request3)
+
+
+def test_cache_key_uses_learned_vary_headers(api_cache, temp_cache_dir):
+    """Test that headers named in Vary split the cache once learned."""
+    json_request = Request("GET", TEST_URL, headers={"Accept": "application/json"})
+    html_request = Request("GET", TEST_URL, headers={"Accept": "text/html"})
+    response = Response(
+        status_code=200,
+        headers={"Vary": "Accept"} | TEST_HEADERS,
+        content=json.dumps(TEST_CONTENT).encode(),
+        request=json_request
+    )
+    api_cache.set(json_request, response)
+    
+    key = api_cache._generate_cache_key
+    assert key(json_request) != key(html_request)
+    
+    # The learned Vary headers survive a restart
+    reopened = APICache(cache_dir=temp_cache_dir)
+    assert reopened._generate_cache_key(json_request) == key(json_request)
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_learned_vary_headers_are_bounded(api_cache, monkeypatch):
+    """Test that Vary names are kept in a bounded LRU backed by the sidecar store."""
+    monkeypatch.setattr("src.services.cache.VARY_CACHE_ENTRIES", 2)
+    json_request = Request("GET", TEST_URL, headers={"Accept": "application/json"})
+    response = Response(
+        status_code=200,
+        headers={"Vary": "Accept"} | TEST_HEADERS,
+        content=json.dumps(TEST_CONTENT).encode(),
+        request=json_request
+    )
+    api_cache.set(json_request, response)
+    key = api_cache._generate_cache_key(json_request)
+    
+    for name in ("first", "second"):
+        await api_cache.get(Request("GET", f"https://api.sleeper.app/v1/user/{name}"))
+    assert len(api_cache._vary) == 2
+    assert "GET " + TEST_URL not in api_cache._vary
+    
+    # An evicted resource is read back from the sidecar store on lookup
+    cached_response, _ = await api_cache.get(json_request)
+    assert cached_response.json() == TEST_CONTENT
+    assert api_cache._generate_cache_key(json_request) == key
 
 
 def test_cache_control_parsing(api_cache):
@@ -128,6 +219,33 @@ async def test_cache_freshness(api_cache):
         assert "If-None-Match" in cached_response.headers
 
 
+@pytest.mark.asyncio
+async def test_expires_header_freshness(api_cache):
+    """Test that a timezone-aware Expires header sets the freshness lifetime."""
+    request = create_test_request()
+    response = Response(
+        status_code=200,
+        headers={
+            "Content-Type": "application/json",
+            "ETag": "abc123",
+            "Expires": "Sat, 21 Oct 2023 07:10:00 GMT",
+        },
+        content=json.dumps(TEST_CONTENT).encode(),
+        request=request
+    )
+    
+    with freeze_time("2023-10-21 07:00:00"):
+        api_cache.set(request, response)
+        cached_response, is_fresh = await api_cache.get(request)
+        assert is_fresh is True
+        assert cached_response.entry.metadata.ttl == 600
+        
+    with freeze_time("2023-10-21 07:15:00"):
+        cached_response, is_fresh = await api_cache.get(request)
+        assert is_fresh is False
+        assert cached_response.headers["If-None-Match"] == "abc123"
+
+
 @pytest.mark.asyncio
 async def test_conditional_requests(api_cache):
     """Test handling of conditional requests."""
@@ -265,3 +383,766 @@ async def test_cache_clear(api_cache):
     # Verify stats reset
     stats = api_cache.get_stats()
     assert stats["entry_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_serves_hits(api_cache):
+    """Test that hot entries are served from memory without touching disk."""
+    request = create_test_request()
+    response = create_test_response(request)
+    api_cache.set(request, response)
+    
+    # Remove the disk copy; the memory tier should still serve the entry
+    api_cache.cache.delete(api_cache._generate_cache_key(request))
+    cached_response, is_fresh = await api_cache.get(request)
+    assert is_fresh is True
+    assert cached_response.content == response.content
+    
+    stats = api_cache.get_stats()
+    assert stats["l1_hit_count"] == 1
+    assert stats["l2_hit_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_memory_tier_promotes_disk_hits(api_cache):
+    """Test that disk hits are promoted into the memory tier."""
+    request = create_test_request()
+    response = create_test_response(request)
+    api_cache.set(request, response)
+    api_cache.memory.clear()
+    
+    await api_cache.get(request)
+    await api_cache.get(request)
+    
+    stats = api_cache.get_stats()
+    assert stats["l1_miss_count"] == 1
+    assert stats["l2_hit_count"] == 1
+    assert stats["l1_hit_count"] == 1
+    assert stats["l1_hit_ratio"] == 0.5
+
+
+def test_memory_tier_size_is_independent_of_disk_budget(temp_cache_dir):
+    """Test that the memory tier is sized by its own byte budget."""
+    cache = APICache(
+        cache_dir=temp_cache_dir,
+        max_size=1000,
+        memory_max_size=1024 * 1024,
+        io_workers=0,
+    )
+    try:
+        assert cache.memory.max_size == 1024 * 1024
+    finally:
+        cache.close()
+
+
+def test_memory_cache_limits():
+    """Test entry-count, byte and expiry based eviction in the memory tier."""
+    entry = Mock(spec=CacheEntry)
+    
+    memory = MemoryCache(max_entries=2, max_size=100)
+    memory.set("a", entry, 10)
+    memory.set("b", entry, 10)
+    memory.get("a")
+    memory.set("c", entry, 10)
+    assert memory.get("b") is None  # least recently used
+    assert memory.get("a") is entry
+    
+    assert memory.set("d", entry, 101) is False
+    memory.set("e", entry, 95)
+    assert len(memory) == 1
+    assert memory.size == 95
+    
+    memory = MemoryCache(max_entries=2, max_size=100)
+    memory.set("expired", entry, 10, expire_at=time.time() - 1)
+    memory.set("old", entry, 10)
+    memory.set("new", entry, 10)
+    assert memory.get("old") is entry
+    assert memory.get("expired") is None
+
+
+def test_frequency_sketch():
+    """Test that the sketch counts accesses and ages them out."""
+    sketch = FrequencySketch(capacity=16)
+    for _ in range(5):
+        sketch.increment("hot")
+    sketch.increment("warm")
+    assert sketch.estimate("hot") == 5
+    assert sketch.estimate("warm") == 1
+    assert sketch.estimate("cold") == 0
+    
+    # Counters are halved once the sample fills up
+    for _ in range(sketch.sample_size):
+        sketch.increment("warm")
+    assert sketch.estimate("hot") == 2
+    assert sketch.estimate("warm") < 15
+
+
+def test_memory_cache_admission():
+    """Test that a scan of cold entries does not evict frequently used ones."""
+    entry = Mock(spec=CacheEntry)
+    sketch = FrequencySketch(capacity=2)
+    memory = MemoryCache(max_entries=2, max_size=100, sketch=sketch)
+    
+    for key in ("a", "b"):
+        for _ in range(3):
+            sketch.increment(key)
+        memory.set(key, entry, 10)
+        
+    for i in range(10):
+        sketch.increment(f"cold-{i}")
+        assert memory.set(f"cold-{i}", entry, 10) is False
+    
+    # A large entry would evict both hot entries
+    sketch.increment("players")
+    assert memory.set("players", entry, 95) is False
+    assert memory.get("a") is entry
+    assert memory.get("b") is entry
+    assert memory.rejected == 11
+    
+    # An entry accessed as often as the least recently used one displaces it
+    for _ in range(3):
+        sketch.increment("c")
+    assert memory.set("c", entry, 10) is True
+    assert memory.get("a") is None
+    
+    # Replacing a held entry is always allowed
+    assert memory.set("b", entry, 20) is True
+
+
+@pytest.mark.asyncio
+async def test_disk_entry_budget(temp_cache_dir):
+    """Test that the disk tier holds at most max_entries responses."""
+    cache = APICache(
+        cache_dir=temp_cache_dir,
+        max_entries=2,
+        memory_max_entries=0,
+        io_workers=0,
+    )
+    base = "https://api.sleeper.app/v1/user/"
+    
+    async def access(name, times=1):
+        request = Request("GET", base + name)
+        for _ in range(times):
+            if await cache.get(request) is None:
+                cache.set(request, create_test_response(request))
+        return request
+    
+    hot = await access("hot", times=3)
+    first = await access("first")
+    await access("hot")
+    
+    # "first" is least recently used and as cold as "second"
+    await access("second")
+    assert len(cache.cache) == 2
+    assert await cache.get(first) is None
+    stats = cache.get_stats()
+    assert stats["max_entries"] == 2
+    assert stats["l2_eviction_count"] == 1
+    assert stats["l2_rejected_count"] == 0
+    
+    # A cold response does not displace the least recently used hot one
+    third = await access("third")
+    assert await cache.get(third) is None
+    assert await cache.get(hot) is not None
+    assert cache.get_stats()["l2_rejected_count"] == 1
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_disk_budget_evicts_expired_entries(temp_cache_dir):
+    """Test that an expired entry never keeps a new one off the disk tier."""
+    cache = APICache(
+        cache_dir=temp_cache_dir,
+        max_entries=2,
+        memory_max_entries=0,
+        io_workers=0,
+    )
+    base = "https://api.sleeper.app/v1/user/"
+    hot = Request("GET", base + "hot")
+    other = Request("GET", base + "other")
+    cold = Request("GET", base + "cold")
+    
+    with freeze_time("2023-10-21 07:00:00"):
+        for _ in range(3):
+            await cache.get(hot)
+        cache.set(hot, create_test_response(hot))
+        cache.set(other, create_test_response(other))
+        
+    # The hot entry is least recently used and has long expired
+    with freeze_time("2023-10-23 07:00:00"):
+        cache.set(cold, create_test_response(cold))
+        assert await cache.get(cold) is not None
+        
+    stats = cache.get_stats()
+    assert stats["l2_eviction_count"] == 1
+    assert stats["l2_rejected_count"] == 0
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_disk_read_does_not_replace_newer_entry(threaded_cache, monkeypatch):
+    """Test that a slow disk read never overwrites a response stored meanwhile."""
+    request = create_test_request()
+    threaded_cache.set(request, create_test_response(request))
+    await threaded_cache.drain()
+    threaded_cache.memory.clear()
+    
+    read = threaded_cache._read
+    
+    def slow_read(key):
+        loaded = read(key)
+        time.sleep(0.1)
+        return loaded
+    
+    monkeypatch.setattr(threaded_cache, "_read", slow_read)
+    pending = asyncio.ensure_future(threaded_cache.get(request))
+    await asyncio.sleep(0.02)
+    newer = Response(
+        status_code=200,
+        headers=TEST_HEADERS,
+        content=json.dumps({"username": "renamed", "id": "123"}).encode(),
+        request=request
+    )
+    threaded_cache.set(request, newer)
+    
+    cached_response, _ = await pending
+    assert cached_response.json()["username"] == "renamed"
+    cached_response, _ = await threaded_cache.get(request)
+    assert cached_response.json()["username"] == "renamed"
+
+
+@pytest.mark.asyncio
+async def test_hits_do_not_rewrite_entries(api_cache):
+    """Test that cache hits leave the stored entry and its expiry untouched."""
+    request = create_test_request()
+    response = create_test_response(request)
+    api_cache.set(request, response)
+    await api_cache.drain()
+    key = api_cache._generate_cache_key(request)
+    _, expire_time = api_cache.cache.get(key, expire_time=True)
+    
+    api_cache.memory.clear()
+    for _ in range(3):
+        await api_cache.get(request)
+        
+    _, expire_time_after = api_cache.cache.get(key, expire_time=True)
+    assert expire_time_after == expire_time
+    
+    accessed_at, access_count = api_cache.get_access_info(request)
+    assert access_count == 3
+    assert isinstance(accessed_at, datetime)
+
+
+@pytest.mark.asyncio
+async def test_access_records_flush_in_batches(api_cache):
+    """Test that access records are persisted in batches."""
+    api_cache.access.flush_batch = 2
+    request = create_test_request()
+    api_cache.set(request, create_test_response(request))
+    key = api_cache._generate_cache_key(request)
+    
+    await api_cache.get(request)
+    assert api_cache.meta.get(f"access:{key}") is None
+    
+    await api_cache.get(request)
+    await api_cache.get(request)
+    await api_cache.drain()
+    _, stored_count = api_cache.meta.get(f"access:{key}")
+    assert stored_count == 2
+    assert api_cache.get_access_info(request)[1] == 3
+
+
+@pytest.mark.asyncio
+async def test_binary_entry_roundtrip(api_cache):
+    """Test that large entries survive the binary on-disk format."""
+    request = create_test_request()
+    players = {
+        str(i): {"player_id": str(i), "full_name": f"Player {i}"} for i in range(2000)
+    }
+    response = Response(
+        status_code=200,
+        headers=TEST_HEADERS,
+        content=json.dumps(players).encode(),
+        request=request
+    )
+    api_cache.set(request, response)
+    
+    raw = api_cache.cache.get(api_cache._generate_cache_key(request))
+    assert raw.startswith(b"SLPC")
+    
+    api_cache.memory.clear()
+    cached_response, is_fresh = await api_cache.get(request)
+    assert is_fresh is True
+    assert cached_response.content == response.content
+    assert cached_response.headers["etag"] == "abc123"
+    assert cached_response.json() == players
+
+
+@pytest.mark.asyncio
+async def test_cached_json_is_parsed_once(api_cache):
+    """Test that hits reuse the parsed body instead of decoding it again."""
+    request = create_test_request()
+    response = create_test_response(request)
+    api_cache.set(request, response, data=TEST_CONTENT)
+    
+    first, _ = await api_cache.get(request)
+    second, _ = await api_cache.get(request)
+    assert first.json() is TEST_CONTENT
+    assert second.json() is TEST_CONTENT
+
+
+def test_large_bodies_are_not_kept_parsed(monkeypatch):
+    """Test that large bodies are decoded on demand instead of memoized."""
+    monkeypatch.setattr("src.services.cache.MAX_PARSED_SIZE", 8)
+    entry = CacheEntry(
+        status_code=200,
+        headers={},
+        content=json.dumps(TEST_CONTENT).encode(),
+        metadata=CacheMetadata(
+            url=TEST_URL,
+            method="GET",
+            created_at=datetime.utcnow(),
+            accessed_at=datetime.utcnow(),
+        ),
+    )
+    
+    entry.set_json(TEST_CONTENT)
+    assert entry.get_json() == TEST_CONTENT
+    assert entry.get_json() is not entry.get_json()
+
+
+@pytest.mark.asyncio
+async def test_legacy_json_entries_are_readable(api_cache):
+    """Test that entries stored as pydantic JSON can still be read."""
+    request = create_test_request()
+    response = create_test_response(request)
+    entry = api_cache._create_cache_entry(request, response)
+    api_cache.cache.set(api_cache._generate_cache_key(request), entry.model_dump_json())
+    
+    cached_response, is_fresh = await api_cache.get(request)
+    assert is_fresh is True
+    assert cached_response.json() == TEST_CONTENT
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate(temp_cache_dir):
+    """Test that stale entries are served only inside their stale window."""
+    cache = APICache(
+        cache_dir=temp_cache_dir,
+        stale_while_revalidate=60,
+        policies={"/user/*": CachePolicy(stale_while_revalidate_seconds=600)},
+        base_path="/v1",
+    )
+    request = create_test_request()
+    response = Response(
+        status_code=200,
+        headers={"Cache-Control": "max-age=300"},
+        content=json.dumps(TEST_CONTENT).encode(),
+        request=request
+    )
+    
+    with freeze_time("2023-10-21 07:00:00"):
+        cache.set(request, response)
+        
+    # Past max-age but inside the per-endpoint window
+    with freeze_time("2023-10-21 07:10:00"):
+        cached_response, is_fresh = await cache.get(request)
+        assert is_fresh is False
+        assert cached_response.serve_stale is True
+        assert cached_response.json() == TEST_CONTENT
+        
+    # Past the window, without validators to revalidate with
+    with freeze_time("2023-10-21 07:20:00"):
+        assert await cache.get(request) is None
+        
+    assert cache.get_stats()["stale_hit_count"] == 1
+
+
+def test_stale_window_directive(api_cache):
+    """Test that a stale-while-revalidate directive overrides the defaults."""
+    request = create_test_request()
+    cache_control = api_cache._parse_cache_control(
+        {"Cache-Control": "max-age=60, stale-while-revalidate=30"}
+    )
+    assert api_cache._get_stale_window(request, cache_control) == 30
+    assert api_cache._get_stale_window(request, {}) == 0
+
+
+@pytest.mark.asyncio
+async def test_endpoint_policies(temp_cache_dir):
+    """Test that the first matching policy sets TTL and cacheability."""
+    cache = APICache(
+        cache_dir=temp_cache_dir,
+        ttl=300,
+        io_workers=0,
+        policies={
+            "/league/*/rosters": CachePolicy(ttl_seconds=60),
+            "/league/*/matchups/*": CachePolicy(cacheable=False),
+            "/league/*": CachePolicy(ttl_seconds=86400),
+        },
+        base_path="/v1",
+    )
+    base = "https://api.sleeper.app/v1"
+    
+    def store(path, headers=None):
+        request = Request("GET", base + path)
+        cache.set(request, Response(200, headers=headers, json=[], request=request))
+        return request
+    
+    rosters = store("/league/1/rosters")
+    league = store("/league/1")
+    matchups = store("/league/1/matchups/3")
+    user = store("/user/1")
+    directed = store("/league/2", headers={"Cache-Control": "max-age=30"})
+    
+    for request, ttl in ((rosters, 60), (league, 86400), (user, 300), (directed, 30)):
+        cached_response, _ = await cache.get(request)
+        assert cached_response.entry.metadata.ttl == ttl
+    assert await cache.get(matchups) is None
+    
+    cache.close()
+
+
+@pytest.mark.parametrize(
+    ("path", "ttl"),
+    [
+        ("/state/nfl", 3600),
+        ("/players/nfl", 86400),
+        ("/players/nfl/trending/add", 600),
+        ("/players/nfl/trending/drop", 600),
+        ("/league/1", 900),
+        ("/league/1/rosters", 180),
+        ("/league/1/users", 900),
+        ("/league/1/matchups/3", 60),
+        ("/league/1/transactions/3", 120),
+        ("/league/1/traded_picks", 300),
+        ("/league/1/drafts", 300),
+        ("/user/1", 3600),
+        ("/user/1/leagues/nfl/2023", 900),
+        ("/user/1/drafts/nfl/2023", 300),
+    ],
+)
+def test_default_policies_match_whole_paths(temp_cache_dir, path, ttl):
+    """Test that default policies never reach endpoints they do not name."""
+    cache = APICache(
+        cache_dir=temp_cache_dir,
+        ttl=300,
+        io_workers=0,
+        policies=CacheConfig().policies,
+        base_path="/v1",
+    )
+    request = Request("GET", "https://api.sleeper.app/v1" + path)
+    response = Response(200, json=[], request=request)
+    
+    assert cache._get_ttl(response, {}) == ttl
+    cache.close()
+
+
+def test_deprecated_max_size_setting():
+    """Test that the old max_size setting still limits the number of entries."""
+    with pytest.warns(DeprecationWarning):
+        config = CacheConfig(max_size=200)
+    assert config.max_entries == 200
+    with pytest.warns(DeprecationWarning):
+        assert config.max_size == 200
+    
+    # The new setting wins when both are given
+    with pytest.warns(DeprecationWarning):
+        assert CacheConfig(max_size=200, max_entries=300).max_entries == 300
+
+
+@pytest.mark.asyncio
+async def test_pinned_entries(temp_cache_dir):
+    """Test that pinned entries never expire and survive a regular clear."""
+    with freeze_time("2023-10-21 07:00:00"):
+        cache = APICache(cache_dir=temp_cache_dir, io_workers=0)
+        pinned = create_test_request()
+        cache.set(pinned, create_test_response(pinned), pin=True)
+        other = Request("GET", "https://api.sleeper.app/v1/user/other")
+        cache.set(other, create_test_response(other))
+        
+    # Long past max-age and the disk expiry of regular entries
+    with freeze_time("2023-11-21 07:00:00"):
+        cache.memory.clear()
+        cached_response, is_fresh = await cache.get(pinned)
+        assert is_fresh is True
+        assert cached_response.json() == TEST_CONTENT
+        assert await cache.get(other) is None
+        
+        cache.clear()
+        assert (await cache.get(pinned))[1] is True
+        cache.close()
+        
+        # Pinned entries persist across instances
+        cache = APICache(cache_dir=temp_cache_dir, io_workers=0)
+        assert cache.get_stats()["pinned_entry_count"] == 1
+        assert (await cache.get(pinned))[1] is True
+        
+        cache.clear(include_pinned=True)
+        assert await cache.get(pinned) is None
+        assert cache.get_stats()["pinned_size"] == 0
+        cache.close()
+
+
+@pytest.mark.asyncio
+async def test_pin_budget(temp_cache_dir):
+    """Test that pinning promotes cached entries within the pinned budget."""
+    cache = APICache(cache_dir=temp_cache_dir, io_workers=0, pinned_max_size=0)
+    request = create_test_request()
+    assert await cache.pin(request) is False
+    
+    # Over budget, the entry stays in the regular tiers
+    cache.set(request, create_test_response(request), pin=True)
+    assert await cache.pin(request) is False
+    cached_response, _ = await cache.get(request)
+    assert cached_response.entry.metadata.pinned is False
+    assert cache.get_stats()["pinned_rejected_count"] == 2
+    
+    cache.pinned_max_size = 1024 * 1024
+    assert await cache.pin(request) is True
+    cache.memory.clear()
+    cached_response, _ = await cache.get(request)
+    assert cached_response.entry.metadata.pinned is True
+    assert cache.get_stats()["pinned_entry_count"] == 1
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_pinned_size_accounting(temp_cache_dir):
+    """Test that the pinned size is measured consistently and released on delete."""
+    cache = APICache(cache_dir=temp_cache_dir, io_workers=0, compression="zlib")
+    request = create_test_request()
+    cache.set(request, create_test_response(request), pin=True)
+    size = cache.get_stats()["pinned_size"]
+    entry = cache.memory.get(cache._generate_cache_key(request))
+    assert size == cache._entry_size(entry)
+    
+    # Pinning again does not count the entry twice
+    assert await cache.pin(request) is True
+    cache.set(request, create_test_response(request), pin=True)
+    assert cache.get_stats()["pinned_size"] == size
+    cache.close()
+    
+    # A restarted cache reads the same sizes back
+    cache = APICache(cache_dir=temp_cache_dir, io_workers=0, compression="zlib")
+    assert cache.get_stats()["pinned_size"] == size
+    
+    cache.delete(request)
+    stats = cache.get_stats()
+    assert stats["pinned_size"] == 0
+    assert stats["pinned_entry_count"] == 0
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_pin_refuses_entries_that_may_not_be_final(temp_cache_dir):
+    """Test that negative, stale and outdated entries are never pinned."""
+    cache = APICache(cache_dir=temp_cache_dir, io_workers=0, negative_ttl=30)
+    missing = Request("GET", "https://api.sleeper.app/v1/user/missing")
+    request = create_test_request()
+    
+    with freeze_time("2023-10-21 07:00:00"):
+        cache.set(missing, Response(404, request=missing))
+        cache.set(request, create_test_response(request))
+        assert await cache.pin(missing) is False
+        
+        # Cached before the response was known to be final
+        archived_at = datetime(2023, 10, 21, 7, 0, 1)
+        assert await cache.pin(request, created_after=archived_at) is False
+        
+    with freeze_time("2023-10-21 08:30:00"):
+        assert await cache.pin(request) is False
+        
+    assert cache.get_stats()["pinned_entry_count"] == 0
+    with freeze_time("2023-10-21 07:30:00"):
+        assert await cache.pin(request) is True
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_compressed_storage(temp_cache_dir):
+    """Test that large bodies are compressed on disk and read back intact."""
+    cache = APICache(cache_dir=temp_cache_dir, io_workers=0, compression="zlib")
+    players = {
+        str(i): {"full_name": f"Player {i}", "position": "WR"} for i in range(500)
+    }
+    large = Request("GET", "https://api.sleeper.app/v1/players/nfl")
+    cache.set(large, Response(200, json=players, request=large))
+    small = create_test_request()
+    cache.set(small, create_test_response(small))
+    
+    key = cache._generate_cache_key(large)
+    stored = cache.cache.get(key)
+    assert stored[5] == 1  # Flags byte marks the body as zlib-compressed
+    assert cache.cache.get(cache._generate_cache_key(small))[5] == 0
+    
+    cache.memory.clear()
+    cached_response, _ = await cache.get(large)
+    assert cached_response.json() == players
+    
+    stats = cache.get_stats()
+    assert stats["compression"] == "zlib"
+    assert stats["compressed_count"] == 1
+    assert stats["compression_ratio"] > 5
+    assert stats["decompressed_count"] == 1
+    assert stats["decompress_cpu_seconds"] >= 0
+    cache.close()
+
+
+def test_incompressible_bodies_are_not_counted(temp_cache_dir):
+    """Test that bodies stored as is do not count towards compression stats."""
+    cache = APICache(cache_dir=temp_cache_dir, io_workers=0, compression="zlib")
+    request = Request("GET", "https://api.sleeper.app/v1/players/nfl")
+    cache.set(request, Response(200, content=os.urandom(4096), request=request))
+    
+    assert cache.cache.get(cache._generate_cache_key(request))[5] == 0
+    stats = cache.get_stats()
+    assert stats["compressed_count"] == 0
+    assert stats["compression_ratio"] == 0.0
+    cache.close()
+
+
+def test_resolve_compression():
+    """Test that compression settings resolve to available methods."""
+    assert resolve_compression(None) is None
+    assert resolve_compression("none") is None
+    assert resolve_compression("zlib") == "zlib"
+    assert resolve_compression("auto") in ("zstd", "zlib")
+    with pytest.raises(ValueError):
+        resolve_compression("brotli")
+
+
+@pytest.mark.asyncio
+async def test_negative_caching(temp_cache_dir):
+    """Test that not-found results are cached briefly and counted separately."""
+    cache = APICache(cache_dir=temp_cache_dir, io_workers=0, negative_ttl=30)
+    missing = Request("GET", "https://api.sleeper.app/v1/user/missing")
+    unknown = Request("GET", "https://api.sleeper.app/v1/user/unknown")
+    error = Request("GET", "https://api.sleeper.app/v1/user/error")
+    
+    with freeze_time("2023-10-21 07:00:00"):
+        headers = {"Cache-Control": "max-age=3600"}
+        cache.set(missing, Response(404, headers=headers, request=missing))
+        cache.set(unknown, Response(200, content=b"null", request=unknown))
+        cache.set(error, Response(500, request=error))
+        
+    with freeze_time("2023-10-21 07:00:20"):
+        cached_response, is_fresh = await cache.get(missing)
+        assert is_fresh is True
+        assert cached_response.status_code == 404
+        cached_response, is_fresh = await cache.get(unknown)
+        assert is_fresh is True
+        assert cached_response.json() is None
+        assert await cache.get(error) is None
+        
+    # Negative entries expire after their own TTL, whatever the headers say
+    with freeze_time("2023-10-21 07:01:00"):
+        assert await cache.get(missing) is None
+        assert await cache.get(unknown) is None
+        
+    stats = cache.get_stats()
+    assert stats["negative_ttl"] == 30
+    assert stats["negative_store_count"] == 2
+    assert stats["negative_hit_count"] == 2
+    cache.close()
+    
+    disabled = APICache(
+        cache_dir=temp_cache_dir / "disabled", io_workers=0, negative_ttl=0
+    )
+    disabled.set(missing, Response(404, request=missing))
+    assert await disabled.get(missing) is None
+    disabled.close()
+
+
+@pytest.mark.asyncio
+async def test_refresh_after_not_modified(api_cache):
+    """Test that a 304 renews freshness without rewriting the stored body."""
+    request = create_test_request()
+    response = create_test_response(request)
+    key = api_cache._generate_cache_key(request)
+    
+    with freeze_time("2023-10-21 07:00:00"):
+        api_cache.set(request, response)
+        await api_cache.drain()
+        stored = api_cache.cache.get(key)
+        
+    with freeze_time("2023-10-21 08:30:00"):
+        cached_response, is_fresh = await api_cache.get(request)
+        assert is_fresh is False
+        assert cached_response.conditional_headers == {
+            "If-None-Match": "abc123",
+            "If-Modified-Since": "Sat, 21 Oct 2023 07:28:00 GMT",
+        }
+        
+        not_modified = Response(
+            status_code=304,
+            headers={"ETag": "abc123", "Cache-Control": "max-age=7200"},
+            request=request
+        )
+        await api_cache.refresh(request, not_modified)
+        
+        cached_response, is_fresh = await api_cache.get(request)
+        assert is_fresh is True
+        assert cached_response.content == response.content
+        await api_cache.drain()
+        assert api_cache.cache.get(key) == stored
+        
+        # The refreshed metadata is picked up when loading from disk
+        api_cache.memory.clear()
+        cached_response, is_fresh = await api_cache.get(request)
+        assert is_fresh is True
+        assert cached_response.headers["cache-control"] == "max-age=7200"
+        
+    assert api_cache.get_stats()["refresh_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_writes_are_queued_off_the_response_path(threaded_cache):
+    """Test that writes are applied in the background and stay readable."""
+    request = create_test_request()
+    response = create_test_response(request)
+    key = threaded_cache._generate_cache_key(request)
+    
+    threaded_cache.set(request, response)
+    threaded_cache.memory.clear()
+    
+    # Readers see the queued entry before it reaches the disk
+    cached_response, is_fresh = await threaded_cache.get(request)
+    assert is_fresh is True
+    assert cached_response.content == response.content
+    
+    await threaded_cache.drain()
+    assert threaded_cache.cache.get(key) is not None
+    assert threaded_cache.get_stats()["pending_writes"] == 0
+    assert threaded_cache.get_stats()["write_batches"] >= 1
+    
+    # Reads of entries already on disk run on the I/O threads
+    threaded_cache.memory.clear()
+    cached_response, is_fresh = await threaded_cache.get(request)
+    assert is_fresh is True
+    assert threaded_cache.get_stats()["l2_hit_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_queued_deletes_hide_entries(threaded_cache):
+    """Test that deleted entries are not read back while the delete is queued."""
+    request = create_test_request()
+    threaded_cache.set(request, create_test_response(request))
+    await threaded_cache.drain()
+    
+    threaded_cache.delete(request)
+    assert await threaded_cache.get(request) is None
+    
+    await threaded_cache.drain()
+    assert threaded_cache.cache.get(threaded_cache._generate_cache_key(request)) is None
+
+
+def test_oversized_entries_are_rejected(temp_cache_dir):
+    """Test that entries larger than the whole cache are not stored."""
+    cache = APICache(cache_dir=temp_cache_dir, max_size=16, io_workers=0)
+    request = create_test_request()
+    cache.set(request, create_test_response(request))
+    
+    assert cache.cache.get(cache._generate_cache_key(request)) is None
+    assert cache.get_stats()["rejected_count"] == 1
+    cache.close()
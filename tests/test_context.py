@@ -1,9 +1,12 @@
 """Tests for fantasy football context providers."""
 
+import json
+
 import pytest
 from typing import Dict, Any
 
 from src.mcp.context import (
+    ContextFragment,
     FantasyFootballContext,
     FantasyPosition,
     LeagueType,
@@ -153,3 +156,28 @@ def test_league_types_consistency(fantasy_context: FantasyFootballContext):
         # Verify that roster settings are present
         assert "roster_size" in league_type.typical_settings
         assert "starters" in league_type.typical_settings
+
+
+def test_context_fragments(fantasy_context: FantasyFootballContext):
+    """Test that fragments are precomputed, shared and read-only."""
+    fragment = fantasy_context.get_position_fragment("QB")
+    assert isinstance(fragment, ContextFragment)
+    position = fantasy_context.get_position_info("QB")
+    assert json.loads(fragment.json) == position.model_dump()
+    assert json.loads(json.dumps(fragment.data)) == json.loads(fragment.json)
+    
+    # Lookups in any case return the same precomputed fragment
+    assert fantasy_context.get_position_fragment("qb") is fragment
+    assert fantasy_context.get_position_fragment("Qb") is fragment
+    assert fantasy_context.get_league_type_fragment("PPR") is not None
+    assert fantasy_context.get_scoring_rule_fragment("Pass_TD") is not None
+    assert fantasy_context.get_position_fragment("XX") is None
+    
+    with pytest.raises(TypeError):
+        fragment.data["code"] = "RB"
+    with pytest.raises(TypeError):
+        fantasy_context.get_league_type_fragment("ppr").data["typical_settings"].clear()
+    data = fragment.data
+    with pytest.raises(TypeError):
+        data |= {"code": "RB"}
+    assert fragment.data["code"] == "QB"
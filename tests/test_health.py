@@ -0,0 +1,163 @@
+"""Test upstream health tracking and probes."""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+import respx
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.services.health import (
+    DEGRADED,
+    HEALTHY,
+    UNHEALTHY,
+    UNKNOWN,
+    HealthCanary,
+    UpstreamHealth,
+)
+
+
+@pytest.fixture
+def probe_client():
+    """Create a test client for probes without running the app lifespan."""
+    health = UpstreamHealth(failure_threshold=2)
+    app.state.sleeper_client = SimpleNamespace(health=health)
+    yield TestClient(app), health
+    del app.state.sleeper_client
+
+
+def test_status_transitions():
+    """Test that status follows consecutive and recent failures."""
+    health = UpstreamHealth(window_size=3, failure_threshold=2)
+    assert health.status == UNKNOWN
+
+    health.record_success(0.1)
+    assert health.status == HEALTHY
+
+    health.record_failure("HTTP 500")
+    assert health.status == DEGRADED
+    health.record_failure("HTTP 502")
+    assert health.status == UNHEALTHY
+    assert health.last_error == "HTTP 502"
+
+    # One success recovers, and old failures age out of the window
+    health.record_success()
+    assert health.status == DEGRADED
+    health.record_success()
+    health.record_success()
+    assert health.status == HEALTHY
+
+    stats = health.get_stats()
+    assert stats["recent_requests"] == 3
+    assert stats["recent_failures"] == 0
+    assert stats["consecutive_failures"] == 0
+
+
+@pytest.mark.asyncio
+async def test_client_records_upstream_outcomes(sleeper_client, base_url):
+    """Test that upstream errors count as failures but client errors do not."""
+    with respx.mock(base_url=base_url) as api:
+        api.get("/user/missing").mock(return_value=httpx.Response(404))
+        api.get("/user/broken").mock(return_value=httpx.Response(503))
+        api.get("/user/offline").mock(side_effect=httpx.ConnectError("refused"))
+
+        for identifier in ("missing", "broken", "offline"):
+            with pytest.raises(HTTPException):
+                await sleeper_client.get_user(identifier)
+
+    stats = sleeper_client.health.get_stats()
+    assert stats["recent_requests"] == 3
+    assert stats["recent_failures"] == 2
+    assert stats["consecutive_failures"] == 2
+    assert stats["last_error"] == "refused"
+
+
+@pytest.mark.asyncio
+async def test_client_skips_cache_hits(sleeper_client, base_url, nfl_state):
+    """Test that cache hits do not count as upstream outcomes."""
+    with respx.mock(base_url=base_url) as api:
+        api.get("/state/nfl").mock(return_value=httpx.Response(200, json=nfl_state))
+        await sleeper_client.get_nfl_state()
+        await sleeper_client.get_nfl_state()
+
+    assert sleeper_client.health.get_stats()["recent_requests"] == 1
+    assert sleeper_client.health.status == HEALTHY
+
+
+@pytest.mark.asyncio
+async def test_canary_only_probes_quiet_upstream(sleeper_client, base_url, nfl_state):
+    """Test that the canary skips probes while traffic is being recorded."""
+    canary = HealthCanary(sleeper_client, interval=60)
+    with respx.mock(base_url=base_url) as api:
+        route = api.get("/state/nfl").mock(
+            side_effect=[httpx.Response(500), httpx.Response(200, json=nfl_state)]
+        )
+        assert await canary.check_once()
+        assert not await canary.check_once()
+
+        # Force the record to look old
+        sleeper_client.health._last_failure -= 120
+        assert await canary.check_once()
+
+    assert route.call_count == 2
+    assert sleeper_client.health.status == DEGRADED
+    stats = canary.get_stats()
+    assert stats["checks"] == 2
+    assert stats["skipped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_client_records_unparseable_body_as_failure(sleeper_client, base_url):
+    """Test that a successful status with a non-JSON body counts as a failure."""
+    with respx.mock(base_url=base_url) as api:
+        api.get("/state/nfl").mock(return_value=httpx.Response(200, text="<html>"))
+        with pytest.raises(HTTPException) as exc_info:
+            await sleeper_client.get_nfl_state()
+
+    assert exc_info.value.status_code == 502
+    stats = sleeper_client.health.get_stats()
+    assert stats["recent_requests"] == 1
+    assert stats["recent_failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_canary_survives_unexpected_errors(sleeper_client, monkeypatch):
+    """Test that an unexpected error does not stop the background task."""
+    canary = HealthCanary(sleeper_client, interval=0)
+    calls = []
+
+    async def failing_check():
+        calls.append(None)
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(canary, "check_once", failing_check)
+    canary.start()
+    while len(calls) < 2:
+        await asyncio.sleep(0)
+    assert canary.running
+    await canary.stop()
+
+
+def test_probes_answer_from_memory(probe_client):
+    """Test that probes report recorded upstream health without requests."""
+    client, health = probe_client
+
+    assert client.get("/health/live").json() == {"status": "alive"}
+    response = client.get("/health/ready")
+    assert response.status_code == 200
+    assert response.json()["upstream"]["status"] == UNKNOWN
+    assert client.get("/health").json()["status"] == "healthy"
+
+    health.record_failure("HTTP 500")
+    health.record_failure("HTTP 503")
+    response = client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["status"] == "unavailable"
+
+    data = client.get("/health").json()
+    assert data["status"] == "unhealthy"
+    assert "HTTP 503" in data["message"]
+    assert client.get("/health/live").status_code == 200
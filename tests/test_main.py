@@ -1,11 +1,18 @@
 """Test the FastAPI application endpoints."""
 
+import asyncio
+import time
+
+import httpx
 import pytest
+import respx
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
 import pytest_asyncio
 
+from src.config import get_config
 from src.main import app
+from src.sleeper_mcp.main import app as sleeper_mcp_app
 
 
 @pytest.fixture
@@ -32,3 +39,51 @@ async def test_health_check(async_client: AsyncClient):
     assert "message" in data
     assert isinstance(data["status"], str)
     assert isinstance(data["message"], str)
+
+
+def test_startup_does_not_wait_on_prewarm(monkeypatch, base_url):
+    """Test that a slow upstream delays startup by the prewarm timeout at most."""
+    async def prewarm(self, connections=None):
+        await asyncio.sleep(30)
+        
+    monkeypatch.setattr("src.services.sleeper.SleeperAPIClient.prewarm", prewarm)
+    monkeypatch.setattr(get_config().sleeper_api, "prewarm_timeout_seconds", 0.05)
+    
+    started = time.monotonic()
+    with respx.mock(base_url=base_url, assert_all_called=False) as api:
+        api.get("/state/nfl").mock(return_value=httpx.Response(503))
+        with TestClient(app) as client:
+            assert client.get("/health/live").status_code == 200
+    assert time.monotonic() - started < 5
+
+
+def test_sleeper_mcp_routes_share_the_client(monkeypatch, base_url):
+    """Test that the mounted sleeper_mcp app uses the MCP server's client."""
+    monkeypatch.setattr(get_config().sleeper_api, "prewarm_connections", 0)
+    user = {
+        "username": "test",
+        "user_id": "123",
+        "display_name": "Test",
+        "avatar": None,
+    }
+    
+    with respx.mock(base_url=base_url, assert_all_called=False) as api:
+        api.get("/state/nfl").mock(return_value=httpx.Response(503))
+        route = api.get("/user/test").mock(
+            return_value=httpx.Response(200, json=user)
+        )
+        with TestClient(app) as client:
+            assert client.get("/sleeper/users/test").json()["user_id"] == "123"
+            response = client.post(
+                "/invoke",
+                json={
+                    "function_name": "get_user",
+                    "parameters": {"identifier": "test"},
+                },
+            )
+            assert response.json()["result"]["user_id"] == "123"
+            transport = sleeper_mcp_app.state.sleeper_client._transport
+            assert transport is app.state.sleeper_client
+            
+    # The second lookup is answered from the shared cache
+    assert route.call_count == 1
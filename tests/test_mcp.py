@@ -1,6 +1,8 @@
 """Test the MCP protocol implementation."""
 
-from typing import Any, Dict
+import asyncio
+import json
+from typing import Any, AsyncIterator, Dict, List
 from unittest.mock import Mock, patch
 
 import pytest
@@ -8,13 +10,14 @@ from fastapi import HTTPException
 from httpx import AsyncClient
 
 from src.mcp import (
+    MCPBatchInvocation,
     MCPHandler,
     MCPInvocation,
     MCPResponse,
     MCPResponseStatus,
     get_mcp_capabilities,
 )
-from src.models import NFLState, User
+from src.models import NFLState, Player, User
 from src.services import SleeperAPIClient
 
 
@@ -165,3 +168,195 @@ async def test_mcp_handler_result_serialization(mcp_handler: MCPHandler):
     
     assert result.status == MCPResponseStatus.SUCCESS
     assert isinstance(result.result, list)
+
+
+@pytest.mark.asyncio
+async def test_batch_invocation(mcp_handler: MCPHandler):
+    """Test that batches deduplicate calls and keep per-item results in order."""
+    mcp_handler.client.get_user.return_value = User(
+        username="test",
+        user_id="123",
+        display_name="Test User",
+        avatar=None,
+    )
+    mcp_handler.client.get_league.side_effect = HTTPException(
+        status_code=404,
+        detail="League not found",
+    )
+    
+    batch = MCPBatchInvocation(
+        invocations=[
+            MCPInvocation(function_name="get_user", parameters={"identifier": "test"}),
+            MCPInvocation(function_name="get_league", parameters={"league_id": "1"}),
+            MCPInvocation(function_name="get_user", parameters={"identifier": "test"}),
+            MCPInvocation(function_name="nonexistent_function"),
+        ]
+    )
+    response = await mcp_handler.execute_batch(batch)
+    
+    statuses = [result.status for result in response.results]
+    assert statuses == [
+        MCPResponseStatus.SUCCESS,
+        MCPResponseStatus.ERROR,
+        MCPResponseStatus.SUCCESS,
+        MCPResponseStatus.ERROR,
+    ]
+    assert response.results[0].result["username"] == "test"
+    assert "League not found" in response.results[1].error
+    assert mcp_handler.client.get_user.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_only_advertised_functions_are_invoked(mcp_handler: MCPHandler):
+    """Test that public client methods outside the capabilities are refused."""
+    batch = MCPBatchInvocation(
+        invocations=[
+            MCPInvocation(function_name="close", parameters={}),
+            MCPInvocation(function_name="get_json", parameters={"path": "/state/nfl"}),
+            MCPInvocation(function_name="refresh", parameters={"path": "/state/nfl"}),
+        ]
+    )
+    response = await mcp_handler.execute_batch(batch)
+    
+    for result in response.results:
+        assert result.status == MCPResponseStatus.ERROR
+        assert "Unknown function" in result.error
+    lines = await collect_lines(
+        mcp_handler.stream_function(
+            MCPInvocation(function_name="prewarm", parameters={})
+        )
+    )
+    assert lines == [
+        {"status": "error", "error": "Internal error: Unknown function: prewarm"}
+    ]
+    mcp_handler.client.close.assert_not_called()
+    mcp_handler.client.get_json.assert_not_called()
+    mcp_handler.client.prewarm.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_batch_concurrency_cap(mock_sleeper_client):
+    """Test that batches never run more invocations at once than allowed."""
+    handler = MCPHandler(mock_sleeper_client, batch_concurrency=2)
+    running = 0
+    peak = 0
+    
+    async def get_league(league_id: str) -> Dict[str, Any]:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return {"league_id": league_id}
+    
+    mock_sleeper_client.get_league.side_effect = get_league
+    batch = MCPBatchInvocation(
+        invocations=[
+            MCPInvocation(function_name="get_league", parameters={"league_id": str(i)})
+            for i in range(6)
+        ]
+    )
+    response = await handler.execute_batch(batch)
+    
+    league_ids = [r.result["league_id"] for r in response.results]
+    assert league_ids == [str(i) for i in range(6)]
+    assert peak == 2
+
+
+async def collect_lines(stream: AsyncIterator[bytes]) -> List[Dict[str, Any]]:
+    """Decode every line of a JSON lines stream."""
+    return [json.loads(line) async for line in stream]
+
+
+@pytest.mark.asyncio
+async def test_stream_list_result(mcp_handler: MCPHandler):
+    """Test that list results are streamed one enhanced item per line."""
+    async def players() -> AsyncIterator[Player]:
+        yield Player(player_id="4046", full_name="Patrick Mahomes", position="QB")
+        yield Player(player_id="1466", full_name="Travis Kelce", position="TE")
+    
+    mcp_handler.client.iter_search_players.return_value = players()
+    lines = await collect_lines(
+        mcp_handler.stream_function(
+            MCPInvocation(function_name="search_players", parameters={"team": "KC"})
+        )
+    )
+    
+    assert [line["item"]["player_id"] for line in lines[:2]] == ["4046", "1466"]
+    assert lines[0]["item"]["position_info"]["code"] == "QB"
+    assert lines[-1] == {"status": "success", "count": 2}
+    mcp_handler.client.iter_search_players.assert_called_once_with(team="KC")
+
+
+@pytest.mark.asyncio
+async def test_stream_single_result(mcp_handler: MCPHandler):
+    """Test that non-list results are streamed as one result line."""
+    mcp_handler.client.get_user.return_value = User(
+        username="test",
+        user_id="123",
+        display_name="Test User",
+        avatar=None,
+    )
+    
+    lines = await collect_lines(
+        mcp_handler.stream_function(
+            MCPInvocation(function_name="get_user", parameters={"identifier": "test"})
+        )
+    )
+    
+    assert lines[0]["result"]["username"] == "test"
+    assert lines[1] == {"status": "success", "count": 1}
+
+
+@pytest.mark.asyncio
+async def test_stream_reports_errors(mcp_handler: MCPHandler):
+    """Test that failures end the stream with an error line."""
+    async def users() -> AsyncIterator[User]:
+        yield User(username="a", user_id="1", display_name="A", avatar=None)
+        raise HTTPException(status_code=404, detail="League not found")
+    
+    mcp_handler.client.iter_league_users.return_value = users()
+    lines = await collect_lines(
+        mcp_handler.stream_function(
+            MCPInvocation(
+                function_name="get_league_users", parameters={"league_id": "1"}
+            )
+        )
+    )
+    
+    assert lines[0]["item"]["user_id"] == "1"
+    assert lines[1] == {"status": "error", "error": "League not found"}
+
+
+@pytest.mark.asyncio
+async def test_list_results_reuse_context_fragments(mcp_handler: MCPHandler):
+    """Test that list items are dumped once and share position fragments."""
+    mcp_handler.client.search_players.return_value = [
+        Player(player_id="4046", full_name="Patrick Mahomes", position="QB"),
+        Player(player_id="4984", full_name="Josh Allen", position="QB"),
+    ]
+    
+    invocation = MCPInvocation(
+        function_name="search_players", parameters={"position": "QB"}
+    )
+    first = await mcp_handler.execute_function(invocation)
+    second = await mcp_handler.execute_function(invocation)
+    
+    items = first.result + second.result
+    assert all(isinstance(item, dict) for item in items)
+    assert items[0]["position_info"]["code"] == "QB"
+    assert all(item["position_info"] is items[0]["position_info"] for item in items)
+
+
+@pytest.mark.asyncio
+async def test_dict_results_are_not_modified(mcp_handler: MCPHandler):
+    """Test that enhancement never writes into dicts owned by the client."""
+    league = {"league_id": "1", "scoring_settings": {"reception": 1}}
+    mcp_handler.client.get_league.return_value = league
+    
+    result = await mcp_handler.execute_function(
+        MCPInvocation(function_name="get_league", parameters={"league_id": "1"})
+    )
+    
+    assert "league_type_info" in result.result["context"]
+    assert "context" not in league
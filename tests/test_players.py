@@ -0,0 +1,132 @@
+"""Tests for the columnar player store."""
+
+import sys
+
+from freezegun import freeze_time
+
+from src.models import Player
+from src.services.players import PLAYER_REFRESH_INTERVAL, PlayerRecord, PlayerStore
+
+PLAYERS = {
+    "4046": {
+        "player_id": "4046",
+        "full_name": "Patrick Mahomes",
+        "position": "QB",
+        "team": "KC",
+        "number": 15,
+        "status": "Active",
+    },
+    "4984": {
+        "player_id": "4984",
+        "full_name": "Josh Allen",
+        "position": "QB",
+        "team": "BUF",
+        "number": 17,
+        "status": "Active",
+    },
+    "1466": {
+        "player_id": "1466",
+        "full_name": "Travis Kelce",
+        "position": "TE",
+        "team": "KC",
+        "number": 87,
+        "status": "Active",
+    },
+    "KC": {
+        "player_id": "KC",
+        "first_name": "Kansas City",
+        "last_name": "Chiefs",
+        "position": "DEF",
+        "team": "KC",
+        "number": None,
+        "status": None,
+    },
+}
+
+
+def test_lookup_by_id():
+    """Test that players are found by ID and converted to models."""
+    store = PlayerStore.from_players(PLAYERS)
+    
+    assert len(store) == 4
+    record = store.get("4046")
+    assert isinstance(record, PlayerRecord)
+    assert record.full_name == "Patrick Mahomes"
+    assert record.number == 15
+    
+    player = record.to_model()
+    assert isinstance(player, Player)
+    assert player.team == "KC"
+    assert store.get("missing") is None
+
+
+def test_missing_fields():
+    """Test that names are built from parts and empty numbers map to None."""
+    store = PlayerStore.from_players(PLAYERS)
+    
+    record = store.get("KC")
+    assert record.full_name == "Kansas City Chiefs"
+    assert record.number is None
+    assert record.status is None
+
+
+def test_numbers_are_coerced_like_the_model():
+    """Test that numeric strings are kept and unstorable numbers map to None."""
+    players = {
+        player_id: {
+            "player_id": player_id,
+            "full_name": f"Player {player_id}",
+            "position": "TE",
+            "number": number,
+        }
+        for player_id, number in (("1", "87"), ("2", 99999), ("3", "n/a"))
+    }
+    store = PlayerStore.from_players(players)
+    
+    assert store.get("1").number == 87
+    assert store.get("1").number == Player.model_validate(players["1"]).number
+    assert store.get("2").number is None
+    assert store.get("3").number is None
+
+
+def test_search_by_name():
+    """Test exact and prefix name searches, ignoring case."""
+    store = PlayerStore.from_players(PLAYERS)
+    
+    assert [r.player_id for r in store.search(name="josh allen")] == ["4984"]
+    assert [r.player_id for r in store.search(name="TRAV")] == ["1466"]
+    assert store.search(name="nobody") == []
+
+
+def test_search_by_team_and_position():
+    """Test that filters are combined and limited."""
+    store = PlayerStore.from_players(PLAYERS)
+    
+    kc = store.search(team="kc")
+    assert {r.player_id for r in kc} == {"4046", "1466", "KC"}
+    assert [r.player_id for r in store.search(team="KC", position="QB")] == ["4046"]
+    assert len(store.search(position="QB", limit=1)) == 1
+    assert store.search() == []
+
+
+def test_repeated_values_are_interned():
+    """Test that repeated team strings share one object."""
+    data = {
+        pid: {**player, "team": "".join(["K", "C"])}
+        for pid, player in PLAYERS.items()
+    }
+    store = PlayerStore.from_players(data)
+    
+    teams = [store.get(pid).team for pid in data]
+    assert all(team is sys.intern("KC") for team in teams)
+
+
+def test_staleness():
+    """Test that the store expires after the refresh interval."""
+    assert PlayerStore().is_stale()
+    
+    with freeze_time("2023-11-01 12:00:00") as frozen:
+        store = PlayerStore.from_players(PLAYERS)
+        assert not store.is_stale()
+        frozen.tick(PLAYER_REFRESH_INTERVAL + 1)
+        assert store.is_stale()
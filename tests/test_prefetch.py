@@ -0,0 +1,154 @@
+"""Test background prefetching."""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+import httpx
+import pytest
+import respx
+
+from src.config.settings import PrefetchConfig
+from src.models import NFLState
+from src.services.prefetch import RETRY_INTERVAL, PrefetchScheduler
+
+TEST_LEAGUE = {
+    "league_id": "789",
+    "name": "Test League",
+    "season": "2023",
+    "status": "in_season",
+    "sport": "nfl",
+    "settings": {"draft_type": "snake", "num_teams": 12},
+    "total_rosters": 12,
+}
+
+# 2023-11-12 was a Sunday and 2023-11-14 a Tuesday
+SUNDAY = datetime(2023, 11, 12, 18, 0, tzinfo=timezone.utc)
+TUESDAY = datetime(2023, 11, 14, 18, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def scheduler(sleeper_client):
+    """Create a scheduler tracking a single league."""
+    return PrefetchScheduler(sleeper_client, PrefetchConfig(league_ids=["789", "789"]))
+
+
+def mock_league_routes(api: respx.Router, nfl_state: Dict[str, Any]) -> None:
+    """Mock the endpoints prefetched for the test league."""
+    api.get("/state/nfl").mock(return_value=httpx.Response(200, json=nfl_state))
+    api.get("/league/789").mock(return_value=httpx.Response(200, json=TEST_LEAGUE))
+    api.get("/league/789/rosters").mock(return_value=httpx.Response(200, json=[]))
+    api.get("/league/789/users").mock(return_value=httpx.Response(200, json=[]))
+
+
+@pytest.mark.asyncio
+async def test_run_once_warms_cache(scheduler, sleeper_client, base_url, nfl_state):
+    """Test that a run caches the NFL state and every tracked league endpoint."""
+    with respx.mock(base_url=base_url) as api:
+        mock_league_routes(api, nfl_state)
+        state = await scheduler.run_once()
+
+        assert state.season_type == "regular"
+        assert api.calls.call_count == 4
+
+        # Later requests are answered from the cache
+        await sleeper_client.get_league("789")
+        await sleeper_client.get_league_rosters("789")
+        await sleeper_client.get_league_users("789")
+        assert api.calls.call_count == 4
+
+    stats = scheduler.get_stats()
+    assert stats["runs"] == 1
+    assert stats["prefetched"] == 4
+    assert stats["failures"] == 0
+    assert sleeper_client.get_request_stats()["rate_limit"]["acquired"] == 4
+
+
+@pytest.mark.asyncio
+async def test_run_once_revalidates_fresh_entries(
+    scheduler, sleeper_client, base_url, nfl_state
+):
+    """Test that each run revalidates entries even while they are fresh."""
+    def respond(data):
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304, headers={"ETag": '"v1"'})
+            return httpx.Response(200, json=data, headers={"ETag": '"v1"'})
+        return handler
+
+    with respx.mock(base_url=base_url) as api:
+        api.get("/state/nfl").mock(side_effect=respond(nfl_state))
+        api.get("/league/789").mock(side_effect=respond(TEST_LEAGUE))
+        api.get("/league/789/rosters").mock(side_effect=respond([]))
+        api.get("/league/789/users").mock(side_effect=respond([]))
+        await scheduler.run_once()
+        state = await scheduler.run_once()
+
+        assert api.calls.call_count == 8
+        assert state.season == "2023"
+
+    stats = sleeper_client.get_request_stats()
+    assert stats["full_fetches"] == 4
+    assert stats["revalidated_responses"] == 4
+
+
+def test_enabled_only_with_leagues(sleeper_client):
+    """Test that prefetching defaults to on only when leagues are tracked."""
+    assert PrefetchScheduler(sleeper_client, PrefetchConfig(league_ids=["789"])).enabled
+    assert not PrefetchScheduler(sleeper_client, PrefetchConfig()).enabled
+    assert PrefetchScheduler(sleeper_client, PrefetchConfig(enabled=True)).enabled
+    assert not PrefetchScheduler(
+        sleeper_client, PrefetchConfig(enabled=False, league_ids=["789"])
+    ).enabled
+
+
+@pytest.mark.asyncio
+async def test_run_once_tolerates_failures(scheduler, base_url, nfl_state):
+    """Test that failed requests are counted without aborting the run."""
+    with respx.mock(base_url=base_url) as api:
+        mock_league_routes(api, nfl_state)
+        api.get("/state/nfl").mock(return_value=httpx.Response(500))
+        api.get("/league/789/users").mock(return_value=httpx.Response(404))
+        state = await scheduler.run_once()
+
+    assert state is None
+    stats = scheduler.get_stats()
+    assert stats["prefetched"] == 2
+    assert stats["failures"] == 2
+
+
+def test_next_interval_follows_season(scheduler, nfl_state):
+    """Test that the cadence adapts to the season type and game days."""
+    config = scheduler.config
+    regular = NFLState(**nfl_state)
+    preseason = NFLState(**{**nfl_state, "season_type": "pre"})
+    offseason = NFLState(**{**nfl_state, "season_type": "off"})
+
+    assert scheduler.next_interval(regular, SUNDAY) == config.game_day_interval_seconds
+    assert scheduler.next_interval(regular, TUESDAY) == config.season_interval_seconds
+    assert scheduler.next_interval(preseason, SUNDAY) == config.season_interval_seconds
+    offseason_interval = scheduler.next_interval(offseason, SUNDAY)
+    assert offseason_interval == config.offseason_interval_seconds
+    assert scheduler.next_interval(None, SUNDAY) == RETRY_INTERVAL
+
+    # Late Sunday night games still count as Sunday in the league's timezone
+    assert scheduler.is_game_day(datetime(2023, 11, 13, 3, 0, tzinfo=timezone.utc))
+
+
+@pytest.mark.asyncio
+async def test_start_and_stop(scheduler, base_url, nfl_state):
+    """Test that the background task runs immediately and stops cleanly."""
+    with respx.mock(base_url=base_url) as api:
+        mock_league_routes(api, nfl_state)
+        scheduler.start()
+        scheduler.start()
+        assert scheduler.running
+
+        while scheduler.get_stats()["runs"] == 0:
+            await asyncio.sleep(0.01)
+        await scheduler.stop()
+
+    stats = scheduler.get_stats()
+    assert not stats["running"]
+    assert stats["runs"] == 1
+    assert stats["next_interval_seconds"] is not None
@@ -0,0 +1,70 @@
+"""Tests for the upstream rate limiter."""
+
+import asyncio
+import time
+
+import pytest
+
+from src.services.rate_limit import RateLimitExceeded, TokenBucket
+
+
+def test_burst_capacity():
+    """Test that a full bucket admits a burst without waiting."""
+    bucket = TokenBucket(rate_per_minute=600, burst=5)
+    
+    delays = [bucket.reserve() for _ in range(5)]
+    assert delays == [0.0] * 5
+    
+    # Sixth request exceeds the burst and has no wait budget
+    with pytest.raises(RateLimitExceeded) as exc_info:
+        bucket.reserve()
+    assert exc_info.value.retry_after == pytest.approx(0.1, abs=0.01)
+
+
+def test_burst_is_capped_at_rate():
+    """Test that the burst never exceeds the per-minute rate."""
+    bucket = TokenBucket(rate_per_minute=2, burst=50)
+    assert bucket.capacity == 2
+
+
+def test_waiters_are_paced_in_order():
+    """Test that queued reservations are spaced by the refill interval."""
+    bucket = TokenBucket(rate_per_minute=600, burst=1, max_wait=1.0)
+    
+    assert bucket.reserve() == 0.0
+    delays = [bucket.reserve() for _ in range(3)]
+    assert delays == pytest.approx([0.1, 0.2, 0.3], abs=0.01)
+    
+    stats = bucket.get_stats()
+    assert stats["throttled"] == 3
+    assert stats["rejected"] == 0
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_capacity():
+    """Test that acquire paces concurrent callers instead of failing."""
+    bucket = TokenBucket(rate_per_minute=1200, burst=1, max_wait=1.0)
+    
+    start = time.monotonic()
+    await asyncio.gather(*(bucket.acquire() for _ in range(4)))
+    elapsed = time.monotonic() - start
+    
+    # One immediate token, then three more at 50ms intervals
+    assert elapsed >= 0.14
+    assert bucket.get_stats()["acquired"] == 4
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_returns_token():
+    """Test that a cancelled waiter hands its reservation back."""
+    bucket = TokenBucket(rate_per_minute=60, burst=1, max_wait=5.0)
+    await bucket.acquire()
+    
+    waiter = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    
+    # The next caller waits for the first refill, not the second
+    assert bucket.reserve() <= 1.0
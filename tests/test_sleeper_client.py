@@ -1,16 +1,25 @@
 """Test the Sleeper API client."""
 
-from datetime import datetime
+import asyncio
+from datetime import timedelta
 from typing import Any, Dict
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
+import respx
 from fastapi import HTTPException
-import httpx
 
 from src.config import Config
 from src.models import NFLState, User
-from src.services.sleeper import SleeperAPIClient
+from src.services.sleeper import acquire_shared_client, release_shared_client
+
+TEST_USER = {
+    "username": "testuser",
+    "user_id": "123456",
+    "display_name": "Test User",
+    "avatar": None,
+}
 
 
 @pytest.fixture
@@ -31,7 +40,7 @@ def mock_response():
 
 
 @pytest.mark.asyncio
-async def test_get_user(mock_config: Config, mock_response):
+async def test_get_user(mock_config: Config, make_sleeper_client, mock_response):
     """Test getting a user from the API."""
     test_user_data = {
         "username": "testuser",
@@ -43,7 +52,7 @@ async def test_get_user(mock_config: Config, mock_response):
     with patch("httpx.AsyncClient.request") as mock_request:
         mock_request.return_value = mock_response(test_user_data)
         
-        client = SleeperAPIClient(mock_config)
+        client = make_sleeper_client(mock_config)
         user = await client.get_user("testuser")
         
         assert isinstance(user, User)
@@ -54,36 +63,38 @@ async def test_get_user(mock_config: Config, mock_response):
 
 
 @pytest.mark.asyncio
-async def test_rate_limiting(mock_config: Config, mock_response):
+async def test_rate_limiting(mock_config: Config, make_sleeper_client, base_url):
     """Test that rate limiting is enforced."""
     mock_config.sleeper_api.rate_limit_per_minute = 2
-    test_data = {"week": 1, "season": "2023"}
+    mock_config.sleeper_api.rate_limit_max_wait_seconds = 1.0
+    client = make_sleeper_client(mock_config)
     
-    with patch("httpx.AsyncClient.request") as mock_request:
-        mock_request.return_value = mock_response(test_data)
-        
-        client = SleeperAPIClient(mock_config)
+    with respx.mock(base_url=base_url) as api:
+        api.get(url__regex=r"/user/.*").mock(
+            return_value=httpx.Response(200, json=TEST_USER)
+        )
         
         # First two requests should succeed
-        await client.get_nfl_state()
-        await client.get_nfl_state()
+        await client.get_user("first")
+        await client.get_user("second")
         
-        # Third request should fail
+        # Third request would wait 30s for a token, beyond the deadline
         with pytest.raises(HTTPException) as exc_info:
-            await client.get_nfl_state()
+            await client.get_user("third")
         
         assert exc_info.value.status_code == 429
+        assert client.get_request_stats()["rate_limit"]["rejected"] == 1
 
 
 @pytest.mark.asyncio
-async def test_caching(mock_config: Config, mock_response):
+async def test_caching(mock_config: Config, make_sleeper_client, mock_response):
     """Test that responses are cached."""
     test_data = {"week": 1, "season": "2023"}
     
     with patch("httpx.AsyncClient.request") as mock_request:
         mock_request.return_value = mock_response(test_data)
         
-        client = SleeperAPIClient(mock_config)
+        client = make_sleeper_client(mock_config)
         
         # First request should hit the API
         result1 = await client.get_nfl_state()
@@ -98,16 +109,441 @@ async def test_caching(mock_config: Config, mock_response):
 
 
 @pytest.mark.asyncio
-async def test_error_handling(mock_config: Config):
+async def test_error_handling(mock_config: Config, make_sleeper_client):
     """Test error handling for API requests."""
     with patch("httpx.AsyncClient.request") as mock_request:
         # Simulate a network error
         mock_request.side_effect = httpx.RequestError("Network error")
         
-        client = SleeperAPIClient(mock_config)
+        client = make_sleeper_client(mock_config)
         
         with pytest.raises(HTTPException) as exc_info:
             await client.get_nfl_state()
         
         assert exc_info.value.status_code == 500
         assert "Failed to communicate with Sleeper API" in str(exc_info.value.detail)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_coalesced(sleeper_client, base_url, nfl_state):
+    """Test that concurrent identical requests share one upstream call."""
+    async def slow_state(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json=nfl_state)
+    
+    with respx.mock(base_url=base_url) as api:
+        route = api.get("/state/nfl").mock(side_effect=slow_state)
+        results = await asyncio.gather(
+            *(sleeper_client.get_nfl_state() for _ in range(10))
+        )
+    
+    assert route.call_count == 1
+    assert all(result.week == 10 for result in results)
+    stats = sleeper_client.get_request_stats()
+    assert stats["upstream_requests"] == 1
+    assert stats["coalesced_requests"] == 9
+    assert stats["inflight_requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_coalesced_requests_share_errors(sleeper_client, base_url):
+    """Test that waiters receive the error of the shared upstream call."""
+    async def failing_user(request):
+        await asyncio.sleep(0.05)
+        return httpx.Response(404, json=None)
+    
+    with respx.mock(base_url=base_url) as api:
+        route = api.get("/user/missing").mock(side_effect=failing_user)
+        results = await asyncio.gather(
+            *(sleeper_client.get_user("missing") for _ in range(3)),
+            return_exceptions=True,
+        )
+    
+    assert route.call_count == 1
+    assert all(isinstance(result, HTTPException) for result in results)
+    assert all(result.status_code == 404 for result in results)
+
+
+@pytest.mark.asyncio
+async def test_stale_responses_revalidate_in_background(
+    sleeper_client, base_url, nfl_state
+):
+    """Test that stale entries are served at once and refreshed later."""
+    sleeper_client.cache.stale_while_revalidate = 300
+    
+    with respx.mock(base_url=base_url) as api:
+        route = api.get("/state/nfl").mock(
+            return_value=httpx.Response(
+                200,
+                json=nfl_state,
+                headers={"Cache-Control": "max-age=60"},
+            )
+        )
+        await sleeper_client.get_nfl_state()
+        
+        # Age the cached entry past its max-age
+        request = sleeper_client._client.build_request("GET", "/state/nfl")
+        key = sleeper_client.cache.generate_key(request)
+        entry = sleeper_client.cache.memory.get(key)
+        entry.metadata.created_at -= timedelta(seconds=120)
+        
+        route.mock(
+            return_value=httpx.Response(
+                200,
+                json=nfl_state | {"week": 11},
+                headers={"Cache-Control": "max-age=60"},
+            )
+        )
+        stale = await sleeper_client.get_nfl_state()
+        assert stale.week == 10
+        
+        # Let the background refresh finish
+        await asyncio.sleep(0.01)
+        fresh = await sleeper_client.get_nfl_state()
+        assert fresh.week == 11
+    
+    assert route.call_count == 2
+    stats = sleeper_client.get_request_stats()
+    assert stats["stale_responses"] == 1
+    assert stats["background_revalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_conditional_revalidation(sleeper_client, base_url, nfl_state):
+    """Test that stale entries are revalidated with conditional headers."""
+    with respx.mock(base_url=base_url) as api:
+        route = api.get("/state/nfl").mock(
+            return_value=httpx.Response(
+                200,
+                json=nfl_state,
+                headers={"Cache-Control": "max-age=60", "ETag": '"v1"'},
+            )
+        )
+        await sleeper_client.get_nfl_state()
+        
+        # Age the cached entry past its max-age
+        request = sleeper_client._client.build_request("GET", "/state/nfl")
+        key = sleeper_client.cache.generate_key(request)
+        entry = sleeper_client.cache.memory.get(key)
+        entry.metadata.created_at -= timedelta(seconds=120)
+        
+        route.mock(return_value=httpx.Response(304, headers={"ETag": '"v1"'}))
+        state = await sleeper_client.get_nfl_state()
+        
+        assert state.week == 10
+        assert route.calls.last.request.headers["If-None-Match"] == '"v1"'
+        
+        # The entry is fresh again, so no further upstream call is made
+        await sleeper_client.get_nfl_state()
+    
+    assert route.call_count == 2
+    stats = sleeper_client.get_request_stats()
+    assert stats["full_fetches"] == 1
+    assert stats["revalidated_responses"] == 1
+    assert stats["revalidated_bytes"] > 0
+
+
+@pytest.mark.asyncio
+async def test_player_lookup_downloads_once(sleeper_client, base_url):
+    """Test that player lookups share one download of the player map."""
+    players = {
+        "4046": {
+            "player_id": "4046",
+            "full_name": "Patrick Mahomes",
+            "position": "QB",
+            "team": "KC",
+            "number": 15,
+            "status": "Active",
+        },
+    }
+    
+    with respx.mock(base_url=base_url) as api:
+        route = api.get("/players/nfl").mock(
+            return_value=httpx.Response(200, json=players)
+        )
+        player = await sleeper_client.get_player("4046")
+        results = await sleeper_client.search_players(team="KC")
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await sleeper_client.get_player("missing")
+    
+    assert route.call_count == 1
+    assert player.full_name == "Patrick Mahomes"
+    assert [p.player_id for p in results] == ["4046"]
+    assert exc_info.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_streaming_matches_list_methods(sleeper_client, base_url):
+    """Test that lazy variants share the defaults and tracking of list methods."""
+    players = {
+        str(i): {
+            "player_id": str(i),
+            "full_name": f"Player {i}",
+            "position": "WR",
+            "team": "KC",
+        }
+        for i in range(30)
+    }
+    league = {
+        "league_id": "1",
+        "name": "Old League",
+        "season": "2022",
+        "status": "complete",
+        "sport": "nfl",
+        "settings": {"draft_type": "snake", "num_teams": 12},
+        "total_rosters": 12,
+    }
+    
+    with respx.mock(base_url=base_url) as api:
+        api.get("/players/nfl").mock(return_value=httpx.Response(200, json=players))
+        api.get("/user/123/leagues/nfl/2022").mock(
+            return_value=httpx.Response(200, json=[league])
+        )
+        
+        streamed = [p async for p in sleeper_client.iter_search_players(team="KC")]
+        leagues = [
+            league async for league in sleeper_client.iter_user_leagues("123", "2022")
+        ]
+    
+    assert len(streamed) == len(await sleeper_client.search_players(team="KC")) == 25
+    assert [league.league_id for league in leagues] == ["1"]
+    assert sleeper_client._is_archived_path("/league/1/rosters")
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_reuse_validated_models(sleeper_client, base_url):
+    """Test that repeat cache hits skip model validation."""
+    rosters = [
+        {"roster_id": i, "owner_id": str(i), "league_id": "1", "players": ["4046"]}
+        for i in range(12)
+    ]
+    
+    with respx.mock(base_url=base_url) as api:
+        api.get("/league/1/rosters").mock(
+            return_value=httpx.Response(
+                200,
+                json=rosters,
+                headers={"Cache-Control": "max-age=300"},
+            )
+        )
+        await sleeper_client.get_league_rosters("1")
+        first = await sleeper_client.get_league_rosters("1")
+        
+        with patch("src.models.Roster.model_validate") as validate:
+            second = await sleeper_client.get_league_rosters("1")
+    
+    validate.assert_not_called()
+    assert len(second) == 12
+    assert all(a is b for a, b in zip(first, second))
+    # Callers get their own list
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_prewarm_opens_connections(mock_config, make_sleeper_client, base_url):
+    """Test that prewarming sends one request per connection and tolerates errors."""
+    mock_config.sleeper_api.http2 = False
+    client = make_sleeper_client(mock_config)
+    
+    with respx.mock(base_url=base_url) as api:
+        route = api.head("/state/nfl").mock(
+            side_effect=[
+                httpx.Response(200),
+                httpx.ConnectError("refused"),
+                httpx.Response(405),
+            ]
+        )
+        opened = await client.prewarm(3)
+    
+    assert route.call_count == 3
+    assert opened == 2
+    assert await client.prewarm(0) == 0
+    assert client.get_request_stats()["http2"] is False
+
+
+@pytest.mark.asyncio
+async def test_shared_client_is_reference_counted():
+    """Test that apps share one client that closes after its last user."""
+    first = acquire_shared_client()
+    second = acquire_shared_client()
+    assert first is second
+    
+    with patch.object(first, "close") as close:
+        await release_shared_client()
+        close.assert_not_called()
+        await release_shared_client()
+        close.assert_awaited_once()
+    await first.close()
+    
+    third = acquire_shared_client()
+    assert third is not first
+    await release_shared_client()
+
+
+@pytest.mark.asyncio
+async def test_close_keeps_cached_responses(make_sleeper_client, base_url):
+    """Test that closing the client leaves the disk cache for the next start."""
+    client = make_sleeper_client()
+    
+    with respx.mock(base_url=base_url) as api:
+        route = api.get("/user/testuser").mock(
+            return_value=httpx.Response(200, json=TEST_USER)
+        )
+        await client.get_user("testuser")
+        await client.close()
+        
+        restarted = make_sleeper_client()
+        user = await restarted.get_user("testuser")
+        await restarted.close()
+    
+    assert user.user_id == TEST_USER["user_id"]
+    assert route.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_archived_leagues_are_pinned(sleeper_client, base_url, nfl_state):
+    """Test that complete and past-season leagues are served without expiry."""
+    league = {
+        "league_id": "1",
+        "name": "Old League",
+        "season": "2023",
+        "status": "in_season",
+        "sport": "nfl",
+        "settings": {"draft_type": "snake", "num_teams": 12},
+        "total_rosters": 12,
+    }
+    state = {**nfl_state, "season": "2024"}
+    
+    with respx.mock(base_url=base_url) as api:
+        api.get("/state/nfl").mock(return_value=httpx.Response(200, json=state))
+        league_route = api.get("/league/1").mock(
+            return_value=httpx.Response(200, json=league)
+        )
+        api.get("/league/2").mock(
+            return_value=httpx.Response(
+                200, json={**league, "league_id": "2", "season": "2024"}
+            )
+        )
+        rosters = api.get("/league/1/rosters").mock(
+            side_effect=[
+                httpx.Response(200, json=[], headers={"ETag": '"v1"'}),
+                httpx.Response(304, headers={"ETag": '"v1"'}),
+            ]
+        )
+        matchups = api.get("/league/1/matchups/1").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        
+        # Rosters cached before the league is known to be archived are
+        # revalidated and then pinned too
+        await sleeper_client.get_league_rosters("1")
+        await sleeper_client.get_league("1")
+        await sleeper_client.get_league("2")
+        await sleeper_client.get_json("/league/1/matchups/1")
+        await asyncio.gather(*sleeper_client._pin_tasks)
+        
+        await sleeper_client.cache.drain()
+        sleeper_client.cache.memory.clear()
+        await sleeper_client.get_league_rosters("1")
+        await sleeper_client.get_json("/league/1/matchups/1")
+        await sleeper_client.refresh("/league/1")
+        
+        request = httpx.Request("GET", f"{base_url}/league/1/rosters")
+        cached_response, is_fresh = await sleeper_client.cache.get(request)
+        assert is_fresh and cached_response.entry.metadata.pinned
+            
+    # The league response that showed it archived is pinned without refetching
+    assert league_route.call_count == 1
+    assert rosters.call_count == 2
+    assert rosters.calls[1].request.headers["If-None-Match"] == '"v1"'
+    assert matchups.call_count == 1
+    stats = sleeper_client.get_cache_stats()
+    assert stats["pinned_entry_count"] == 3
+    assert sleeper_client._is_archived_path("/league/1/drafts")
+    assert not sleeper_client._is_archived_path("/league/2")
+
+
+@pytest.mark.asyncio
+async def test_leagues_archived_via_user_leagues_are_pinned(sleeper_client, base_url):
+    """Test that leagues found archived in a user's list get their entries pinned."""
+    league = {
+        "league_id": "1",
+        "name": "Old League",
+        "season": "2022",
+        "status": "complete",
+        "sport": "nfl",
+        "settings": {"draft_type": "snake", "num_teams": 12},
+        "total_rosters": 12,
+    }
+    
+    with respx.mock(base_url=base_url) as api:
+        rosters = api.get("/league/1/rosters").mock(
+            return_value=httpx.Response(200, json=[])
+        )
+        api.get("/user/123/leagues/nfl/2022").mock(
+            return_value=httpx.Response(200, json=[league])
+        )
+        await sleeper_client.get_league_rosters("1")
+        await sleeper_client.get_user_leagues("123", "2022")
+        await asyncio.gather(*sleeper_client._pin_tasks)
+    
+    request = httpx.Request("GET", f"{base_url}/league/1/rosters")
+    cached_response, is_fresh = await sleeper_client.cache.get(request)
+    assert is_fresh and cached_response.entry.metadata.pinned
+    assert rosters.call_count == 2
+    assert sleeper_client.get_cache_stats()["pinned_entry_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_archived_league_pin_skips_failed_revalidation(sleeper_client, base_url):
+    """Test that entries which cannot be revalidated are left unpinned."""
+    league = {
+        "league_id": "1",
+        "name": "Old League",
+        "season": "2022",
+        "status": "complete",
+        "sport": "nfl",
+        "settings": {"draft_type": "snake", "num_teams": 12},
+        "total_rosters": 12,
+    }
+    
+    with respx.mock(base_url=base_url) as api:
+        api.get("/league/1/rosters").mock(
+            side_effect=[httpx.Response(200, json=[]), httpx.Response(503)]
+        )
+        api.get("/user/123/leagues/nfl/2022").mock(
+            return_value=httpx.Response(200, json=[league])
+        )
+        await sleeper_client.get_league_rosters("1")
+        await sleeper_client.get_user_leagues("123", "2022")
+        await asyncio.gather(*sleeper_client._pin_tasks)
+    
+    request = httpx.Request("GET", f"{base_url}/league/1/rosters")
+    cached_response, _ = await sleeper_client.cache.get(request)
+    assert not cached_response.entry.metadata.pinned
+    assert sleeper_client.get_cache_stats()["pinned_entry_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_not_found_is_cached(sleeper_client, base_url):
+    """Test that unknown identifiers are answered locally after the first lookup."""
+    with respx.mock(base_url=base_url) as api:
+        missing = api.get("/user/missing").mock(return_value=httpx.Response(404))
+        unknown = api.get("/user/unknown").mock(
+            return_value=httpx.Response(200, content=b"null")
+        )
+        
+        for identifier in ("missing", "unknown"):
+            for _ in range(3):
+                with pytest.raises(HTTPException) as exc_info:
+                    await sleeper_client.get_user(identifier)
+                assert exc_info.value.status_code == 404
+                
+        assert await sleeper_client.get_json("/user/unknown") is None
+        
+    assert missing.call_count == 1
+    assert unknown.call_count == 1
+    stats = sleeper_client.get_cache_stats()
+    assert stats["negative_store_count"] == 2
+    assert stats["negative_hit_count"] == 5